@@ -0,0 +1,214 @@
+"""Change journal for incremental ``inventory`` runs.
+
+A full inventory parses the frontmatter and hashes every skill unit in
+every home repo. On a workstation with dozens of registered repos almost
+none of them changed since the last run, so ``inventory --incremental``
+records a per-home-repo fingerprint together with the entries that repo
+produced, and reuses those entries verbatim when the fingerprint matches.
+
+A fingerprint is a sha256 over, per home repo:
+
+  - the discovery context: repo name, root, default scope and the
+    project id used for the ``domain`` field;
+  - the candidate skill dirs that exist (``agent-io/skills/`` and the
+    legacy dirs), and for every entry below them the relative path,
+    type, size and ``mtime_ns`` (plain ``stat`` calls — no file reads).
+    Directory mtimes catch adds/removes/renames; file mtimes and sizes
+    catch in-place edits, which do not touch the parent dir's mtime;
+  - the git state, where the repo has one: the ``HEAD`` ref and the
+    commit it points at, and the size/mtime of ``.git/index`` (read
+    straight from ``.git/``, no subprocess).
+
+Journal file (machine-local, alongside the hash cache):
+
+    $CLAUDE_SKILLS_CACHE_DIR/inventory_journal.json
+
+    {"version": 1,
+     "repos": {<repo_name>: {"fingerprint": str,
+                             "legacy_dirs": [[source_kind, path], ...],
+                             "entries": [[skill_key, entry], ...]}}}
+
+A corrupt or missing journal just means a full scan. Only
+``inventory --apply`` records runs, so every journaled ``manifest_hash``
+had its unit put in the object store; ``--apply`` also refuses to reuse
+a repo whose units have since gone missing from the store.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable
+
+from claude_skills.hash_cache import cache_dir
+
+_JOURNAL_FILENAME = "inventory_journal.json"
+_JOURNAL_VERSION = 1
+
+
+def journal_path() -> Path:
+    """Return the path of the inventory change journal."""
+    return cache_dir() / _JOURNAL_FILENAME
+
+
+def _walk_stats(root: Path, h) -> None:
+    """Feed (relpath, type, size, mtime_ns) for everything under root into h."""
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            h.update(f"!{current}\n".encode("utf-8"))
+            continue
+        for entry in entries:
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            rel = os.path.relpath(entry.path, root)
+            kind = "d" if entry.is_dir(follow_symlinks=False) else "f"
+            h.update(f"{kind} {rel} {st.st_size} {st.st_mtime_ns}\n".encode("utf-8"))
+            if kind == "d":
+                stack.append(Path(entry.path))
+
+
+def _git_state(repo_root: Path) -> str:
+    """Return a cheap description of HEAD + index state, or "" if not a repo."""
+    git_dir = repo_root / ".git"
+    try:
+        if git_dir.is_file():
+            # Worktree / submodule: ".git" is a "gitdir: <path>" pointer.
+            text = git_dir.read_text(encoding="utf-8").strip()
+            if not text.startswith("gitdir:"):
+                return ""
+            git_dir = (repo_root / text.split(":", 1)[1].strip()).resolve()
+        if not git_dir.is_dir():
+            return ""
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return ""
+
+    parts = [head]
+    if head.startswith("ref: "):
+        ref = head[5:].strip()
+        try:
+            parts.append((git_dir / ref).read_text(encoding="utf-8").strip())
+        except (OSError, UnicodeDecodeError):
+            # Packed ref: fold in the packed-refs stat instead of parsing it.
+            try:
+                st = (git_dir / "packed-refs").stat()
+                parts.append(f"packed {st.st_size} {st.st_mtime_ns}")
+            except OSError:
+                parts.append("unborn")
+    try:
+        st = (git_dir / "index").stat()
+        parts.append(f"index {st.st_size} {st.st_mtime_ns}")
+    except OSError:
+        parts.append("no-index")
+    return "|".join(parts)
+
+
+def repo_fingerprint(
+    repo_name: str,
+    repo_root: Path,
+    skill_dirs: list[tuple[Path, str]],
+    context: tuple,
+) -> str:
+    """Fingerprint one home repo's skill dirs without reading any file.
+
+    ``skill_dirs`` is the ``_candidate_skill_dirs`` result for the repo;
+    ``context`` carries anything else that shapes the discovered entries
+    (default scope, domain project id).
+    """
+    h = hashlib.sha256()
+    h.update(f"{repo_name}\n{repo_root}\n{context!r}\n".encode("utf-8"))
+    for skills_dir, source_kind in skill_dirs:
+        h.update(f"dir {source_kind} {skills_dir}\n".encode("utf-8"))
+        _walk_stats(skills_dir, h)
+    h.update(f"git {_git_state(repo_root)}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+class ChangeJournal:
+    """Per-repo fingerprints + discovered entries from the previous run."""
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or journal_path()
+        self._repos: dict[str, dict] = {}
+        self._next: dict[str, dict] = {}
+        self.reused: list[str] = []
+        self.rescanned: list[str] = []
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict) and data.get("version") == _JOURNAL_VERSION:
+                self._repos = data.get("repos") or {}
+        except (OSError, ValueError):
+            self._repos = {}
+
+    def reuse(
+        self,
+        repo_name: str,
+        fingerprint: str,
+        valid: Callable[[dict], bool] | None = None,
+    ) -> dict | None:
+        """Return the recorded ``{legacy_dirs, entries}`` if still current.
+
+        ``valid`` may veto a matching record, which then counts as
+        rescanned.
+        """
+        rec = self._repos.get(repo_name)
+        if (
+            not rec
+            or rec.get("fingerprint") != fingerprint
+            or (valid is not None and not valid(rec))
+        ):
+            self.rescanned.append(repo_name)
+            return None
+        self.reused.append(repo_name)
+        self._next[repo_name] = rec
+        return rec
+
+    def record(
+        self,
+        repo_name: str,
+        fingerprint: str,
+        legacy_dirs: list[tuple[str, str]],
+        entries: list[tuple[str, dict]],
+    ) -> None:
+        """Stage a freshly scanned repo's result for the next run.
+
+        ``entries`` are serialized immediately, so later in-place edits by
+        the caller (conflict flags, merged deploy state) don't leak in.
+        """
+        self._next[repo_name] = json.loads(json.dumps({
+            "fingerprint": fingerprint,
+            "legacy_dirs": [list(d) for d in legacy_dirs],
+            "entries": [[k, e] for k, e in entries],
+        }, default=str))
+
+    def save(self) -> None:
+        """Atomically write the journal (only repos seen this run). Never raises."""
+        payload = {"version": _JOURNAL_VERSION, "repos": self._next}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=str(self.path.parent),
+                prefix=self.path.name + ".",
+                suffix=".tmp",
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(payload, f, separators=(",", ":"))
+                os.replace(tmp_path, self.path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+        except OSError:
+            return
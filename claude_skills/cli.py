@@ -6,8 +6,6 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
-from claude_skills.systems import load_systems
-
 
 # Cowork-inbox root used for cross-machine sync dispatch. The convention is
 # documented in AIAssistant/cowork-inbox/README.md.
@@ -78,9 +76,14 @@ def cmd_list(args):
 def cmd_inventory(args):
     """Show skill inventory, optionally apply changes."""
     from claude_skills.inventory import inventory
+    from claude_skills.yaml_loader import loader_name
 
     apply = args.apply
-    result = inventory(apply=apply)
+    result = inventory(
+        apply=apply,
+        jobs=getattr(args, "jobs", 1),
+        incremental=bool(getattr(args, "incremental", False)),
+    )
 
     proposed = result["proposed_skills"]
     conflicts = result["conflicts"]
@@ -103,6 +106,13 @@ def cmd_inventory(args):
     print(f"  Conflicts:        {len(conflicts)}  (real forks — different content in different homes)")
     print(f"  Deployment dups:  {len(deploy_dups)}  (same content in multiple homes — collapsed to most-specific)")
     print(f"  Scope drifts:     {len(scope_drifts)}")
+    print(f"  YAML loader:      {loader_name()}")
+    incr = result.get("incremental")
+    if incr is not None:
+        print(
+            f"  Incremental:      {len(incr['reused'])} repo(s) reused, "
+            f"{len(incr['rescanned'])} rescanned"
+        )
 
     # Detailed listings
     if new_skills:
@@ -172,6 +182,7 @@ def cmd_status(args):
     """Show deployment status."""
     from pathlib import Path
     from claude_skills.registry import load_registry
+    from claude_skills.systems import load_systems
 
     registry = load_registry()
     skills = registry.get("skills", {})
@@ -269,6 +280,8 @@ def _write_cowork_sync_task(
     apply: bool,
     init_claude_md: bool,
     source_system: str,
+    skill: str | None = None,
+    systems: dict | None = None,
 ) -> Path:
     """Write a cowork-inbox markdown task that asks <target> to run sync.
 
@@ -276,7 +289,10 @@ def _write_cowork_sync_task(
     keyed by the target's machines.json alias (which can differ from its
     systems.yaml key — e.g. ``email-mac`` -> ``emailmac``).
     """
-    systems = load_systems()
+    from claude_skills.systems import load_systems
+
+    if systems is None:
+        systems = load_systems()
     target_info = systems.get(target_system, {}) or {}
     target_alias = target_info.get("machine_alias", target_system)
 
@@ -294,6 +310,8 @@ def _write_cowork_sync_task(
         flags.append("--apply")
     if init_claude_md:
         flags.append("--init-claude-md")
+    if skill:
+        flags.append(f"--skill {skill}")
     cmdline = "claude-skills sync " + target_system
     if flags:
         cmdline += " " + " ".join(flags)
@@ -332,8 +350,21 @@ def cmd_sync(args):
     """
     from claude_skills.local_machine import detect_local_system
     from claude_skills.sync import sync
+    from claude_skills.systems import load_systems
 
-    target = args.system
+    targets = list(args.system or [])
+    if getattr(args, "all", False):
+        if targets:
+            print("error: pass system names or --all, not both.", file=sys.stderr)
+            return 1
+        targets = list(load_systems().keys())
+    if not targets:
+        print("error: pass a system name (or several, or --all).", file=sys.stderr)
+        return 1
+    if len(targets) > 1 or getattr(args, "all", False):
+        return _sync_batch(targets, args)
+
+    target = targets[0]
     local_only = bool(getattr(args, "local_only", False))
 
     if not local_only:
@@ -352,6 +383,7 @@ def cmd_sync(args):
                     apply=bool(getattr(args, "apply", False)),
                     init_claude_md=bool(getattr(args, "init_claude_md", False)),
                     source_system=local,
+                    skill=getattr(args, "skill", None),
                 )
             except OSError as exc:
                 print(f"error: failed to write cowork inbox task: {exc}", file=sys.stderr)
@@ -367,6 +399,8 @@ def cmd_sync(args):
             target,
             apply=bool(getattr(args, "apply", False)),
             init_claude_md=bool(getattr(args, "init_claude_md", False)),
+            skill=getattr(args, "skill", None),
+            diff=False,
         )
     except ValueError as exc:
         print(f"error: {exc}", file=sys.stderr)
@@ -378,6 +412,95 @@ def cmd_sync(args):
     return _print_plan(plan, show_diff=False)
 
 
+def _sync_batch(targets: list[str], args) -> int:
+    """``sync <a> <b> ...`` / ``sync --all``: one process, shared state.
+
+    Systems other than this machine are queued through the cowork inbox
+    as with a single ``sync``; the local one(s) run via ``sync_many``.
+    """
+    from claude_skills.local_machine import detect_local_system
+    from claude_skills.sync import sync_many
+    from claude_skills.systems import load_systems
+
+    apply = bool(getattr(args, "apply", False))
+    init_claude_md = bool(getattr(args, "init_claude_md", False))
+    if getattr(args, "skill", None):
+        print("error: --skill applies to a single system only.", file=sys.stderr)
+        return 1
+
+    systems = load_systems()
+    unknown = [t for t in targets if t not in systems]
+    if unknown:
+        print(f"error: unknown system(s): {', '.join(unknown)}", file=sys.stderr)
+        return 1
+
+    if getattr(args, "local_only", False):
+        local_targets = targets
+    else:
+        local = detect_local_system()
+        if local is None:
+            print(
+                "error: could not determine local machine; pass --local-only "
+                "to bypass cross-machine dispatch.",
+                file=sys.stderr,
+            )
+            return 1
+        local_targets = [t for t in targets if t == local]
+        for target in targets:
+            if target == local:
+                continue
+            try:
+                inbox_path = _write_cowork_sync_task(
+                    target,
+                    apply=apply,
+                    init_claude_md=init_claude_md,
+                    source_system=local,
+                    systems=systems,
+                )
+            except OSError as exc:
+                print(f"error: failed to write cowork inbox task for {target}: {exc}",
+                      file=sys.stderr)
+                return 1
+            print(f"Sync task queued for {target} at {inbox_path}.")
+        if len(local_targets) < len(targets):
+            print()
+
+    if not local_targets:
+        return 0
+
+    result = sync_many(local_targets, apply=apply, init_claude_md=init_claude_md)
+    rc = 0
+    for name in local_targets:
+        plan = result["systems"].get(name)
+        if plan is None:
+            continue
+        rc = max(rc, _print_plan(plan, show_diff=False))
+        print()
+
+    runtime = result["runtime_repos"]
+    touched = {
+        name: stats for name, stats in runtime.items()
+        if stats.get("add") or stats.get("update") or stats.get("remove")
+    }
+    print(
+        f"=== runtime mirrors ({len(runtime)} repo(s), {len(touched)} changed; "
+        f"{result['target_walks']} target dir walk(s)) ==="
+    )
+    for name in sorted(touched):
+        stats = touched[name]
+        print(
+            f"    {name}: add={len(stats.get('add') or [])} "
+            f"update={len(stats.get('update') or [])} "
+            f"remove={len(stats.get('remove') or [])}"
+        )
+    if result["errors"]:
+        print("\n  Errors:")
+        for e in result["errors"]:
+            print(f"    ! {e}")
+        rc = max(rc, 3)
+    return rc
+
+
 def cmd_sync_repos(args):
     """Sync skills into target repos' .claude/commands/ (no commit by default)."""
     from claude_skills.repo_sync import render_repo_plan, sync_repos
@@ -389,6 +512,9 @@ def cmd_sync_repos(args):
             skill=getattr(args, "skill", None),
             force=bool(getattr(args, "force", False)),
             commit=bool(getattr(args, "commit", False)),
+            strategy=getattr(args, "deploy_strategy", None) or "copy",
+            jobs=getattr(args, "jobs", 1),
+            untracked=not getattr(args, "ignore_untracked", False),
         )
     except ValueError as exc:
         print(f"error: {exc}", file=sys.stderr)
@@ -409,12 +535,52 @@ def cmd_migrate_domain_skills(args):
     return render_migrate_plan(plan)
 
 
+def cmd_watch(args):
+    """Watch skill sources and push edited units to this machine's targets."""
+    from claude_skills.local_machine import detect_local_system
+    from claude_skills.watch import watch
+
+    system = args.system or detect_local_system()
+    if system is None:
+        print(
+            "error: could not determine local machine; pass --system.",
+            file=sys.stderr,
+        )
+        return 1
+    try:
+        return watch(
+            system,
+            backend="poll" if args.poll else "auto",
+            debounce=args.debounce,
+            poll_interval=args.interval,
+            apply=not args.dry_run,
+        )
+    except OSError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+
+
+def cmd_rollback(args):
+    """Restore a system's skills to a prior deployment from the log."""
+    from claude_skills.rollback import render_rollback_plan, rollback
+
+    try:
+        plan = rollback(args.system, args.to, apply=bool(args.apply))
+    except ValueError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    except PermissionError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+    return render_rollback_plan(plan)
+
+
 def cmd_diff(args):
     """Show diff between local and deployed skills for a system."""
     from claude_skills.sync import sync
 
     try:
-        plan = sync(args.system, apply=False)
+        plan = sync(args.system, apply=False, diff=False)
     except ValueError as exc:
         print(f"error: {exc}", file=sys.stderr)
         return 1
@@ -422,11 +588,70 @@ def cmd_diff(args):
         print(f"error: {exc}", file=sys.stderr)
         return 2
 
-    return _print_plan(plan, show_diff=True)
+    return _print_plan(
+        plan,
+        show_diff=True,
+        stat=bool(getattr(args, "stat", False)),
+        max_bytes=getattr(args, "max_bytes", None),
+    )
+
+
+def _print_plan_diffs(plan: dict, *, stat: bool, max_bytes: int | None) -> None:
+    """Stream per-file diffs (or ``--stat`` lines) for a plan's writes.
 
+    Files are read and diffed one at a time as they are printed; files
+    of updated skills whose sha256 matches the deployed copy are skipped
+    without being diffed. Once ``max_bytes`` of diff output has been
+    written the rest is skipped without being read.
+    """
+    from claude_skills.diffstream import DEFAULT_BUDGET_BYTES, DiffBudget, iter_plan_diffs
+
+    budget = DiffBudget(DEFAULT_BUDGET_BYTES if max_bytes is None else max_bytes)
+    out = sys.stdout
+    files = added_total = removed_total = 0
+    unchanged: list[str] = []
+    print("\n  --- diff ---" if not stat else "\n  --- diff --stat ---")
+    for fd in iter_plan_diffs(plan, unchanged):
+        if stat:
+            added, removed, binary = fd.stat()
+            if not (added or removed or binary):
+                continue
+            files += 1
+            added_total += added
+            removed_total += removed
+            change = "binary/large" if binary else f"+{added} -{removed}"
+            out.write(f"    {fd.label:<50} {change}\n")
+            continue
+        for line in fd.lines():
+            if not budget.take(line):
+                break
+            out.write(f"    {line}")
+        if budget.exhausted:
+            limit = budget.max_bytes
+            out.write(
+                f"    ... diff output truncated at {limit} bytes "
+                "(use --stat, or --max-bytes 0 for no limit)\n"
+            )
+            break
+    if stat:
+        print(f"    {files} file(s) changed, +{added_total} -{removed_total}")
+    if unchanged:
+        print(f"    ({len(unchanged)} file(s) in updated skills unchanged by hash; skipped)")
+    print("  --- end diff ---")
 
-def _print_plan(plan: dict, show_diff: bool) -> int:
-    """Render a sync/diff plan dict to stdout. Returns exit code."""
+
+def _print_plan(
+    plan: dict,
+    show_diff: bool,
+    *,
+    stat: bool = False,
+    max_bytes: int | None = None,
+) -> int:
+    """Render a sync/diff plan dict to stdout. Returns exit code.
+
+    With ``show_diff`` the CLAUDE.md and skill-unit diffs are streamed
+    after the skill lists (see ``_print_plan_diffs``).
+    """
     sys_name = plan["system"]
     mode = plan["mode"]
     claude_md = plan["claude_md"]
@@ -434,17 +659,15 @@ def _print_plan(plan: dict, show_diff: bool) -> int:
     errors = plan.get("errors") or []
 
     print(f"=== sync plan: {sys_name} (mode={mode}) ===\n")
+    strategy = plan.get("deploy_strategy", "copy")
+    if strategy != "copy":
+        print(f"  Deploy strategy: {strategy}\n")
 
     # CLAUDE.md section
     print(f"  CLAUDE.md: action={claude_md['action']}")
     print(f"    tier1_hash={claude_md['tier1_hash']}")
     print(f"    tier2_hash={claude_md['tier2_hash']}")
     print(f"    {claude_md['diff_summary']}")
-    if show_diff and claude_md.get("diff"):
-        print("\n  --- CLAUDE.md diff ---")
-        for line in claude_md["diff"].splitlines():
-            print(f"    {line}")
-        print("  --- end diff ---\n")
 
     # Skills counts + lists
     print(
@@ -466,6 +689,9 @@ def _print_plan(plan: dict, show_diff: bool) -> int:
         for k in skills["remove"]:
             print(f"        {k}")
 
+    if show_diff:
+        _print_plan_diffs(plan, stat=stat, max_bytes=max_bytes)
+
     if errors:
         print("\n  Errors:")
         for e in errors:
@@ -488,21 +714,9 @@ _SCOPE_FROM_HOME = {
 
 def _load_project_registry() -> dict:
     """Load AIAssistant project_registry.yaml -> dict[project_id, info]."""
-    import yaml as _yaml
+    from claude_skills.projects import load_project_registry
 
-    path = (
-        Path.home()
-        / "Dropbox"
-        / "Projects"
-        / "AIAssistant"
-        / "state"
-        / "project_registry.yaml"
-    )
-    if not path.exists():
-        return {}
-    with open(path) as f:
-        data = _yaml.safe_load(f) or {}
-    return data.get("projects", {})
+    return load_project_registry().projects
 
 
 def _resolve_home_repo(home_repo: str) -> tuple[Path, str]:
@@ -551,7 +765,7 @@ def cmd_register(args):
     file at <home_repo>/<relative_path>, parses frontmatter, and writes a
     new entry to the registry.
     """
-    from claude_skills.frontmatter import extract_first_heading, parse_frontmatter
+    from claude_skills.frontmatter_cache import read_frontmatter_cached
     from claude_skills.manifest import compute_manifest_hash
     from claude_skills.registry import load_registry, save_registry
 
@@ -567,7 +781,8 @@ def cmd_register(args):
         return 1
 
     # Parse frontmatter
-    fm, body = parse_frontmatter(skill_path)
+    header = read_frontmatter_cached(skill_path)
+    fm = header.fm
     skill_name_field = fm.get("name") or skill_path.stem
     skill_key = args.name or skill_path.stem
 
@@ -585,8 +800,8 @@ def cmd_register(args):
         else:
             scope = _SCOPE_FROM_HOME.get(args.home_repo, "domain")
 
-    description = fm.get("description") or extract_first_heading(body) or ""
-    manifest_hash = compute_manifest_hash(skill_path)
+    description = fm.get("description") or header.first_heading() or ""
+    manifest_hash = compute_manifest_hash(skill_path, store=not args.dry_run)
 
     domain = None
     if scope == "domain":
@@ -875,7 +1090,7 @@ def cmd_rename(args):
 
         # Update home_path + recompute hash.
         entry["home_path"] = str(new_home_path)
-        entry["manifest_hash"] = compute_manifest_hash(new_home_path)
+        entry["manifest_hash"] = compute_manifest_hash(new_home_path, store=True)
 
     entry["name"] = new
     skills[new] = entry
@@ -889,6 +1104,8 @@ def cmd_rename(args):
 
 def cmd_system_list(args):
     """List known systems."""
+    from claude_skills.systems import load_systems
+
     systems = load_systems()
     for name, info in systems.items():
         mode = info.get("mode", "unknown")
@@ -899,6 +1116,7 @@ def cmd_system_list(args):
 def cmd_system_render(args):
     """Render the CLAUDE.md for a system."""
     from claude_skills.claude_md import get_tier1, get_tier2, render_managed
+    from claude_skills.systems import load_systems
 
     systems = load_systems()
     if args.name not in systems:
@@ -925,6 +1143,299 @@ def cmd_system_render(args):
     return 0
 
 
+def cmd_store_stats(args):
+    """Show object store location and size."""
+    from claude_skills.object_store import store_stats
+
+    stats = store_stats()
+    if stats["root"] is None:
+        print("Object store disabled (CLAUDE_SKILLS_OBJECT_STORE=off).")
+        return 0
+    print(f"  Object store: {stats['root']}")
+    print(f"  Units: {stats['units']}")
+    print(f"  Blobs: {stats['blobs']} ({stats['blob_bytes']} bytes)")
+    return 0
+
+
+def cmd_store_verify(args):
+    """Hash deployed skills on a system against their stored manifests."""
+    from claude_skills.object_store import verify_unit
+    from claude_skills.registry import load_registry
+    from claude_skills.sync import _expand
+    from claude_skills.systems import load_systems
+
+    systems = load_systems()
+    if args.system not in systems:
+        print(f"error: unknown system '{args.system}'", file=sys.stderr)
+        return 1
+    commands_target = _expand(
+        systems[args.system].get("commands_target", "~/.claude/commands/")
+    )
+    skills = load_registry().get("skills", {}) or {}
+
+    ok = bad = unknown = 0
+    for key in sorted(skills):
+        deployed = (skills[key].get("last_deploy") or {}).get(args.system)
+        if not deployed:
+            continue
+        problems = verify_unit(deployed.get("hash", ""), commands_target)
+        if problems is None:
+            unknown += 1
+            print(f"  ? {key}: manifest {deployed.get('hash', '')[:8]} not in store")
+        elif problems:
+            bad += 1
+            print(f"  ! {key}: {'; '.join(problems)}")
+        else:
+            ok += 1
+    print(f"\n  {args.system}: {ok} verified, {bad} drifted, {unknown} not in store")
+    return 1 if bad else 0
+
+
+def cmd_store_gc(args):
+    """Drop stored units no longer referenced by the registry or deploy log."""
+    from claude_skills import deploy_log
+    from claude_skills.object_store import gc
+    from claude_skills.registry import load_registry
+
+    referenced: set[str] = set()
+    for entry in (load_registry().get("skills", {}) or {}).values():
+        referenced.add(entry.get("manifest_hash", ""))
+        for deploys in ("last_deploy", "last_repo_deploy", "last_runtime_deploy"):
+            for info in (entry.get(deploys) or {}).values():
+                if isinstance(info, dict):
+                    referenced.add(info.get("hash", ""))
+    # Every hash ever deployed stays restorable.
+    for record in deploy_log.query():
+        referenced.update((record.get("hash_at_deploy") or {}).values())
+    referenced.discard("")
+
+    result = gc(referenced, apply=args.apply)
+    verb = "Removed" if args.apply else "Would remove"
+    print(
+        f"  {verb} {len(result['units'])} unit(s), {len(result['blobs'])} blob(s) "
+        f"({result['bytes']} bytes)."
+    )
+    if not args.apply and (result["units"] or result["blobs"]):
+        print("  (dry run — pass --apply to delete)")
+    return 0
+
+
+def cmd_log_query(args):
+    """Print deployment log records matching --system / --skill / --since."""
+    import json
+
+    from claude_skills import deploy_log
+
+    records = deploy_log.query(system=args.system, skill=args.skill, since=args.since)
+    if args.limit:
+        records = records[-args.limit:]
+    for record in records:
+        if args.json:
+            print(json.dumps(record, sort_keys=True))
+            continue
+        parts = [
+            f"+{','.join(record.get('added') or [])}" if record.get("added") else "",
+            f"~{','.join(record.get('updated') or [])}" if record.get("updated") else "",
+            f"-{','.join(record.get('removed') or [])}" if record.get("removed") else "",
+        ]
+        changes = " ".join(p for p in parts if p) or "(no skill changes)"
+        print(
+            f"  {record.get('ts', '?')}  {record.get('system', '?'):<16} "
+            f"{record.get('action', '?'):<9} {changes}"
+        )
+    if not args.json:
+        print(f"\n  {len(records)} record(s).")
+    return 0
+
+
+def cmd_log_compact(args):
+    """Gzip old sealed deployment log segments (dry run by default)."""
+    from claude_skills import deploy_log
+
+    result = deploy_log.compact(keep=args.keep, apply=args.apply)
+    if not result["segments"]:
+        print("  Nothing to compact.")
+        return 0
+    verb = "Compacted" if args.apply else "Would compact"
+    print(f"  {verb} {len(result['segments'])} segment(s): {', '.join(result['segments'])}")
+    if args.apply:
+        print(f"  {result['bytes_before']} -> {result['bytes_after']} bytes")
+    else:
+        print(f"  ({result['bytes_before']} bytes; dry run — pass --apply to compact)")
+    return 0
+
+
+def cmd_projects_resolve(args):
+    """Show each project's effective repo_path and any parent-chain problems."""
+    import json
+
+    from claude_skills.projects import load_project_registry
+
+    reg = load_project_registry()
+    wanted = args.project or list(reg.projects)
+    rows = []
+    for ident in wanted:
+        pid = ident if ident in reg.projects else reg.name_to_pid.get(ident)
+        if pid is None:
+            print(f"error: unknown project {ident!r}", file=sys.stderr)
+            return 1
+        repo_path, source = reg.resolve(pid)
+        rows.append({
+            "project": pid,
+            "name": (reg.projects.get(pid) or {}).get("name") or pid,
+            "repo_path": repo_path,
+            "source": source,
+        })
+
+    if args.json:
+        print(json.dumps(
+            {"projects": rows, "diagnostics": reg.diagnostics}, indent=2, sort_keys=True
+        ))
+        return 1 if reg.diagnostics else 0
+
+    print(f"=== project resolution ({reg.path}) ===\n")
+    for row in rows:
+        if row["repo_path"] is None:
+            where = "(unresolved)"
+        elif row["source"] == row["project"]:
+            where = row["repo_path"]
+        else:
+            where = f"{row['repo_path']}  (from {row['source']})"
+        print(f"  {row['project']:<28} {row['name']:<24} {where}")
+    resolved = sum(1 for r in rows if r["repo_path"])
+    print(f"\n  {resolved}/{len(rows)} resolved.")
+    if reg.diagnostics:
+        print("\n  Diagnostics:")
+        for d in reg.diagnostics:
+            print(f"    ! {d}")
+        return 1
+    return 0
+
+
+def cmd_registry_export(args):
+    """Write the active registry out as a human-readable JSON document."""
+    from claude_skills.registry import (
+        _DEFAULT_REGISTRY_PATH,
+        _registry_path,
+        load_registry,
+        save_registry,
+    )
+
+    source = _registry_path()
+    out = Path(args.out).expanduser() if args.out else _DEFAULT_REGISTRY_PATH
+    if out.suffix != ".json":
+        print(f"error: export target must be a .json file: {out}", file=sys.stderr)
+        return 1
+    if out.resolve() == source.resolve():
+        print(f"error: {source} is already the active registry", file=sys.stderr)
+        return 1
+    data = load_registry(source)
+    save_registry(data, out)
+    print(f"  Exported {len(data.get('skills') or {})} skill(s): {source} -> {out}")
+    return 0
+
+
+def cmd_registry_import(args):
+    """Replace the active registry with the contents of a JSON registry file."""
+    from claude_skills.registry import _registry_path, load_registry, save_registry
+
+    source = Path(args.source).expanduser()
+    if not source.is_file():
+        print(f"error: no such file: {source}", file=sys.stderr)
+        return 1
+    target = _registry_path()
+    data = load_registry(source)
+    current = load_registry(target)
+    new_keys = set(data.get("skills") or {})
+    old_keys = set(current.get("skills") or {})
+    print(
+        f"  {source} -> {target}: {len(new_keys)} skill(s) "
+        f"(+{len(new_keys - old_keys)} -{len(old_keys - new_keys)})"
+    )
+    if not args.apply:
+        print("  (dry run — pass --apply to import)")
+        return 0
+    save_registry(data, target)
+    print("  Imported.")
+    return 0
+
+
+def cmd_registry_checkpoint(args):
+    """Fold the registry write-ahead journal into the JSON registry."""
+    from claude_skills.registry import _registry_path, checkpoint_registry
+
+    folded = checkpoint_registry()
+    if folded:
+        print(f"  Checkpointed {folded} journal record(s) into {_registry_path()}")
+    else:
+        print("  No journal to checkpoint.")
+    return 0
+
+
+# Import-time budget reported by ``--profile-startup`` (target: ``list``).
+_STARTUP_BUDGET_MS = 50.0
+_PROFILE_MARKER = "claude-skills: profile start"
+
+
+def _profile_startup(argv: list[str]) -> int:
+    """Re-run ``claude-skills <argv>`` under ``python -X importtime``.
+
+    Prints the command's import cost per module (heaviest first) against
+    ``_STARTUP_BUDGET_MS``. Interpreter startup (``site``, encodings) is
+    excluded; the command's own output is discarded. Returns 1 when over
+    budget.
+    """
+    import os
+    import subprocess
+
+    code = (
+        "import sys\n"
+        f"sys.stderr.write({_PROFILE_MARKER!r} + '\\n')\n"
+        f"sys.argv = ['claude-skills', *{argv!r}]\n"
+        "from claude_skills.cli import main\n"
+        "sys.exit(main())\n"
+    )
+    env = dict(os.environ)
+    root = str(Path(__file__).resolve().parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+    ret = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=env,
+    )
+
+    rows: list[tuple[int, int, str]] = []
+    started = False
+    for line in ret.stderr.splitlines():
+        if line == _PROFILE_MARKER:
+            started = True
+            continue
+        if not started or not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # column header
+        rows.append((int(fields[0]), int(fields[1]), fields[2].strip()))
+
+    total_ms = sum(r[0] for r in rows) / 1000
+    verdict = "OK" if total_ms <= _STARTUP_BUDGET_MS else "OVER"
+    print(f"=== startup profile: claude-skills {' '.join(argv) or '(no command)'} ===\n")
+    print(
+        f"  imports: {total_ms:.1f}ms over {len(rows)} module(s) "
+        f"(budget {_STARTUP_BUDGET_MS:.0f}ms: {verdict}); command exit code {ret.returncode}\n"
+    )
+    print(f"  {'self':>8}  {'cumulative':>10}  module")
+    for self_us, cum_us, name in sorted(rows, key=lambda r: r[0], reverse=True)[:25]:
+        print(f"  {self_us / 1000:>6.1f}ms  {cum_us / 1000:>8.1f}ms  {name}")
+    if not started:
+        print("\n  (no import timings captured)")
+        for line in ret.stderr.splitlines()[-5:]:
+            print(f"    {line}")
+    return 0 if verdict == "OK" else 1
+
+
 _SYSTEMS_YAML = (
     Path(__file__).resolve().parent.parent / "state" / "systems.yaml"
 )
@@ -1076,6 +1587,12 @@ def build_parser():
         prog="claude-skills",
         description="Manage Claude Code skills, CLAUDE.md tiers, and system deployments.",
     )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Run the command under `python -X importtime` and report import "
+             f"time per module (budget: {_STARTUP_BUDGET_MS:.0f}ms for `list`).",
+    )
     sub = parser.add_subparsers(dest="command")
 
     # list
@@ -1088,14 +1605,37 @@ def build_parser():
     p_inv = sub.add_parser("inventory", help="Show skill inventory")
     p_inv.add_argument("--apply", action="store_true", help="Apply inventory changes")
     p_inv.add_argument("--dry-run", action="store_true", help="Dry run (default behavior)")
+    p_inv.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Parse and hash skill units with N worker threads "
+             "(default: 1 = serial; 0 = auto). Output is identical for any N.",
+    )
+    p_inv.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip home repos whose skill dirs and git state are unchanged "
+             "since the last incremental run (uses the local change journal).",
+    )
 
     # status
     p_status = sub.add_parser("status", help="Show deployment status")
     p_status.add_argument("--system", help="Filter to a specific system")
 
     # sync
-    p_sync = sub.add_parser("sync", help="Sync skills to a target system")
-    p_sync.add_argument("system", help="Target system name")
+    p_sync = sub.add_parser("sync", help="Sync skills to one or more target systems")
+    p_sync.add_argument(
+        "system",
+        nargs="*",
+        help="Target system name(s). Several names run in one process with shared state.",
+    )
+    p_sync.add_argument(
+        "--all",
+        action="store_true",
+        help="Sync every system in state/systems.yaml (non-local ones via the cowork inbox).",
+    )
     p_sync.add_argument("--apply", action="store_true", help="Apply changes (default: dry run)")
     p_sync.add_argument("--dry-run", action="store_true", help="Show what would change")
     p_sync.add_argument(
@@ -1109,6 +1649,10 @@ def build_parser():
         help="Bypass cross-machine cowork-inbox dispatch and run sync locally "
              "(useful for debugging or when running on the same machine).",
     )
+    p_sync.add_argument(
+        "--skill",
+        help="Restrict the sync to a single skill key (CLAUDE.md is left alone).",
+    )
 
     # sync-repos
     p_sync_repos = sub.add_parser(
@@ -1134,6 +1678,12 @@ def build_parser():
         action="store_true",
         help="Override the dirty-tree guard (only use after inspecting the repo).",
     )
+    p_sync_repos.add_argument(
+        "--ignore-untracked",
+        action="store_true",
+        help="Let the dirty-tree guard skip untracked files (much faster on "
+             "trees with untracked build output; they are never staged).",
+    )
     p_sync_repos.add_argument(
         "--commit",
         action="store_true",
@@ -1141,6 +1691,21 @@ def build_parser():
              "Default after the convention pivot is to leave files unstaged so "
              "the gitignored runtime artifacts are not committed.",
     )
+    p_sync_repos.add_argument(
+        "--deploy-strategy",
+        choices=["copy", "hardlink", "reflink", "symlink"],
+        default="copy",
+        help="How to place files in target repos (default: copy). Non-copy "
+             "strategies fall back to copy per file when unsupported.",
+    )
+    p_sync_repos.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Process up to N target repos concurrently "
+             "(default: 1 = serial; 0 = auto). Output is identical for any N.",
+    )
 
     # migrate-domain-skills
     p_migrate = sub.add_parser(
@@ -1162,9 +1727,70 @@ def build_parser():
         help="Restrict migration to a single skill key.",
     )
 
+    # watch
+    p_watch = sub.add_parser(
+        "watch",
+        help="Watch skill sources and sync edited units as they change",
+    )
+    p_watch.add_argument(
+        "--system",
+        help="System to sync into (default: the detected local system).",
+    )
+    p_watch.add_argument(
+        "--debounce",
+        type=float,
+        default=0.3,
+        metavar="SEC",
+        help="Quiet period that ends a burst of events (default: 0.3).",
+    )
+    p_watch.add_argument(
+        "--poll",
+        action="store_true",
+        help="Use the stat-polling backend even where inotify is available.",
+    )
+    p_watch.add_argument(
+        "--interval",
+        type=float,
+        default=0.5,
+        metavar="SEC",
+        help="Polling interval for the polling backend (default: 0.5).",
+    )
+    p_watch.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report hash changes without writing the registry or syncing.",
+    )
+
+    # rollback
+    p_rb = sub.add_parser(
+        "rollback",
+        help="Restore a system's skills to a prior deployment (dry run by default)",
+    )
+    p_rb.add_argument("system", help="Target system name")
+    p_rb.add_argument(
+        "--to",
+        required=True,
+        metavar="TS|INDEX",
+        help="ISO timestamp (latest deployment at or before it) or index into "
+             "this system's deployment log entries (-2 = the one before the latest).",
+    )
+    p_rb.add_argument("--apply", action="store_true", help="Actually restore files")
+
     # diff
     p_diff = sub.add_parser("diff", help="Diff local vs deployed skills")
     p_diff.add_argument("system", help="Target system name")
+    p_diff.add_argument(
+        "--stat",
+        action="store_true",
+        help="Print per-file added/removed line counts instead of hunks.",
+    )
+    p_diff.add_argument(
+        "--max-bytes",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Stop printing diff hunks after N bytes (default: 1 MiB; 0 = no limit).",
+    )
 
     # register
     p_reg = sub.add_parser("register", help="Register a skill")
@@ -1237,6 +1863,75 @@ def build_parser():
     p_sys_add.add_argument("--requires-role", help="Optional: only deploy if hardware roles include this.")
     p_sys_add.add_argument("--dry-run", action="store_true", help="Show what would change without writing")
 
+    # log (nested subcommands)
+    p_log = sub.add_parser("log", help="Deployment log commands")
+    log_sub = p_log.add_subparsers(dest="log_command")
+
+    p_log_query = log_sub.add_parser("query", help="Show matching deployment log records")
+    p_log_query.add_argument("--system", help="Only records for this system")
+    p_log_query.add_argument("--skill", help="Only records touching this skill key")
+    p_log_query.add_argument("--since", metavar="TS", help="Only records with ts >= TS (ISO 8601)")
+    p_log_query.add_argument("--limit", type=int, metavar="N", help="Only the last N matches")
+    p_log_query.add_argument("--json", action="store_true", help="Print raw JSON records")
+
+    p_log_compact = log_sub.add_parser(
+        "compact", help="Gzip old sealed log segments (dry run by default)"
+    )
+    p_log_compact.add_argument(
+        "--keep", type=int, default=2, metavar="N",
+        help="Leave the newest N sealed segments uncompressed (default: 2).",
+    )
+    p_log_compact.add_argument("--apply", action="store_true", help="Actually compact")
+
+    # projects (nested subcommands)
+    p_projects = sub.add_parser("projects", help="AIAssistant project registry commands")
+    projects_sub = p_projects.add_subparsers(dest="projects_command")
+
+    p_proj_resolve = projects_sub.add_parser(
+        "resolve", help="Show each project's effective repo_path (inherited via parent)"
+    )
+    p_proj_resolve.add_argument(
+        "project", nargs="*", help="Project ids or names (default: all)"
+    )
+    p_proj_resolve.add_argument("--json", action="store_true", help="Print JSON")
+
+    # registry (nested subcommands)
+    p_registry = sub.add_parser("registry", help="Registry storage commands")
+    registry_sub = p_registry.add_subparsers(dest="registry_command")
+
+    p_reg_export = registry_sub.add_parser(
+        "export", help="Write the active registry as JSON (e.g. from a SQLite registry)"
+    )
+    p_reg_export.add_argument(
+        "--out", help="Destination .json (default: state/skill_registry.json)"
+    )
+
+    p_reg_import = registry_sub.add_parser(
+        "import", help="Load a JSON registry into the active registry (dry run by default)"
+    )
+    p_reg_import.add_argument("source", help="JSON registry file to import")
+    p_reg_import.add_argument("--apply", action="store_true", help="Actually import")
+
+    registry_sub.add_parser(
+        "checkpoint", help="Fold the registry journal into the JSON registry"
+    )
+
+    # store (nested subcommands)
+    p_store = sub.add_parser("store", help="Content-addressed object store commands")
+    store_sub = p_store.add_subparsers(dest="store_command")
+
+    store_sub.add_parser("stats", help="Show object store size")
+
+    p_store_verify = store_sub.add_parser(
+        "verify", help="Verify deployed bytes on a system against the store"
+    )
+    p_store_verify.add_argument("system", help="Target system name")
+
+    p_store_gc = store_sub.add_parser(
+        "gc", help="Remove stored units no longer referenced (dry run by default)"
+    )
+    p_store_gc.add_argument("--apply", action="store_true", help="Actually delete")
+
     return parser
 
 
@@ -1247,6 +1942,8 @@ DISPATCH = {
     "sync": cmd_sync,
     "sync-repos": cmd_sync_repos,
     "migrate-domain-skills": cmd_migrate_domain_skills,
+    "watch": cmd_watch,
+    "rollback": cmd_rollback,
     "diff": cmd_diff,
     "register": cmd_register,
     "retire": cmd_retire,
@@ -1258,6 +1955,9 @@ def main():
     parser = build_parser()
     args = parser.parse_args()
 
+    if args.profile_startup:
+        return _profile_startup([a for a in sys.argv[1:] if a != "--profile-startup"])
+
     if args.command is None:
         parser.print_help()
         return 0
@@ -1278,6 +1978,47 @@ def main():
             return handler(args)
         return 1
 
+    if args.command == "log":
+        if getattr(args, "log_command", None) is None:
+            parser.parse_args(["log", "--help"])
+            return 0
+        log_dispatch = {
+            "query": cmd_log_query,
+            "compact": cmd_log_compact,
+        }
+        return log_dispatch[args.log_command](args)
+
+    if args.command == "projects":
+        if getattr(args, "projects_command", None) is None:
+            parser.parse_args(["projects", "--help"])
+            return 0
+        projects_dispatch = {
+            "resolve": cmd_projects_resolve,
+        }
+        return projects_dispatch[args.projects_command](args)
+
+    if args.command == "registry":
+        if getattr(args, "registry_command", None) is None:
+            parser.parse_args(["registry", "--help"])
+            return 0
+        registry_dispatch = {
+            "export": cmd_registry_export,
+            "import": cmd_registry_import,
+            "checkpoint": cmd_registry_checkpoint,
+        }
+        return registry_dispatch[args.registry_command](args)
+
+    if args.command == "store":
+        if getattr(args, "store_command", None) is None:
+            parser.parse_args(["store", "--help"])
+            return 0
+        store_dispatch = {
+            "stats": cmd_store_stats,
+            "verify": cmd_store_verify,
+            "gc": cmd_store_gc,
+        }
+        return store_dispatch[args.store_command](args)
+
     handler = DISPATCH.get(args.command)
     if handler:
         return handler(args)
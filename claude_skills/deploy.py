@@ -0,0 +1,147 @@
+"""File placement strategies for deploying skill units.
+
+``sync`` and ``sync-repos`` fan the same skill bytes out to the
+user-global ``commands_target`` and to every per-repo runtime dir. With
+plain copies that is N full copies on disk and N full writes per sync.
+A system can opt into a cheaper strategy in ``state/systems.yaml``::
+
+    deploy_strategy: copy | hardlink | reflink | symlink
+
+  copy      ``shutil.copy2`` (default; always works).
+  hardlink  ``os.link`` — zero bytes written, shares the inode with the
+            source. Editing the deployed file edits the source, so only
+            use it where runtime dirs are treated as read-only caches.
+  reflink   copy-on-write clone: ``FICLONE`` ioctl on Linux (btrfs, XFS,
+            bcachefs), ``clonefile(2)`` on macOS (APFS). Independent
+            file, shared extents until one side is written.
+  symlink   absolute symlink to the source.
+
+Every non-copy strategy falls back to ``copy`` per file when the
+filesystem refuses (cross-device link, no reflink support, no symlink
+permission), so a deploy never fails just because of the strategy.
+
+New files are created under a hidden temp name next to the destination
+and ``os.replace``'d into place. An existing destination that is a
+symlink or shares its inode with another file is unlinked first, so a
+copy can never write *through* a link into a source or a stored object.
+"""
+
+from __future__ import annotations
+
+import errno
+import os
+import shutil
+import sys
+from pathlib import Path
+
+STRATEGIES = ("copy", "hardlink", "reflink", "symlink")
+DEFAULT_STRATEGY = "copy"
+
+_FICLONE = 0x40049409  # _IOW(0x94, 9, int), linux/fs.h
+
+
+def validate_strategy(strategy: str | None) -> str:
+    """Return a known strategy name (None -> default) or raise ValueError."""
+    if strategy is None:
+        return DEFAULT_STRATEGY
+    if strategy not in STRATEGIES:
+        raise ValueError(
+            f"unknown deploy_strategy {strategy!r}; expected one of {', '.join(STRATEGIES)}"
+        )
+    return strategy
+
+
+def _tmp_sibling(dst: Path) -> Path:
+    # Leading dot keeps a leftover temp out of list_skill_units / manifests.
+    return dst.with_name(f".{dst.name}.{os.getpid()}.claude-skills-tmp")
+
+
+def _clone_file(src: Path, tmp: Path) -> None:
+    """Create ``tmp`` as a copy-on-write clone of ``src`` or raise OSError."""
+    if sys.platform == "darwin":
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if libc.clonefile(os.fsencode(str(src)), os.fsencode(str(tmp)), 0) != 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        return
+    if not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "reflink not supported on this platform")
+    import fcntl
+
+    with open(src, "rb") as fsrc, open(tmp, "wb") as fdst:
+        fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    shutil.copystat(src, tmp)
+
+
+def _already_placed(src: Path, dst: Path, strategy: str) -> bool:
+    try:
+        if strategy == "symlink":
+            return dst.is_symlink() and Path(os.readlink(dst)) == src
+        if strategy == "hardlink":
+            return not dst.is_symlink() and dst.exists() and os.path.samefile(src, dst)
+    except OSError:
+        return False
+    return False
+
+
+def is_same_entry(src: Path, dst: Path) -> bool:
+    """True if ``dst`` names ``src`` itself (or the file ``src`` links to).
+
+    Placing onto such a ``dst`` would unlink or overwrite the source.
+    Distinct names for one inode (a previous hardlink deploy) are *not*
+    the same entry: replacing that ``dst`` leaves ``src`` intact.
+    """
+    try:
+        dst_entry = os.path.join(os.path.realpath(dst.parent), dst.name)
+        src_entry = os.path.join(os.path.realpath(src.parent), src.name)
+        return dst_entry in (src_entry, os.path.realpath(src))
+    except OSError:
+        return False
+
+
+def place_file(src: Path, dst: Path, strategy: str = DEFAULT_STRATEGY) -> str:
+    """Materialize ``src`` at ``dst``; return the strategy actually used.
+
+    ``dst.parent`` must exist. Falls back to ``copy`` when the requested
+    strategy is refused by the filesystem. Raises ``shutil.SameFileError``
+    (an ``OSError``) when ``dst`` is ``src`` itself, before touching
+    either, as a plain ``shutil.copy2`` would.
+    """
+    if is_same_entry(src, dst):
+        raise shutil.SameFileError(f"{src} and {dst} are the same file")
+    if strategy == "symlink":
+        src = src.resolve()
+    if _already_placed(src, dst, strategy):
+        return strategy
+
+    if dst.is_symlink():
+        dst.unlink()
+    elif dst.exists():
+        st = dst.stat()
+        if st.st_nlink > 1 or not os.access(dst, os.W_OK):
+            # Shared inode (a previous hardlink deploy) or a read-only
+            # file (e.g. a copied store blob): replace rather than write
+            # into it, so the other name keeps its bytes.
+            dst.unlink()
+
+    if strategy != "copy":
+        tmp = _tmp_sibling(dst)
+        try:
+            if strategy == "hardlink":
+                os.link(src, tmp)
+            elif strategy == "symlink":
+                os.symlink(src, tmp)
+            else:
+                _clone_file(src, tmp)
+            os.replace(tmp, dst)
+            return strategy
+        except OSError:
+            if tmp.exists() or tmp.is_symlink():
+                tmp.unlink()
+            # Fall through to a plain copy.
+
+    shutil.copy2(src, dst)
+    return "copy"
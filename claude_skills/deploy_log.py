@@ -0,0 +1,319 @@
+"""Segmented, indexed deployment log.
+
+``state/deployment_log.jsonl`` used to be one ever-growing file that
+every history reader (``rollback``, ``store gc``) parsed from the top.
+It is now the *active segment* of a segmented log:
+
+    state/deployment_log.jsonl             active segment (appended to)
+    state/deployment_log.000001.jsonl      sealed segments, oldest first
+    state/deployment_log.000002.jsonl.gz   ... compacted (gzip) segments
+    state/deployment_log.idx.json          sidecar index (gitignored)
+
+Rotation: an append that would push the active segment past
+``CLAUDE_SKILLS_LOG_SEGMENT_BYTES`` (default 4 MiB) first renames it to
+the next sealed number. Records themselves are unchanged — one
+``json.dumps(entry, sort_keys=True)`` line each.
+
+Index: per segment, the byte offset, ``ts``, ``system`` and touched skill
+keys of every record, plus the segment's first/last ``ts``. It is caught
+up lazily by readers: only bytes appended since the last catch-up are
+read, a renamed segment keeps its index (matched by inode), and a
+segment that shrank or was replaced is re-indexed. Deleting the index is
+always safe. ``query`` filters on the index, skips whole segments by
+``ts`` range, and seeks straight to the matching records.
+
+Compaction (``compact``) gzips sealed segments other than the newest
+``keep``, re-serialized with compact separators. It is lossless: every
+record is re-parsed and compared before the original is replaced.
+
+The log path honors ``CLAUDE_SKILLS_DEPLOYMENT_LOG_PATH`` (used by tests);
+segments and index live next to it.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_DEFAULT_DEPLOYMENT_LOG = _REPO_ROOT / "state" / "deployment_log.jsonl"
+_DEPLOYMENT_LOG_ENV = "CLAUDE_SKILLS_DEPLOYMENT_LOG_PATH"
+_SEGMENT_BYTES_ENV = "CLAUDE_SKILLS_LOG_SEGMENT_BYTES"
+_DEFAULT_SEGMENT_BYTES = 4 * 1024 * 1024
+_INDEX_VERSION = 1
+
+
+def log_path() -> Path:
+    """Resolve the active log path, honoring the env override (used by tests)."""
+    override = os.environ.get(_DEPLOYMENT_LOG_ENV)
+    if override:
+        return Path(override)
+    return _DEFAULT_DEPLOYMENT_LOG
+
+
+def _segment_bytes() -> int:
+    try:
+        return int(os.environ.get(_SEGMENT_BYTES_ENV, "")) or _DEFAULT_SEGMENT_BYTES
+    except ValueError:
+        return _DEFAULT_SEGMENT_BYTES
+
+
+def _index_path(base: Path) -> Path:
+    return base.with_name(f"{base.stem}.idx.json")
+
+
+def _sealed_pattern(base: Path) -> re.Pattern:
+    return re.compile(
+        re.escape(base.stem) + r"\.(\d{6})" + re.escape(base.suffix) + r"(\.gz)?$"
+    )
+
+
+def segments(base: Path | None = None) -> list[Path]:
+    """Return every segment, oldest first; the active segment (if any) last."""
+    if base is None:
+        base = log_path()
+    pattern = _sealed_pattern(base)
+    sealed: list[tuple[int, Path]] = []
+    if base.parent.is_dir():
+        for path in base.parent.iterdir():
+            match = pattern.match(path.name)
+            if match:
+                sealed.append((int(match.group(1)), path))
+    out = [p for _n, p in sorted(sealed)]
+    if base.is_file():
+        out.append(base)
+    return out
+
+
+def _next_sealed_name(base: Path) -> Path:
+    pattern = _sealed_pattern(base)
+    numbers = [
+        int(m.group(1))
+        for m in (pattern.match(p.name) for p in segments(base))
+        if m
+    ]
+    return base.with_name(f"{base.stem}.{max(numbers, default=0) + 1:06d}{base.suffix}")
+
+
+def append(entry: dict, path: Path | None = None) -> None:
+    """Append one record to the active segment, rotating it first if full."""
+    if path is None:
+        path = log_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    line = json.dumps(entry, sort_keys=True) + "\n"
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
+        size = 0
+    if size and size + len(line) > _segment_bytes():
+        os.replace(path, _next_sealed_name(path))
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(line)
+
+
+def _open_segment(path: Path):
+    if path.suffix == ".gz":
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+def _touched_skills(record: dict) -> list[str]:
+    keys: set[str] = set()
+    for field in ("added", "updated", "removed"):
+        keys.update(record.get(field) or [])
+    if record.get("skill"):
+        keys.add(record["skill"])
+    for stats in (record.get("runtime_repos") or {}).values():
+        for field in ("add", "update", "remove"):
+            keys.update(stats.get(field) or [])
+    return sorted(keys)
+
+
+def _index_from(path: Path, start: int) -> tuple[list[list], int]:
+    """Index complete lines of ``path`` from byte ``start``; return (records, end)."""
+    records: list[list] = []
+    offset = start
+    with _open_segment(path) as f:
+        f.seek(start)
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                # Partial trailing line (append in progress): stop here.
+                break
+            try:
+                record = json.loads(raw)
+            except ValueError:
+                record = None
+            if isinstance(record, dict):
+                records.append([
+                    offset,
+                    str(record.get("ts", "")),
+                    record.get("system"),
+                    _touched_skills(record),
+                ])
+            offset += len(raw)
+    return records, offset
+
+
+class LogIndex:
+    """Sidecar index over all segments of one deployment log."""
+
+    def __init__(self, base: Path | None = None):
+        self.base = base or log_path()
+        self.path = _index_path(self.base)
+        self._segments: dict[str, dict] = {}
+        self._dirty = False
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict) and data.get("version") == _INDEX_VERSION:
+                self._segments = data.get("segments") or {}
+        except (OSError, ValueError):
+            self._segments = {}
+
+    def catch_up(self) -> list[tuple[Path, dict]]:
+        """Bring the index up to date; return ``[(segment, entry)]`` oldest first."""
+        old = self._segments
+        by_ino = {rec.get("ino"): rec for rec in old.values()}
+        current: dict[str, dict] = {}
+        out: list[tuple[Path, dict]] = []
+        for seg in segments(self.base):
+            st = seg.stat()
+            rec = old.get(seg.name)
+            if rec is None or rec.get("ino") != st.st_ino:
+                # New name: an already-indexed segment that was rotated
+                # (rename keeps the inode) or a brand-new one.
+                rec = by_ino.get(st.st_ino)
+                if rec is not None and rec.get("gz") != (seg.suffix == ".gz"):
+                    rec = None
+                self._dirty = True
+            if rec is None or st.st_size < rec.get("size", 0):
+                rec = {"ino": st.st_ino, "size": 0, "records": [], "gz": seg.suffix == ".gz"}
+                self._dirty = True
+            if seg.suffix == ".gz":
+                if rec["size"] != st.st_size:
+                    records, _end = _index_from(seg, 0)
+                    rec = {"ino": st.st_ino, "size": st.st_size, "records": records, "gz": True}
+                    self._dirty = True
+            elif st.st_size > rec["size"]:
+                records, end = _index_from(seg, rec["size"])
+                rec = dict(rec, size=end, records=rec["records"] + records)
+                self._dirty = True
+            if rec["records"]:
+                rec["first_ts"] = rec["records"][0][1]
+                rec["last_ts"] = rec["records"][-1][1]
+            current[seg.name] = rec
+            out.append((seg, rec))
+        if set(current) != set(old):
+            self._dirty = True
+        self._segments = current
+        return out
+
+    def save(self) -> None:
+        """Atomically write the index if it changed. Never raises."""
+        if not self._dirty:
+            return
+        payload = {"version": _INDEX_VERSION, "segments": self._segments}
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=str(self.path.parent), prefix=self.path.name + ".", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(payload, f, separators=(",", ":"))
+                os.replace(tmp_path, self.path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+        except OSError:
+            return
+        self._dirty = False
+
+
+def query(
+    system: str | None = None,
+    skill: str | None = None,
+    since: str | None = None,
+    base: Path | None = None,
+) -> list[dict]:
+    """Return matching log records, oldest first.
+
+    ``since`` is an ISO timestamp compared as a string against ``ts``
+    (records with ``ts >= since``). Filters are ANDed; None matches all.
+    """
+    index = LogIndex(base)
+    out: list[dict] = []
+    for seg, rec in index.catch_up():
+        if since is not None and rec.get("last_ts", "") < since:
+            continue
+        offsets = [
+            offset
+            for offset, ts, rec_system, skills in rec["records"]
+            if (system is None or rec_system == system)
+            and (skill is None or skill in skills)
+            and (since is None or ts >= since)
+        ]
+        if not offsets:
+            continue
+        with _open_segment(seg) as f:
+            for offset in offsets:
+                f.seek(offset)
+                out.append(json.loads(f.readline()))
+    index.save()
+    return out
+
+
+def compact(keep: int = 2, apply: bool = False, base: Path | None = None) -> dict:
+    """Gzip sealed segments older than the newest ``keep``. Lossless.
+
+    Returns ``{segments: [name], bytes_before, bytes_after}`` for what is
+    (or, without ``apply``, would be) compacted; ``bytes_after`` is only
+    known with ``apply``.
+    """
+    if base is None:
+        base = log_path()
+    sealed = [
+        p for p in segments(base)
+        if p != base and p.suffix != ".gz"
+    ]
+    candidates = sealed[: max(0, len(sealed) - keep)]
+    result = {
+        "segments": [p.name for p in candidates],
+        "bytes_before": sum(p.stat().st_size for p in candidates),
+        "bytes_after": 0,
+    }
+    if not apply:
+        return result
+    for seg in candidates:
+        with open(seg, "rb") as f:
+            records = [json.loads(line) for line in f if line.strip()]
+        payload = "".join(
+            json.dumps(r, sort_keys=True, separators=(",", ":")) + "\n" for r in records
+        ).encode("utf-8")
+        target = seg.with_name(seg.name + ".gz")
+        fd, tmp_path = tempfile.mkstemp(dir=str(seg.parent), prefix=".", suffix=".tmp")
+        os.close(fd)
+        try:
+            with gzip.open(tmp_path, "wb") as f:
+                f.write(payload)
+            with gzip.open(tmp_path, "rb") as f:
+                roundtrip = [json.loads(line) for line in f if line.strip()]
+            if roundtrip != records:
+                raise ValueError(f"compaction of {seg.name} is not lossless; left as is")
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, target)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        seg.unlink()
+        result["bytes_after"] += target.stat().st_size
+    # Re-index the compacted segments now rather than on the next query.
+    index = LogIndex(base)
+    index.catch_up()
+    index.save()
+    return result
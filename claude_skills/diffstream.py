@@ -0,0 +1,276 @@
+"""Streaming unified diffs for ``claude-skills diff``.
+
+``sync`` used to build the CLAUDE.md diff as one string, and ``diff``
+printed whole plans at once. With dozens of large skills that meant
+holding every diff in memory before anything was shown. This module
+produces diffs lazily instead:
+
+  - ``iter_plan_diffs(plan)`` yields one ``FileDiff`` per file that a
+    sync would write: CLAUDE.md, then every file of every ``add`` /
+    ``update`` skill unit (anchor plus sibling files), in plan order.
+    The new side is what sync would write: the stored unit's blobs
+    (``object_store``) when the unit is in the store, else the home
+    repo's files. Files whose sha256 matches the deployed copy are
+    skipped by hash, so only changed files are ever read, and a
+    deployed file is shown as deleted only if the last deployed unit
+    had it (sync never removes anything else). Nothing else is read
+    until a ``FileDiff`` is consumed.
+  - ``FileDiff.lines()`` yields unified-diff lines hunk by hunk
+    (``difflib.unified_diff`` is itself a generator); ``FileDiff.stat()``
+    counts added/removed lines without keeping them.
+  - ``DiffBudget`` caps the bytes a caller prints; once it runs out the
+    caller stops pulling, so later files are never read.
+
+Only one file pair is in memory at a time. Files over
+``MAX_TEXT_BYTES`` or with NUL bytes / invalid UTF-8 are reported as
+binary-or-large instead of being diffed line by line.
+"""
+
+from __future__ import annotations
+
+import difflib
+import hashlib
+from pathlib import Path
+from typing import Iterator
+
+from claude_skills import object_store
+from claude_skills.manifest import _sha256_file, list_unit_files
+
+DEFAULT_BUDGET_BYTES = 1024 * 1024
+MAX_TEXT_BYTES = 4 * 1024 * 1024
+_NULL = "/dev/null"
+
+
+class DiffBudget:
+    """Byte allowance for printed diff output; ``max_bytes`` None/0 = unlimited."""
+
+    def __init__(self, max_bytes: int | None = DEFAULT_BUDGET_BYTES):
+        self.max_bytes = max_bytes or None
+        self.spent = 0
+        self.exhausted = False
+
+    def take(self, text: str) -> bool:
+        """Charge ``text`` against the budget; False (and exhausted) if it doesn't fit."""
+        if self.exhausted:
+            return False
+        size = len(text.encode("utf-8", "replace"))
+        if self.max_bytes is not None and self.spent + size > self.max_bytes:
+            self.exhausted = True
+            return False
+        self.spent += size
+        return True
+
+
+def _read_text(source: Path | str | None) -> tuple[list[str] | None, int]:
+    """Return ``(lines, size)`` of a file or literal text; lines None if not diffable.
+
+    ``source`` None is an absent file (empty, size 0).
+    """
+    if source is None:
+        return [], 0
+    if isinstance(source, str):
+        return source.splitlines(keepends=True), len(source.encode("utf-8"))
+    try:
+        size = source.stat().st_size
+        if size > MAX_TEXT_BYTES:
+            return None, size
+        data = source.read_bytes()
+    except OSError:
+        return [], 0
+    if b"\0" in data:
+        return None, len(data)
+    try:
+        return data.decode("utf-8").splitlines(keepends=True), len(data)
+    except UnicodeDecodeError:
+        return None, len(data)
+
+
+class FileDiff:
+    """One file's pending diff: deployed (``old``) vs would-be (``new``) content.
+
+    ``old``/``new`` are paths, literal text (for rendered CLAUDE.md), or
+    None for a file that does not exist on that side. Nothing is read
+    until ``lines()`` or ``stat()`` is called.
+    """
+
+    __slots__ = ("unit", "rel", "old", "new", "old_label", "new_label")
+
+    def __init__(
+        self,
+        unit: str,
+        rel: str,
+        old: Path | str | None,
+        new: Path | str | None,
+        old_label: str,
+        new_label: str,
+    ):
+        self.unit = unit
+        self.rel = rel
+        self.old = old
+        self.new = new
+        self.old_label = old_label if old is not None else _NULL
+        self.new_label = new_label if new is not None else _NULL
+
+    @property
+    def label(self) -> str:
+        """``unit: rel`` for display (``rel`` alone when it is the unit)."""
+        return self.rel if self.rel == self.unit else f"{self.unit}: {self.rel}"
+
+    def lines(self, context: int = 3) -> Iterator[str]:
+        """Yield unified-diff lines (each ending in a newline), hunk by hunk."""
+        old_lines, old_size = _read_text(self.old)
+        new_lines, new_size = _read_text(self.new)
+        if old_lines is None or new_lines is None:
+            if old_size != new_size or _digest(self.old) != _digest(self.new):
+                yield f"--- {self.old_label}\n"
+                yield f"+++ {self.new_label}\n"
+                yield f"@@ binary or large file: {old_size} -> {new_size} bytes @@\n"
+            return
+        for line in difflib.unified_diff(
+            old_lines,
+            new_lines,
+            fromfile=self.old_label,
+            tofile=self.new_label,
+            n=context,
+        ):
+            yield line if line.endswith("\n") else line + "\n\\ No newline at end of file\n"
+
+    def stat(self) -> tuple[int, int, bool]:
+        """Return ``(added, removed, binary)``; ``(0, 0, False)`` means unchanged.
+
+        ``binary`` is True for a differing binary-or-large file, whose
+        lines are not counted.
+        """
+        old_lines, old_size = _read_text(self.old)
+        new_lines, new_size = _read_text(self.new)
+        if old_lines is None or new_lines is None:
+            differs = old_size != new_size or _digest(self.old) != _digest(self.new)
+            return 0, 0, differs
+        added = removed = 0
+        matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag in ("replace", "delete"):
+                removed += i2 - i1
+            if tag in ("replace", "insert"):
+                added += j2 - j1
+        return added, removed, False
+
+
+def _digest(source: Path | str | None) -> str | None:
+    """sha256 of one side of a binary/large file, for an equality check only."""
+    if source is None:
+        return None
+    if isinstance(source, str):
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()
+    try:
+        return _sha256_file(source)
+    except OSError:
+        return None
+
+
+def _stored_files(manifest_hash: str) -> dict[str, tuple[Path, str]] | None:
+    """``{rel: (blob, sha)}`` of a stored unit, or None if any part is missing."""
+    files = object_store.unit_files(manifest_hash) if manifest_hash else None
+    if files is None:
+        return None
+    out: dict[str, tuple[Path, str]] = {}
+    for rel, sha in files.items():
+        blob = object_store.blob_path(sha)
+        if blob is None:
+            return None
+        out[rel] = (blob, sha)
+    return out
+
+
+def iter_unit_diffs(
+    key: str,
+    source_anchor: Path,
+    target_anchor: Path,
+    unchanged: list[str] | None = None,
+    manifest_hash: str = "",
+    deployed_hash: str = "",
+) -> Iterator[FileDiff]:
+    """Yield a ``FileDiff`` for every changed file of skill unit ``key``.
+
+    The new side mirrors ``object_store.update_unit``: the stored unit
+    for ``manifest_hash`` when it is in the store, else the files under
+    ``source_anchor``. Files only on the deployed side are included only
+    when the stored unit ``deployed_hash`` (the last deploy) had them.
+    Sorted by rel path. A file present on both sides whose sha256
+    matches (normally answered by the hash cache) is skipped without
+    being read, and its rel path appended to ``unchanged`` when given.
+    """
+    stored = _stored_files(manifest_hash)
+    if stored is not None:
+        source = {rel: blob for rel, (blob, _sha) in stored.items()}
+    else:
+        source = dict(list_unit_files(source_anchor))
+    target = dict(list_unit_files(target_anchor))
+    previous = (object_store.unit_files(deployed_hash) if deployed_hash else None) or {}
+    for rel in sorted(source.keys() | (target.keys() & previous.keys())):
+        src, dst = source.get(rel), target.get(rel)
+        if src is not None and dst is not None:
+            if stored is not None:
+                same = _digest(dst) == stored[rel][1]
+            else:
+                same = _same_file(src, dst)
+            if same:
+                if unchanged is not None:
+                    unchanged.append(f"{key}: {rel}")
+                continue
+        yield FileDiff(
+            key,
+            rel,
+            dst,
+            src,
+            str(target_anchor.parent / rel),
+            str(source_anchor.parent / rel),
+        )
+
+
+def _same_file(a: Path, b: Path) -> bool:
+    try:
+        return _sha256_file(a) == _sha256_file(b)
+    except OSError:
+        return False
+
+
+def iter_plan_diffs(plan: dict, unchanged: list[str] | None = None) -> Iterator[FileDiff]:
+    """Yield ``FileDiff``s for everything a sync plan would write.
+
+    Needs the ``targets``, ``sources`` and ``hashes`` fields
+    ``sync.sync`` adds to every plan, plus the rendered CLAUDE.md when
+    it would change.
+    ``unchanged`` collects the files of ``update`` units that were
+    skipped because their hashes match.
+    """
+    targets = plan.get("targets") or {}
+    claude_md = plan.get("claude_md") or {}
+    rendered = claude_md.get("rendered")
+    if claude_md.get("action") in ("init", "update") and rendered is not None:
+        target = Path(targets["claude_md"])
+        yield FileDiff(
+            "CLAUDE.md",
+            "CLAUDE.md",
+            target if claude_md["action"] == "update" else None,
+            rendered,
+            str(target),
+            str(target) + " (new)",
+        )
+    commands_target = Path(targets.get("commands", ""))
+    sources = plan.get("sources") or {}
+    hashes = plan.get("hashes") or {}
+    skills = plan.get("skills") or {}
+    for key in list(skills.get("add") or []) + list(skills.get("update") or []):
+        home_path = sources.get(key)
+        if not home_path:
+            continue
+        unit_hashes = hashes.get(key) or {}
+        yield from iter_unit_diffs(
+            key,
+            Path(home_path),
+            commands_target / f"{key}.md",
+            unchanged,
+            unit_hashes.get("new", ""),
+            unit_hashes.get("deployed", ""),
+        )
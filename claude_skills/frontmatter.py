@@ -2,11 +2,18 @@
 
 Originally inlined in inventory.py; extracted here so register/retire/rename
 operations can parse skill frontmatter without duplicating the parser.
+
+``parse_frontmatter`` reads the whole file and returns the body as a
+string. ``read_frontmatter`` streams only up to the closing ``---`` and
+returns a ``SkillHeader`` whose body and first heading are read from
+disk on demand; inventory and register use it (through
+``frontmatter_cache``), since they only need the body for the
+description fallback.
 """
 
 from pathlib import Path
 
-import yaml
+from claude_skills import yaml_loader
 
 
 def parse_frontmatter(filepath: Path) -> tuple[dict, str]:
@@ -39,13 +46,112 @@ def parse_frontmatter(filepath: Path) -> tuple[dict, str]:
     body = "\n".join(lines[end_idx + 1:])
 
     try:
-        fm = yaml.safe_load(yaml_block) or {}
-    except yaml.YAMLError:
+        fm = yaml_loader.safe_load(yaml_block) or {}
+    except yaml_loader.YAMLError:
         fm = {}
 
     return fm, body
 
 
+_UNREAD = object()
+
+
+class SkillHeader:
+    """Parsed frontmatter of one skill file; the body stays on disk.
+
+    ``body()`` and ``first_heading()`` reopen the file and seek past the
+    header (``_body_offset`` is a text-mode ``tell()`` cookie), so they
+    cost nothing unless called. The body is only decoded as far as it is
+    read: a file that is valid UTF-8 up to its first heading yields that
+    heading even if later bytes are not.
+    """
+
+    __slots__ = ("path", "fm", "_body_offset", "_heading")
+
+    def __init__(
+        self,
+        path: Path,
+        fm: dict,
+        body_offset: int | None,
+        *,
+        heading: str | None | object = _UNREAD,
+    ):
+        self.path = path
+        self.fm = fm
+        # Where the body starts; None when the file was unreadable.
+        self._body_offset = body_offset
+        # First heading when already known (e.g. from frontmatter_cache).
+        self._heading = heading
+
+    @property
+    def body_offset(self) -> int | None:
+        """Opaque start-of-body position, or None when the file was unreadable."""
+        return self._body_offset
+
+    def _open_body(self):
+        f = open(self.path, encoding="utf-8")
+        f.seek(self._body_offset)
+        return f
+
+    def body(self) -> str:
+        """The markdown body (everything after the closing fence); "" on read errors."""
+        if self._body_offset is None:
+            return ""
+        try:
+            with self._open_body() as f:
+                return f.read()
+        except (OSError, UnicodeDecodeError):
+            return ""
+
+    def first_heading(self) -> str | None:
+        """First markdown heading of the body, reading only as far as it."""
+        if self._heading is not _UNREAD:
+            return self._heading
+        if self._body_offset is None:
+            return None
+        try:
+            with self._open_body() as f:
+                for line in f:
+                    stripped = line.strip()
+                    if stripped.startswith("#"):
+                        return stripped.lstrip("#").strip()
+        except (OSError, UnicodeDecodeError):
+            return None
+        return None
+
+
+def read_frontmatter(filepath: Path) -> SkillHeader:
+    """Read only the YAML frontmatter of a skill .md file.
+
+    Stops at the closing ``---``; same parse rules as
+    ``parse_frontmatter``. A file without frontmatter (or without a
+    closing fence) gets ``fm == {}`` and its whole content as body. Read
+    errors give ``fm == {}`` and an empty body.
+    """
+    try:
+        with open(filepath, encoding="utf-8") as f:
+            if f.readline().strip() != "---":
+                return SkillHeader(filepath, {}, 0)
+            block: list[str] = []
+            # readline() rather than iteration: text-mode tell() is
+            # disabled while iterating.
+            while line := f.readline():
+                if line.strip() == "---":
+                    body_offset = f.tell()
+                    break
+                block.append(line)
+            else:
+                return SkillHeader(filepath, {}, 0)
+    except (OSError, UnicodeDecodeError):
+        return SkillHeader(filepath, {}, None)
+
+    try:
+        fm = yaml_loader.safe_load("".join(block)) or {}
+    except yaml_loader.YAMLError:
+        fm = {}
+    return SkillHeader(filepath, fm, body_offset)
+
+
 def extract_first_heading(body: str) -> str | None:
     """Extract the first markdown heading from body text."""
     for line in body.split("\n"):
@@ -0,0 +1,205 @@
+"""Persistent frontmatter cache keyed by anchor content hash.
+
+``inventory`` and ``register`` parse the frontmatter of every skill
+anchor they look at, on every run, although almost no anchor changes
+between runs. The anchor's sha256 is already known cheaply (``manifest``
+answers it from the stat-keyed ``hash_cache`` without reading the file),
+so this module remembers the parse result per digest: an unchanged
+anchor never reaches the YAML parser again.
+
+Cache file (machine-local, next to the hash cache):
+
+    $CLAUDE_SKILLS_CACHE_DIR/frontmatter_cache.json
+
+Entry format: ``{sha256_hex: [frontmatter, first_heading, body_offset,
+last_used]}`` where ``body_offset`` lets a cached header still read its
+body on demand and ``last_used`` is epoch seconds, bumped at most once a
+day per entry. Keying by content means a renamed or copied anchor still
+hits, and an edited one simply misses; stale digests age out.
+
+Only results that survive a JSON round trip unchanged are cached, so
+frontmatter with dates or non-string keys is re-parsed each time rather
+than coming back with different types. A result is stored only if the
+anchor's stat is identical before and after parsing.
+
+Set ``CLAUDE_SKILLS_NO_FRONTMATTER_CACHE=1`` to bypass it. It is also
+bypassed when the hash cache is disabled: without it, getting the digest
+means reading the whole anchor, which costs more than the parse saves.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from claude_skills.frontmatter import SkillHeader, read_frontmatter
+from claude_skills.hash_cache import cache_dir, cache_disabled
+from claude_skills.manifest import _sha256_file
+
+_NO_CACHE_ENV = "CLAUDE_SKILLS_NO_FRONTMATTER_CACHE"
+_CACHE_FILENAME = "frontmatter_cache.json"
+# Bump when parse rules change, so old results are not reused.
+_CACHE_VERSION = 1
+
+_MAX_ENTRIES = 20_000
+_MAX_AGE_SECONDS = 30 * 24 * 3600
+_TOUCH_INTERVAL_SECONDS = 24 * 3600
+
+
+def frontmatter_cache_disabled() -> bool:
+    """Return True if parsed frontmatter should not be cached."""
+    return cache_disabled() or os.environ.get(_NO_CACHE_ENV, "") not in ("", "0")
+
+
+class FrontmatterCache:
+    """In-memory view of ``frontmatter_cache.json`` with lazy load and atomic save.
+
+    Thread-safe: ``inventory --jobs N`` parses from several worker threads.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._entries: dict[str, list] = {}
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+            return
+        entries = data.get("entries")
+        if isinstance(entries, dict):
+            self._entries = entries
+
+    def lookup(self, digest: str) -> tuple[dict, str | None, int | None] | None:
+        """Return the cached ``(frontmatter, first_heading, body_offset)``."""
+        with self._lock:
+            self._load()
+            entry = self._entries.get(digest)
+            if entry is None or len(entry) != 4 or not isinstance(entry[0], dict):
+                self.misses += 1
+                return None
+            now = int(time.time())
+            if now - entry[3] > _TOUCH_INTERVAL_SECONDS:
+                entry[3] = now
+                self._dirty = True
+            self.hits += 1
+            # Callers may mutate the dict; hand out a copy.
+            return json.loads(json.dumps(entry[0])), entry[1], entry[2]
+
+    def store(
+        self, digest: str, fm: dict, heading: str | None, body_offset: int | None
+    ) -> None:
+        """Record a parse result unless it does not round-trip through JSON."""
+        try:
+            if json.loads(json.dumps(fm)) != fm:
+                return
+        except (TypeError, ValueError):
+            return
+        with self._lock:
+            self._load()
+            self._entries[digest] = [fm, heading, body_offset, int(time.time())]
+            self._dirty = True
+
+    def _evict(self) -> None:
+        cutoff = int(time.time()) - _MAX_AGE_SECONDS
+        stale = [k for k, e in self._entries.items() if len(e) != 4 or e[3] < cutoff]
+        for k in stale:
+            del self._entries[k]
+        overflow = len(self._entries) - _MAX_ENTRIES
+        if overflow > 0:
+            by_age = sorted(self._entries.items(), key=lambda kv: kv[1][3])
+            for k, _ in by_age[:overflow]:
+                del self._entries[k]
+
+    def save(self) -> None:
+        """Write the cache atomically if anything changed. Never raises."""
+        with self._lock:
+            if not self._dirty:
+                return
+            self._evict()
+            payload = {"version": _CACHE_VERSION, "entries": self._entries}
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=str(self.path.parent),
+                    prefix=self.path.name + ".",
+                    suffix=".tmp",
+                )
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(payload, f, separators=(",", ":"))
+                    os.replace(tmp_path, self.path)
+                except Exception:
+                    if os.path.exists(tmp_path):
+                        os.unlink(tmp_path)
+                    raise
+            except OSError:
+                # A cache that can't be written is just a slower run.
+                return
+            self._dirty = False
+
+
+_CACHE: FrontmatterCache | None = None
+_CACHE_GUARD = threading.Lock()
+
+
+def get_frontmatter_cache() -> FrontmatterCache | None:
+    """Return the process-wide cache (saved at exit), or None when disabled."""
+    global _CACHE
+    if frontmatter_cache_disabled():
+        return None
+    with _CACHE_GUARD:
+        if _CACHE is None:
+            _CACHE = FrontmatterCache(cache_dir() / _CACHE_FILENAME)
+            atexit.register(_CACHE.save)
+        return _CACHE
+
+
+def read_frontmatter_cached(anchor: Path) -> SkillHeader:
+    """``read_frontmatter`` answered from the cache when the anchor is unchanged.
+
+    On a hit the returned header already knows its first heading, so
+    neither the YAML parser nor the anchor is touched; ``body()`` still
+    reads on demand. On a miss the anchor is parsed and its first
+    heading read once, then cached.
+    """
+    cache = get_frontmatter_cache()
+    if cache is None:
+        return read_frontmatter(anchor)
+    try:
+        before = os.stat(anchor)
+        digest = _sha256_file(anchor)
+    except OSError:
+        return read_frontmatter(anchor)
+    cached = cache.lookup(digest)
+    if cached is not None:
+        fm, heading, body_offset = cached
+        return SkillHeader(anchor, fm, body_offset, heading=heading)
+
+    header = read_frontmatter(anchor)
+    heading = header.first_heading()
+    try:
+        after = os.stat(anchor)
+    except OSError:
+        return header
+    if (before.st_size, before.st_mtime_ns, before.st_ino) == (
+        after.st_size, after.st_mtime_ns, after.st_ino
+    ):
+        cache.store(digest, header.fm, heading, header.body_offset)
+    return header
@@ -0,0 +1,363 @@
+"""Shared git access for ``sync-repos`` and ``migrate-domain-skills``.
+
+Both commands ask the same few questions of every repo they touch — is
+this the top of a work tree, what is HEAD, is the tree dirty — and used
+to fork a fresh ``git`` for each one (``_is_git_worktree`` alone ran
+twice per repo). This module answers them through one ``GitRepo`` per
+repo path, cached for the life of the process (one CLI invocation):
+
+  - ``toplevel`` and the short HEAD sha are probed together by a single
+    ``git rev-parse --show-toplevel --short HEAD`` and cached;
+  - after a commit (``head_changed``), HEAD is re-resolved through a
+    long-lived ``git cat-file --batch-check`` process per repo instead
+    of another ``rev-parse``;
+  - ``status`` is never cached (the callers change the tree); it can
+    exclude a directory by pathspec and skip untracked files.
+
+When ``pygit2`` is importable all of the above runs in-process through
+libgit2 and no git process is started, except for a ``status`` that
+excludes a directory: libgit2's status cannot be scoped by pathspec, so
+that one still runs ``git status``. Set
+``CLAUDE_SKILLS_GIT_BACKEND=subprocess`` to force the git CLI.
+
+Mutating commands (``add``, ``mv``, ``commit``, ...) still go through
+``run``: they are rare, and the git CLI is the reference behavior for
+hooks, config and the index. Batch processes are closed at exit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import subprocess
+import threading
+from pathlib import Path
+
+_BACKEND_ENV = "CLAUDE_SKILLS_GIT_BACKEND"
+_DEFAULT_ABBREV = 7
+_UNSET = object()
+
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+
+def backend() -> str:
+    """Return ``"pygit2"`` or ``"subprocess"``."""
+    if pygit2 is not None and os.environ.get(_BACKEND_ENV, "") != "subprocess":
+        return "pygit2"
+    return "subprocess"
+
+
+def run(
+    repo_root: Path,
+    args: list[str],
+    *,
+    check: bool = True,
+    input: str | None = None,
+) -> subprocess.CompletedProcess:
+    """Run ``git <args>`` inside ``repo_root``."""
+    return subprocess.run(
+        ["git", *args],
+        cwd=str(repo_root),
+        capture_output=True,
+        text=True,
+        check=check,
+        input=input,
+    )
+
+
+def _truthy(value: str | None) -> bool:
+    """Git-style boolean for config values; hook paths count as on."""
+    return value is not None and value.strip().lower() not in ("", "false", "no", "off", "0")
+
+
+def _pygit2_status_line(path: str, flags: int) -> str:
+    """Render one libgit2 status entry as a porcelain v1 line."""
+    if flags & pygit2.GIT_STATUS_WT_NEW and not flags & 0x1F:
+        return f"?? {path}"
+    x = " "
+    if flags & pygit2.GIT_STATUS_INDEX_NEW:
+        x = "A"
+    elif flags & pygit2.GIT_STATUS_INDEX_DELETED:
+        x = "D"
+    elif flags & pygit2.GIT_STATUS_INDEX_RENAMED:
+        x = "R"
+    elif flags & (pygit2.GIT_STATUS_INDEX_MODIFIED | pygit2.GIT_STATUS_INDEX_TYPECHANGE):
+        x = "M"
+    y = " "
+    if flags & pygit2.GIT_STATUS_WT_DELETED:
+        y = "D"
+    elif flags & (pygit2.GIT_STATUS_WT_MODIFIED | pygit2.GIT_STATUS_WT_TYPECHANGE):
+        y = "M"
+    elif flags & pygit2.GIT_STATUS_WT_NEW:
+        y = "?"
+    return f"{x}{y} {path}"
+
+
+class GitRepo:
+    """Cached git queries for one path. Thread-safe."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._toplevel = _UNSET
+        self._head = _UNSET
+        self._abbrev = _DEFAULT_ABBREV
+        self._batch: subprocess.Popen | None = None
+        self._pg = None
+        self._features: dict[str, bool] | None = None
+
+    # ---- probes ----
+
+    def _probe_pygit2(self) -> None:
+        try:
+            gitdir = pygit2.discover_repository(str(self.path))
+            self._pg = pygit2.Repository(gitdir) if gitdir else None
+        except (pygit2.GitError, OSError):
+            self._pg = None
+        if self._pg is None or self._pg.is_bare or not self._pg.workdir:
+            self._toplevel = None
+            self._head = ""
+            return
+        self._toplevel = Path(self._pg.workdir).resolve()
+        self._head = self._pygit2_head()
+
+    def _pygit2_head(self) -> str:
+        try:
+            if self._pg.head_is_unborn:
+                return ""
+            return self._pg.revparse_single("HEAD").short_id
+        except (pygit2.GitError, KeyError):
+            return ""
+
+    def _probe_subprocess(self) -> None:
+        try:
+            ret = run(self.path, ["rev-parse", "--show-toplevel", "--short", "HEAD"], check=False)
+        except OSError:
+            self._toplevel = None
+            self._head = ""
+            return
+        lines = ret.stdout.splitlines()
+        # An unborn HEAD still prints the toplevel before failing.
+        self._toplevel = Path(lines[0].strip()).resolve() if lines else None
+        self._head = lines[1].strip() if ret.returncode == 0 and len(lines) > 1 else ""
+        if self._head:
+            self._abbrev = len(self._head)
+
+    def _probe(self) -> None:
+        if self._toplevel is not _UNSET:
+            return
+        if backend() == "pygit2":
+            self._probe_pygit2()
+        else:
+            self._probe_subprocess()
+
+    def _batch_resolve(self, rev: str) -> str:
+        """Resolve ``rev`` to a full sha through the cat-file batch process."""
+        if self._batch is None or self._batch.poll() is not None:
+            self._batch = subprocess.Popen(
+                ["git", "cat-file", "--batch-check"],
+                cwd=str(self._toplevel),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+        try:
+            self._batch.stdin.write(rev + "\n")
+            self._batch.stdin.flush()
+            reply = self._batch.stdout.readline().split()
+        except (OSError, ValueError):
+            self._close_batch()
+            return ""
+        # "<sha> <type> <size>", or "<rev> missing".
+        if len(reply) == 3 and reply[1] != "missing":
+            return reply[0]
+        return ""
+
+    def _close_batch(self) -> None:
+        if self._batch is None:
+            return
+        try:
+            self._batch.stdin.close()
+            self._batch.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self._batch.kill()
+        self._batch = None
+
+    # ---- public ----
+
+    def toplevel(self) -> Path | None:
+        """Resolved top of the work tree containing ``path``, or None."""
+        with self._lock:
+            self._probe()
+            return self._toplevel
+
+    def is_worktree(self) -> bool:
+        """True if ``path`` is itself the top of a git work tree."""
+        top = self.toplevel()
+        return top is not None and top == self.path.resolve()
+
+    def head_short(self) -> str:
+        """Short HEAD sha, or "" (not a repo / unborn HEAD)."""
+        with self._lock:
+            self._probe()
+            if self._head is _UNSET:
+                if self._toplevel is None:
+                    self._head = ""
+                elif self._pg is not None:
+                    self._head = self._pygit2_head()
+                else:
+                    self._head = self._batch_resolve("HEAD")[: self._abbrev]
+            return self._head
+
+    def head_changed(self) -> None:
+        """Forget the cached HEAD (call after committing)."""
+        with self._lock:
+            if self._toplevel is not _UNSET:
+                self._head = _UNSET
+
+    def features(self) -> dict[str, bool]:
+        """Which status accelerators the repo has configured (cached).
+
+        ``fsmonitor`` (``core.fsmonitor``) and ``untracked_cache``
+        (``core.untrackedCache``) are used by ``git status`` on its own;
+        libgit2 supports neither, so ``status`` prefers the git CLI when
+        either is on.
+        """
+        with self._lock:
+            self._probe()
+            if self._features is not None:
+                return self._features
+            values: dict[str, str] = {}
+            if self._pg is not None:
+                for key in ("core.fsmonitor", "core.untrackedCache"):
+                    try:
+                        values[key.lower()] = str(self._pg.config[key])
+                    except (KeyError, pygit2.GitError):
+                        pass
+            elif self._toplevel is not None:
+                try:
+                    ret = run(
+                        self._toplevel,
+                        ["config", "--get-regexp", r"^core\.(fsmonitor|untrackedcache)$"],
+                        check=False,
+                    )
+                    for line in ret.stdout.splitlines():
+                        key, _sep, value = line.partition(" ")
+                        values[key.lower()] = value
+                except OSError:
+                    pass
+            self._features = {
+                "fsmonitor": _truthy(values.get("core.fsmonitor")),
+                "untracked_cache": _truthy(values.get("core.untrackedcache")),
+            }
+            return self._features
+
+    def status(
+        self, exclude: str | None = None, untracked: bool = True
+    ) -> list[str] | None:
+        """``git status --porcelain`` lines (never cached); None on failure.
+
+        ``exclude`` is a repo-relative directory (e.g.
+        ``.claude/commands/``) left out of the scan entirely via an
+        ``:(exclude)`` pathspec, so large trees under it are never
+        walked. ``untracked=False`` skips untracked files
+        (``--untracked-files=no``), the most expensive part of a status
+        on trees full of build output. Rename lines read
+        ``XY old -> new``; paths are never quoted.
+
+        pygit2's ``Repository.status`` takes no pathspec and always walks
+        the whole work tree, so it is only used when there is nothing to
+        exclude; a scoped status always goes through ``git status``.
+        """
+        top = self.toplevel()
+        feats = self.features()
+        if (
+            self._pg is not None
+            and not exclude
+            and not (feats["fsmonitor"] or feats["untracked_cache"])
+        ):
+            with self._lock:
+                mode = "normal" if untracked else "no"
+                try:
+                    entries = self._pg.status(untracked_files=mode)
+                except TypeError:
+                    entries = self._pg.status()
+                except pygit2.GitError:
+                    return None
+            return [
+                _pygit2_status_line(path, flags)
+                for path, flags in sorted(entries.items())
+                if not flags & pygit2.GIT_STATUS_IGNORED
+                and (untracked or flags & 0x1F or not flags & pygit2.GIT_STATUS_WT_NEW)
+            ]
+        args = [
+            "status", "--porcelain", "-z",
+            "--untracked-files=" + ("normal" if untracked else "no"),
+        ]
+        if exclude:
+            args += ["--", ".", f":(exclude){exclude}"]
+        try:
+            ret = run(top or self.path, args, check=False)
+        except OSError:
+            return None
+        if ret.returncode != 0:
+            return None
+        lines: list[str] = []
+        fields = iter(ret.stdout.split("\0"))
+        for field in fields:
+            if not field:
+                continue
+            xy, path = field[:2], field[3:]
+            if xy[0] in "RC":
+                # -z puts a rename's source in the following field.
+                path = f"{next(fields, '')} -> {path}"
+            lines.append(f"{xy} {path}")
+        return lines
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_batch()
+            self._pg = None
+            self._toplevel = _UNSET
+            self._head = _UNSET
+            self._features = None
+
+
+_repos: dict[str, GitRepo] = {}
+_repos_lock = threading.Lock()
+
+
+def repo(path: Path) -> GitRepo:
+    """Return the cached ``GitRepo`` for ``path``."""
+    key = os.path.abspath(os.path.expanduser(str(path)))
+    with _repos_lock:
+        found = _repos.get(key)
+        if found is None:
+            found = _repos[key] = GitRepo(Path(key))
+        return found
+
+
+def is_worktree(path: Path) -> bool:
+    """True if ``path`` is the top of a git work tree (cached)."""
+    return repo(path).is_worktree()
+
+
+def head_short(path: Path) -> str:
+    """Short HEAD sha of the repo at ``path``, or "" (cached)."""
+    return repo(path).head_short()
+
+
+def reset() -> None:
+    """Close batch processes and drop every cached answer."""
+    with _repos_lock:
+        repos = list(_repos.values())
+        _repos.clear()
+    for r in repos:
+        r.close()
+
+
+atexit.register(reset)
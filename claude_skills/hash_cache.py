@@ -0,0 +1,200 @@
+"""Persistent stat-keyed sha256 cache for skill-unit hashing.
+
+``compute_manifest_hash`` hashes every byte of every file in a skill unit.
+Across dozens of home repos and several runtime dirs that is the dominant
+cost of ``inventory`` / ``sync`` / ``diff``, even though almost nothing
+changes between runs. This module remembers the digest of each file keyed
+by ``(path, size, mtime_ns, inode)`` so an unchanged file is answered from
+a single ``stat`` call.
+
+Cache file (machine-local, never Dropbox-synced — inode numbers are not
+portable across machines):
+
+    $CLAUDE_SKILLS_CACHE_DIR/hash_cache.json
+    (default: $XDG_CACHE_HOME/claude-skills/ or ~/.cache/claude-skills/)
+
+Entry format: ``{abs_path: [size, mtime_ns, inode, sha256_hex, last_used]}``
+where ``last_used`` is epoch seconds, bumped at most once a day per entry.
+
+Invalidation and eviction:
+  - Any change to size, mtime_ns or inode is a miss; the entry is
+    replaced with the freshly computed digest.
+  - Files modified within ``_RACY_WINDOW_NS`` of "now" are hashed but not
+    cached (a same-size rewrite inside one mtime tick would otherwise be
+    invisible on coarse-timestamp filesystems).
+  - A digest is only stored if the file's stat is identical before and
+    after reading, so a file rewritten mid-hash is never cached.
+  - On save, entries unused for ``_MAX_AGE_SECONDS`` are dropped, then the
+    least-recently-used entries beyond ``_MAX_ENTRIES``.
+
+Set ``CLAUDE_SKILLS_NO_HASH_CACHE=1`` to bypass the cache entirely.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+_CACHE_DIR_ENV = "CLAUDE_SKILLS_CACHE_DIR"
+_NO_CACHE_ENV = "CLAUDE_SKILLS_NO_HASH_CACHE"
+_CACHE_FILENAME = "hash_cache.json"
+_CACHE_VERSION = 1
+
+_MAX_ENTRIES = 50_000
+_MAX_AGE_SECONDS = 30 * 24 * 3600
+_TOUCH_INTERVAL_SECONDS = 24 * 3600
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def cache_dir() -> Path:
+    """Resolve the machine-local cache directory, honoring the env override."""
+    override = os.environ.get(_CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg) if xdg else Path.home() / ".cache"
+    return base / "claude-skills"
+
+
+def cache_disabled() -> bool:
+    """Return True if the persistent hash cache is switched off."""
+    return os.environ.get(_NO_CACHE_ENV, "") not in ("", "0")
+
+
+class HashCache:
+    """In-memory view of ``hash_cache.json`` with lazy load and atomic save.
+
+    Thread-safe: ``inventory --jobs N`` hashes from several worker threads.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._entries: dict[str, list] = {}
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+            return
+        entries = data.get("entries")
+        if isinstance(entries, dict):
+            self._entries = entries
+
+    def lookup(self, key: str, st: os.stat_result) -> str | None:
+        """Return the cached digest for ``key`` if its stat still matches."""
+        with self._lock:
+            self._load()
+            entry = self._entries.get(key)
+            if (
+                entry is None
+                or len(entry) != 5
+                or entry[0] != st.st_size
+                or entry[1] != st.st_mtime_ns
+                or entry[2] != st.st_ino
+            ):
+                self.misses += 1
+                return None
+            now = int(time.time())
+            if now - entry[4] > _TOUCH_INTERVAL_SECONDS:
+                entry[4] = now
+                self._dirty = True
+            self.hits += 1
+            return entry[3]
+
+    def store(self, key: str, st: os.stat_result, digest: str) -> None:
+        """Record ``digest`` for ``key`` unless the file is too fresh to trust."""
+        if time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS:
+            return
+        with self._lock:
+            self._load()
+            self._entries[key] = [
+                st.st_size, st.st_mtime_ns, st.st_ino, digest, int(time.time())
+            ]
+            self._dirty = True
+
+    def invalidate(self, key: str) -> None:
+        """Drop any cached digest for ``key``."""
+        with self._lock:
+            self._load()
+            if self._entries.pop(key, None) is not None:
+                self._dirty = True
+
+    def _evict(self) -> None:
+        cutoff = int(time.time()) - _MAX_AGE_SECONDS
+        stale = [k for k, e in self._entries.items() if len(e) != 5 or e[4] < cutoff]
+        for k in stale:
+            del self._entries[k]
+        overflow = len(self._entries) - _MAX_ENTRIES
+        if overflow > 0:
+            by_age = sorted(self._entries.items(), key=lambda kv: kv[1][4])
+            for k, _ in by_age[:overflow]:
+                del self._entries[k]
+
+    def save(self) -> None:
+        """Write the cache atomically if anything changed. Never raises."""
+        with self._lock:
+            if not self._dirty:
+                return
+            self._evict()
+            payload = {"version": _CACHE_VERSION, "entries": self._entries}
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=str(self.path.parent),
+                    prefix=self.path.name + ".",
+                    suffix=".tmp",
+                )
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(payload, f, separators=(",", ":"))
+                    os.replace(tmp_path, self.path)
+                except Exception:
+                    if os.path.exists(tmp_path):
+                        os.unlink(tmp_path)
+                    raise
+            except OSError:
+                # A cache that can't be written is just a slower run.
+                return
+            self._dirty = False
+
+
+_CACHE: HashCache | None = None
+_CACHE_GUARD = threading.Lock()
+
+
+def get_hash_cache() -> HashCache | None:
+    """Return the process-wide cache, or None when disabled.
+
+    The cache is saved automatically at interpreter exit; callers that
+    want the write to happen earlier can call ``save_hash_cache()``.
+    """
+    global _CACHE
+    if cache_disabled():
+        return None
+    with _CACHE_GUARD:
+        if _CACHE is None:
+            _CACHE = HashCache(cache_dir() / _CACHE_FILENAME)
+            atexit.register(_CACHE.save)
+        return _CACHE
+
+
+def save_hash_cache() -> None:
+    """Flush the process-wide cache to disk (no-op if unused or disabled)."""
+    if _CACHE is not None:
+        _CACHE.save()
@@ -19,36 +19,24 @@ Step 2 of the convention pivot.
 """
 
 import json
-import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
-import yaml
-
-from claude_skills.frontmatter import extract_first_heading, parse_frontmatter
+from claude_skills.change_journal import ChangeJournal, repo_fingerprint
+from claude_skills.frontmatter import SkillHeader
+from claude_skills.frontmatter_cache import read_frontmatter_cached
 from claude_skills.manifest import compute_manifest_hash, list_skill_units
+from claude_skills.object_store import has_unit, store_root
+from claude_skills.projects import load_project_registry
 from claude_skills.registry import load_registry, save_registry
+from claude_skills.workers import map_ordered
 
 
 # Paths to key data files
-_REPO_ROOT = Path(__file__).resolve().parent.parent
-_DEFAULT_PROJECT_REGISTRY = (
-    Path.home() / "Dropbox" / "Projects" / "AIAssistant" / "state" / "project_registry.yaml"
-)
-_PROJECT_REGISTRY_ENV = "CLAUDE_SKILLS_PROJECT_REGISTRY_PATH"
-_AIASSISTANT_ROOT = Path.home() / "Dropbox" / "Projects" / "AIAssistant"
 _USER_COMMANDS = Path.home() / ".claude" / "commands"
 
 
-def _project_registry_path() -> Path:
-    """Resolve project_registry.yaml path, honoring the env override."""
-    override = os.environ.get(_PROJECT_REGISTRY_ENV)
-    if override:
-        return Path(override)
-    return _DEFAULT_PROJECT_REGISTRY
-
-
 # Track which (repo, source_kind) pairs we've already warned about so the
 # deprecation banner is one-line-per-repo-per-source instead of per-skill.
 _DEPRECATION_REPORTED: set[tuple[str, str]] = set()
@@ -77,30 +65,6 @@ def _infer_scope_from_home(home_repo: str) -> str:
     return "domain"
 
 
-def _load_project_registry() -> dict:
-    """Load AIAssistant project registry (honors env override for tests)."""
-    path = _project_registry_path()
-    if not path.exists():
-        return {}
-    with open(path) as f:
-        data = yaml.safe_load(f) or {}
-    return data.get("projects", {})
-
-
-def _resolve_repo_path_with_ancestors(project_id: str, projects: dict) -> str | None:
-    """Walk parent chain to find inherited ``repo_path``."""
-    visited: set[str] = set()
-    pid = project_id
-    while pid and pid not in visited:
-        visited.add(pid)
-        entry = projects.get(pid, {}) or {}
-        rp = entry.get("repo_path")
-        if rp:
-            return rp
-        pid = entry.get("parent")
-    return None
-
-
 def _candidate_skill_dirs(repo_root: Path, repo_name: str) -> list[tuple[Path, str]]:
     """Return the ordered list of (skills_dir, source_kind) for a home repo.
 
@@ -132,35 +96,120 @@ def _get_home_repos() -> list[tuple[str, Path, str]]:
     Returns list of (repo_name, repo_root, scope). The actual skill dirs
     are computed per-repo via ``_candidate_skill_dirs``.
     """
-    homes: list[tuple[str, Path, str]] = []
+    # ClaudeCommands -> universal, AIAssistant -> platform, and every
+    # registered project that resolves to an existing repo_path -> domain.
+    return [
+        (name, root, _infer_scope_from_home(name))
+        for name, root in load_project_registry().home_roots().items()
+    ]
+
+
+def _build_discovered_entry(
+    anchor: Path,
+    header: SkillHeader,
+    repo_name: str,
+    default_scope: str,
+    repo_name_to_pid: dict[str, str],
+) -> dict | None:
+    """Build the registry entry for one discovered anchor (sans manifest_hash).
+
+    Returns None when the frontmatter marks the file as a deployed copy of
+    a skill owned elsewhere (``repo:<other>`` scope, or a scope higher
+    than the home repo's default).
+    """
+    fm = header.fm
+
+    # Determine skill name
+    skill_name = fm.get("name", anchor.stem)
+
+    # Determine scope from frontmatter
+    fm_scope_raw = fm.get("scope", "")
+    if fm_scope_raw:
+        # Handle legacy "repo:X" frontmatter scope format. Migration map:
+        #   repo:AIAssistant     → platform
+        #   repo:ClaudeCommands  → universal
+        #   repo:<other>         → domain
+        if fm_scope_raw.startswith("repo:"):
+            declared_repo = fm_scope_raw.split(":", 1)[1]
+            if declared_repo == "AIAssistant":
+                fm_scope = "platform"
+            elif declared_repo == "ClaudeCommands":
+                fm_scope = "universal"
+            else:
+                fm_scope = "domain"
+            # If found in a repo but declares repo:X for a DIFFERENT repo,
+            # it's a deployed copy — skip it
+            if declared_repo != repo_name:
+                return None
+        else:
+            fm_scope = fm_scope_raw
+            # If a skill declares a scope higher than its home's default,
+            # it's a deployed copy — skip it.
+            # E.g. universal skill in a platform/domain repo, or
+            # platform skill in a domain repo.
+            _scope_rank = {"universal": 0, "platform": 1, "domain": 2}
+            declared_rank = _scope_rank.get(fm_scope, 2)
+            home_rank = _scope_rank.get(default_scope, 2)
+            if declared_rank < home_rank:
+                return None
+    else:
+        fm_scope = default_scope
+
+    # Description (the body is only read when frontmatter has none)
+    description = fm.get("description", "") or header.first_heading() or ""
+
+    # Determine domain
+    domain = None
+    if fm_scope == "domain" or default_scope == "domain":
+        domain = repo_name_to_pid.get(repo_name, repo_name.lower())
+
+    # Parse deploys_to_repos from frontmatter — optional list of
+    # repo names (or ["*"] wildcard). Wildcard is preserved
+    # verbatim at inventory time and expanded only at sync-repos
+    # time.
+    fm_drepos = fm.get("deploys_to_repos")
+    if fm_drepos is None:
+        deploys_to_repos: list[str] = []
+    elif isinstance(fm_drepos, list):
+        deploys_to_repos = [str(x) for x in fm_drepos]
+    elif isinstance(fm_drepos, str):
+        # Tolerate scalar form: "AgentForge" or "*"
+        deploys_to_repos = [fm_drepos]
+    else:
+        deploys_to_repos = []
 
-    # 1. ClaudeCommands -> universal (the repo this CLI lives in)
-    homes.append(("ClaudeCommands", _REPO_ROOT, "universal"))
+    return {
+        "name": skill_name,
+        "description": description,
+        "home_repo": repo_name,
+        "home_path": str(anchor),
+        "scope": fm_scope if fm_scope in ("universal", "platform", "domain") else default_scope,
+        "domain": domain,
+        "manifest_hash": "",
+        "retired": False,
+        "conflict": False,
+        "deploys_to_machines": [],
+        "deploys_to_repos": deploys_to_repos,
+        "last_deploy": {},
+        "last_repo_deploy": {},
+    }
 
-    # 2. AIAssistant -> platform
-    if _AIASSISTANT_ROOT.is_dir():
-        homes.append(("AIAssistant", _AIASSISTANT_ROOT, "platform"))
 
-    # 3. Every project in the registry that has a repo_path -> domain.
-    projects = _load_project_registry()
-    seen_repo_names = {"ClaudeCommands", "AIAssistant"}
-    for pid, info in projects.items():
-        name = info.get("name") or pid
-        if name in seen_repo_names:
-            continue
-        rp = _resolve_repo_path_with_ancestors(pid, projects)
-        if not rp:
-            continue
-        repo_root = Path(rp).expanduser()
-        if not repo_root.is_dir():
-            continue
-        homes.append((name, repo_root, "domain"))
-        seen_repo_names.add(name)
-
-    return homes
+def _units_stored(record: dict) -> bool:
+    """True if every journaled entry's unit is in the object store (or it is off)."""
+    if store_root() is None:
+        return True
+    return all(
+        has_unit(entry.get("manifest_hash", "")) for _key, entry in record["entries"]
+    )
 
 
-def inventory(apply: bool = False, machine: str | None = None) -> dict:
+def inventory(
+    apply: bool = False,
+    machine: str | None = None,
+    jobs: int | None = 1,
+    incremental: bool = False,
+) -> dict:
     """Walk known skill homes and reconcile with state/skill_registry.json.
 
     Walks each home repo in priority order: ``agent-io/skills/`` first,
@@ -168,6 +217,17 @@ def inventory(apply: bool = False, machine: str | None = None) -> dict:
     ClaudeCommands only). A skill key claimed by a higher-priority dir is
     not re-discovered from a lower-priority dir in the same repo.
 
+    ``jobs`` bounds the worker pool used for frontmatter parsing and
+    manifest hashing (1 = serial, 0 = auto). The result is identical for
+    every value; only wall time changes.
+
+    ``incremental`` consults the change journal (see ``change_journal``):
+    home repos whose skill dirs and git state are unchanged since the
+    last incremental run reuse their previously discovered entries
+    instead of being re-parsed and re-hashed. The journal is only written
+    with ``apply`` (dry runs don't put units in the object store), and
+    with ``apply`` a repo is reused only if all its units are stored.
+
     Returns a dict with keys:
         proposed_skills: dict[name, entry]
         conflicts: list[name]
@@ -178,6 +238,7 @@ def inventory(apply: bool = False, machine: str | None = None) -> dict:
         hash_changed: list[name]
         repo_deploys_drifts: list[(name, registry_repos, frontmatter_repos)]
         home_target_warnings: list[(name, home_repo)]
+        incremental: {reused: [repo], rescanned: [repo]} (incremental only)
     """
     # Reset deprecation dedupe for each top-level run so back-to-back
     # CLI invocations both surface warnings.
@@ -192,117 +253,96 @@ def inventory(apply: bool = False, machine: str | None = None) -> dict:
 
     homes = _get_home_repos()
 
-    # Pre-load project registry for domain lookups (avoid repeated YAML parsing)
-    projects = _load_project_registry()
-    # Build repo_name -> project_id mapping
-    _repo_name_to_pid: dict[str, str] = {}
-    for pid, pinfo in projects.items():
-        pname = pinfo.get("name", "")
-        if pname:
-            _repo_name_to_pid[pname] = pid
+    # repo_name -> project_id for domain lookups.
+    _repo_name_to_pid = load_project_registry().name_to_pid
 
-    for repo_name, repo_root, default_scope in homes:
-        # Track which skill keys we've already claimed from a higher-priority
-        # source within this repo so we don't double-register from a legacy
-        # mirror that hasn't been migrated yet.
-        claimed_in_repo: set[str] = set()
+    # Incremental mode: repos whose fingerprint matches the change journal
+    # contribute their previously discovered entries without a rescan.
+    journal = ChangeJournal() if incremental else None
+    fingerprints: dict[str, str] = {}
+    per_repo: dict[str, list[tuple[str, dict]]] = {}
+    legacy_by_repo: dict[str, list[tuple[str, str]]] = {}
 
-        for skills_dir, source_kind in _candidate_skill_dirs(repo_root, repo_name):
+    # Pass 1 (serial, cheap): enumerate anchors in priority order. Legacy
+    # deprecation warnings are emitted here so their order matches the
+    # walk order regardless of --jobs.
+    scan: list[tuple[str, str, Path]] = []  # (repo_name, default_scope, anchor)
+    for repo_name, repo_root, default_scope in homes:
+        skill_dirs = _candidate_skill_dirs(repo_root, repo_name)
+        if journal is not None:
+            fp = repo_fingerprint(
+                repo_name,
+                repo_root,
+                skill_dirs,
+                (default_scope, _repo_name_to_pid.get(repo_name)),
+            )
+            fingerprints[repo_name] = fp
+            cached = journal.reuse(
+                repo_name, fp, _units_stored if apply else None
+            )
+            if cached is not None:
+                for source_kind, skills_dir in cached["legacy_dirs"]:
+                    _warn_legacy_source(repo_name, source_kind, Path(skills_dir))
+                per_repo[repo_name] = [
+                    (k, e) for k, e in json.loads(json.dumps(cached["entries"]))
+                ]
+                continue
+        per_repo[repo_name] = []
+        legacy_by_repo[repo_name] = []
+        for skills_dir, source_kind in skill_dirs:
             anchors = list_skill_units(skills_dir)
             if anchors and source_kind != "agent-io/skills":
                 _warn_legacy_source(repo_name, source_kind, skills_dir)
-
+                legacy_by_repo[repo_name].append((source_kind, str(skills_dir)))
             for anchor in anchors:
-                fm, body = parse_frontmatter(anchor)
-
-                # Determine skill name
-                skill_name = fm.get("name", anchor.stem)
-                # Normalize to lowercase-kebab for registry key
-                skill_key = anchor.stem
-
-                if skill_key in claimed_in_repo:
-                    # Already discovered in a higher-priority dir for this repo.
-                    continue
-
-                # Determine scope from frontmatter
-                fm_scope_raw = fm.get("scope", "")
-                if fm_scope_raw:
-                    # Handle legacy "repo:X" frontmatter scope format. Migration map:
-                    #   repo:AIAssistant     → platform
-                    #   repo:ClaudeCommands  → universal
-                    #   repo:<other>         → domain
-                    if fm_scope_raw.startswith("repo:"):
-                        declared_repo = fm_scope_raw.split(":", 1)[1]
-                        if declared_repo == "AIAssistant":
-                            fm_scope = "platform"
-                        elif declared_repo == "ClaudeCommands":
-                            fm_scope = "universal"
-                        else:
-                            fm_scope = "domain"
-                        # If found in a repo but declares repo:X for a DIFFERENT repo,
-                        # it's a deployed copy — skip it
-                        if declared_repo != repo_name:
-                            continue
-                    else:
-                        fm_scope = fm_scope_raw
-                        # If a skill declares a scope higher than its home's default,
-                        # it's a deployed copy — skip it.
-                        # E.g. universal skill in a platform/domain repo, or
-                        # platform skill in a domain repo.
-                        _scope_rank = {"universal": 0, "platform": 1, "domain": 2}
-                        declared_rank = _scope_rank.get(fm_scope, 2)
-                        home_rank = _scope_rank.get(default_scope, 2)
-                        if declared_rank < home_rank:
-                            continue
-                else:
-                    fm_scope = default_scope
-
-                # Description
-                description = fm.get("description", "") or extract_first_heading(body) or ""
-
-                # Compute hash
-                manifest_hash = compute_manifest_hash(anchor)
-
-                # Determine domain
-                domain = None
-                if fm_scope == "domain" or default_scope == "domain":
-                    domain = _repo_name_to_pid.get(repo_name, repo_name.lower())
-
-                # Parse deploys_to_repos from frontmatter — optional list of
-                # repo names (or ["*"] wildcard). Wildcard is preserved
-                # verbatim at inventory time and expanded only at sync-repos
-                # time.
-                fm_drepos = fm.get("deploys_to_repos")
-                if fm_drepos is None:
-                    deploys_to_repos: list[str] = []
-                elif isinstance(fm_drepos, list):
-                    deploys_to_repos = [str(x) for x in fm_drepos]
-                elif isinstance(fm_drepos, str):
-                    # Tolerate scalar form: "AgentForge" or "*"
-                    deploys_to_repos = [fm_drepos]
-                else:
-                    deploys_to_repos = []
-
-                entry = {
-                    "name": skill_name,
-                    "description": description,
-                    "home_repo": repo_name,
-                    "home_path": str(anchor),
-                    "scope": fm_scope if fm_scope in ("universal", "platform", "domain") else default_scope,
-                    "domain": domain,
-                    "manifest_hash": manifest_hash,
-                    "retired": False,
-                    "conflict": False,
-                    "deploys_to_machines": [],
-                    "deploys_to_repos": deploys_to_repos,
-                    "last_deploy": {},
-                    "last_repo_deploy": {},
-                }
-
-                if skill_key not in discovered:
-                    discovered[skill_key] = []
-                discovered[skill_key].append(entry)
-                claimed_in_repo.add(skill_key)
+                scan.append((repo_name, default_scope, anchor))
+
+    # Pass 2 (pooled): frontmatter parsing is I/O-latency bound on
+    # Dropbox-backed trees with cold caches. Only headers are read here,
+    # and unchanged anchors come from the frontmatter cache.
+    parsed = map_ordered(lambda item: read_frontmatter_cached(item[2]), scan, jobs)
+
+    # Pass 3 (serial): claim + scope filtering, in walk order. Track which
+    # skill keys we've already claimed from a higher-priority source within
+    # each repo so we don't double-register from a legacy mirror that
+    # hasn't been migrated yet.
+    claimed: set[tuple[str, str]] = set()
+    accepted: list[tuple[str, dict, Path]] = []  # (skill_key, entry, anchor)
+    for (repo_name, default_scope, anchor), header in zip(scan, parsed):
+        skill_key = anchor.stem
+        if (repo_name, skill_key) in claimed:
+            # Already discovered in a higher-priority dir for this repo.
+            continue
+        entry = _build_discovered_entry(
+            anchor, header, repo_name, default_scope, _repo_name_to_pid
+        )
+        if entry is None:
+            continue
+        accepted.append((skill_key, entry, anchor))
+        claimed.add((repo_name, skill_key))
+
+    # Pass 4 (pooled): hash only the units that survived filtering. With
+    # --apply the units also go into the object store, so sync can deploy
+    # exactly the registered bytes.
+    hashes = map_ordered(
+        lambda item: compute_manifest_hash(item[2], store=apply), accepted, jobs
+    )
+    for (skill_key, entry, _anchor), manifest_hash in zip(accepted, hashes):
+        entry["manifest_hash"] = manifest_hash
+        per_repo[entry["home_repo"]].append((skill_key, entry))
+
+    if journal is not None and apply:
+        for repo_name, legacy_dirs in legacy_by_repo.items():
+            journal.record(
+                repo_name, fingerprints[repo_name], legacy_dirs, per_repo[repo_name]
+            )
+        journal.save()
+
+    # Reassemble in home-repo order so the result (and the registry key
+    # order written on --apply) matches a full serial scan.
+    for repo_name, _repo_root, _default_scope in homes:
+        for skill_key, entry in per_repo.get(repo_name, []):
+            discovered.setdefault(skill_key, []).append(entry)
 
     # Resolve conflicts and build proposed_skills.
     #
@@ -456,6 +496,11 @@ def inventory(apply: bool = False, machine: str | None = None) -> dict:
         "hash_changed": hash_changed,
         "repo_deploys_drifts": repo_deploys_drifts,
         "home_target_warnings": home_target_warnings,
+        "incremental": (
+            {"reused": journal.reused, "rescanned": journal.rescanned}
+            if journal is not None
+            else None
+        ),
     }
 
 
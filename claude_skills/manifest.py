@@ -1,8 +1,11 @@
 """Skill manifest operations — hashing and unit discovery."""
 
 import hashlib
+import os
 from pathlib import Path
 
+from claude_skills.hash_cache import get_hash_cache
+
 # Standard ignore patterns for manifest computation
 _IGNORE_PATTERNS = {".DS_Store", "__pycache__", ".git"}
 _IGNORE_SUFFIXES = {".pyc"}
@@ -26,8 +29,8 @@ def _should_ignore(path: Path) -> bool:
     return False
 
 
-def _sha256_file(filepath: Path) -> str:
-    """Return sha256 hex digest of a file's contents."""
+def _sha256_file_uncached(filepath: Path) -> str:
+    """Return sha256 hex digest of a file's contents, always reading it."""
     h = hashlib.sha256()
     with open(filepath, "rb") as f:
         for chunk in iter(lambda: f.read(65536), b""):
@@ -35,35 +38,45 @@ def _sha256_file(filepath: Path) -> str:
     return h.hexdigest()
 
 
-def compute_manifest_hash(skill_path: Path) -> str:
-    """Compute deterministic manifest hash for a skill.
-
-    Treats a skill as the union of:
-      - skill_path (the .md file itself), and
-      - skill_path's sibling directory of the same stem (e.g. for
-        envman-expert.md, the directory envman-expert/) if it exists,
-        recursively.
-
-    Algorithm:
-      1. Build a sorted list of (relative_path_from_skill_parent, sha256_hex)
-         pairs for every file in the unit.
-      2. Concatenate "{rel_path}:{sha256_hex}\n" lines.
-      3. Return sha256 of that concatenation.
+def _sha256_file(filepath: Path) -> str:
+    """Return sha256 hex digest of a file's contents.
 
-    Returns 64-char hex string. Stable across machines for the same file
-    contents.
+    Consults the persistent stat-keyed cache (see ``hash_cache``) first;
+    only files whose (size, mtime_ns, inode) changed since the last run
+    are actually read.
+    """
+    cache = get_hash_cache()
+    if cache is None:
+        return _sha256_file_uncached(filepath)
+    key = os.path.abspath(filepath)
+    before = os.stat(filepath)
+    digest = cache.lookup(key, before)
+    if digest is not None:
+        return digest
+    digest = _sha256_file_uncached(filepath)
+    after = os.stat(filepath)
+    if (before.st_size, before.st_mtime_ns, before.st_ino) == (
+        after.st_size, after.st_mtime_ns, after.st_ino
+    ):
+        cache.store(key, after, digest)
+    return digest
+
+
+def list_unit_files(skill_path: Path) -> list[tuple[str, Path]]:
+    """Return the sorted ``(rel_path, path)`` pairs of a skill unit's files.
+
+    Same file set and ``rel_path`` convention as ``compute_file_manifest``,
+    without hashing anything.
     """
     parent = skill_path.parent
     stem = skill_path.stem
     sibling_dir = parent / stem
 
-    # Collect all files in the skill unit
-    file_hashes: list[tuple[str, str]] = []
+    files: list[tuple[str, Path]] = []
 
     # The .md file itself
     if skill_path.exists():
-        rel = skill_path.name
-        file_hashes.append((rel, _sha256_file(skill_path)))
+        files.append((skill_path.name, skill_path))
 
     # The sibling directory (recursively)
     if sibling_dir.is_dir():
@@ -73,16 +86,61 @@ def compute_manifest_hash(skill_path: Path) -> str:
             rel_from_parent = filepath.relative_to(parent)
             if _should_ignore(rel_from_parent):
                 continue
-            file_hashes.append((str(rel_from_parent), _sha256_file(filepath)))
+            files.append((str(rel_from_parent), filepath))
 
     # Sort by relative path for determinism
-    file_hashes.sort(key=lambda x: x[0])
+    files.sort(key=lambda x: x[0])
+    return files
+
+
+def compute_file_manifest(skill_path: Path) -> list[tuple[str, str]]:
+    """Return the sorted ``(rel_path, sha256_hex)`` pairs of a skill unit.
+
+    ``rel_path`` is relative to ``skill_path.parent`` (so the anchor is
+    ``<stem>.md`` and sibling files are ``<stem>/...``). This is the
+    per-file manifest that ``compute_manifest_hash`` rolls up.
+    """
+    return [(rel, _sha256_file(path)) for rel, path in list_unit_files(skill_path)]
 
-    # Build manifest string and hash it
+
+def manifest_hash_from_files(file_hashes: list[tuple[str, str]]) -> str:
+    """Roll a sorted per-file manifest up into the unit manifest hash."""
     manifest_str = "".join(f"{rel}:{h}\n" for rel, h in file_hashes)
     return hashlib.sha256(manifest_str.encode("utf-8")).hexdigest()
 
 
+def compute_manifest_hash(skill_path: Path, store: bool = False) -> str:
+    """Compute deterministic manifest hash for a skill.
+
+    Treats a skill as the union of:
+      - skill_path (the .md file itself), and
+      - skill_path's sibling directory of the same stem (e.g. for
+        envman-expert.md, the directory envman-expert/) if it exists,
+        recursively.
+
+    Algorithm:
+      1. Build a sorted list of (relative_path_from_skill_parent, sha256_hex)
+         pairs for every file in the unit.
+      2. Concatenate "{rel_path}:{sha256_hex}\n" lines.
+      3. Return sha256 of that concatenation.
+
+    Returns 64-char hex string. Stable across machines for the same file
+    contents.
+
+    With ``store=True`` the unit is also added to the content-addressed
+    object store (see ``object_store``), so sync can later materialize
+    exactly these bytes. Pass it for skill *sources* only, never for
+    deployed targets.
+    """
+    file_hashes = compute_file_manifest(skill_path)
+    manifest_hash = manifest_hash_from_files(file_hashes)
+    if store:
+        from claude_skills.object_store import put_unit
+
+        put_unit(skill_path, file_hashes, manifest_hash)
+    return manifest_hash
+
+
 def list_skill_units(commands_dir: Path) -> list[Path]:
     """List skill unit anchor paths in a commands directory.
 
@@ -38,13 +38,12 @@ Hard rules:
 
 from __future__ import annotations
 
-import os
 import subprocess
 from pathlib import Path
 
-import yaml
-
+from claude_skills import gitio
 from claude_skills.manifest import compute_manifest_hash
+from claude_skills.projects import load_project_registry
 from claude_skills.registry import load_registry, save_registry
 
 
@@ -62,70 +61,9 @@ _COMMIT_MESSAGE = (
     "agent-io/skills/.\n"
 )
 
-_DEFAULT_PROJECT_REGISTRY = (
-    Path.home() / "Dropbox" / "Projects" / "AIAssistant" / "state" / "project_registry.yaml"
-)
-_PROJECT_REGISTRY_ENV = "CLAUDE_SKILLS_PROJECT_REGISTRY_PATH"
-
 _LEGACY_KINDS = (".claude/commands", "commands")
 
 
-def _project_registry_path() -> Path:
-    override = os.environ.get(_PROJECT_REGISTRY_ENV)
-    if override:
-        return Path(override)
-    return _DEFAULT_PROJECT_REGISTRY
-
-
-def _load_projects() -> dict:
-    path = _project_registry_path()
-    if not path.exists():
-        return {}
-    with open(path) as f:
-        data = yaml.safe_load(f) or {}
-    return data.get("projects", {}) or {}
-
-
-def _resolve_repo_path_with_ancestors(project_id: str, projects: dict) -> str | None:
-    visited: set[str] = set()
-    pid = project_id
-    while pid and pid not in visited:
-        visited.add(pid)
-        entry = projects.get(pid, {}) or {}
-        rp = entry.get("repo_path")
-        if rp:
-            return rp
-        pid = entry.get("parent")
-    return None
-
-
-def _build_repo_root_index() -> dict[str, Path]:
-    """Return ``{repo_name: repo_root_path}`` for known home repos.
-
-    Includes ClaudeCommands (the repo this CLI lives in) and AIAssistant
-    (special-cased to ~/Dropbox/Projects/AIAssistant) plus every project
-    in the registry that resolves to a repo_path.
-    """
-    here = Path(__file__).resolve().parent.parent
-    out: dict[str, Path] = {}
-    out["ClaudeCommands"] = here
-    aia = Path.home() / "Dropbox" / "Projects" / "AIAssistant"
-    if aia.is_dir():
-        out["AIAssistant"] = aia
-    projects = _load_projects()
-    for pid, info in projects.items():
-        name = info.get("name") or pid
-        if name in out:
-            continue
-        rp = _resolve_repo_path_with_ancestors(pid, projects)
-        if not rp:
-            continue
-        path = Path(rp).expanduser()
-        if path.is_dir():
-            out[name] = path
-    return out
-
-
 def _classify_legacy(home_path: Path, repo_root: Path) -> str | None:
     """Return the legacy ``source_kind`` for a path, or None if canonical.
 
@@ -160,26 +98,11 @@ def _classify_legacy(home_path: Path, repo_root: Path) -> str | None:
     return None
 
 
-def _git_run(
-    repo_root: Path, args: list[str], *, check: bool = True
-) -> subprocess.CompletedProcess:
-    return subprocess.run(
-        ["git", *args],
-        cwd=str(repo_root),
-        capture_output=True,
-        text=True,
-        check=check,
-    )
+_git_run = gitio.run
 
 
 def _is_git_worktree(repo_root: Path) -> bool:
-    try:
-        ret = _git_run(repo_root, ["rev-parse", "--show-toplevel"], check=False)
-    except (OSError, FileNotFoundError):
-        return False
-    if ret.returncode != 0:
-        return False
-    return Path(ret.stdout.strip()).resolve() == repo_root.resolve()
+    return gitio.is_worktree(repo_root)
 
 
 def _gitignore_needs_block(repo_root: Path) -> bool:
@@ -351,7 +274,7 @@ def migrate_domain_skills(
     registry = load_registry()
     skills_reg = registry.get("skills", {}) or {}
 
-    repo_index = _build_repo_root_index()
+    repo_index = load_project_registry().home_roots()
 
     # Group skills by their resolved home_repo. Build the move plan per repo.
     by_repo: dict[str, dict] = {}
@@ -532,10 +455,9 @@ def migrate_domain_skills(
                 ]
                 if staged:
                     _git_run(repo_root, ["commit", "-m", _COMMIT_MESSAGE])
-                    sha = _git_run(
-                        repo_root, ["rev-parse", "--short", "HEAD"], check=False
-                    )
-                    rp["commit"] = sha.stdout.strip() if sha.returncode == 0 else None
+                    git = gitio.repo(repo_root)
+                    git.head_changed()
+                    rp["commit"] = git.head_short() or None
             except subprocess.CalledProcessError as exc:
                 rp["errors"].append(
                     f"git commit failed: {(exc.stderr or exc.stdout or str(exc)).strip()}"
@@ -0,0 +1,370 @@
+"""Content-addressed object store for skill units.
+
+Every deploy used to copy loose files out of the home repo, so a sync
+could only ever reproduce whatever happened to be on disk right now.
+The object store keeps the exact bytes of every registered unit:
+
+    state/objects/
+      blobs/<aa>/<sha256>             file contents, read-only, named by sha256
+      units/<aa>/<manifest_hash>.json unit manifest (see below)
+
+A unit manifest is the per-file manifest ``compute_manifest_hash`` rolls
+up, plus the anchor name and each file's executable bit::
+
+    {"version": 1, "manifest_hash": "...", "anchor": "foo.md",
+     "files": [["foo.md", "<sha256>", false],
+               ["foo/context.md", "<sha256>", false]]}
+
+Blobs are shared across skills and repos (dedup), and a unit manifest
+exists for every ``manifest_hash`` inventory or register has ever seen.
+That lets sync:
+  - materialize a target from the store (``materialize_unit``), deploying
+    exactly the registered bytes even if the source moved on since;
+  - restore any ``hash_at_deploy`` from ``deployment_log.jsonl``;
+  - verify deployed bytes against the manifest (``verify_unit``)
+    without reading the source tree;
+  - update a deployed unit in place (``update_unit``): the stored
+    manifest is the per-file sidecar of each registered
+    ``manifest_hash``, so only changed files are written and only files
+    the previously deployed unit had are removed.
+
+The store is populated by ``compute_manifest_hash(..., store=True)``,
+which only reads a file when its blob is missing. Location defaults to
+``state/objects/`` (gitignored); override with
+``CLAUDE_SKILLS_OBJECT_STORE``, or set it to ``off`` to disable.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from claude_skills.deploy import DEFAULT_STRATEGY, is_same_entry, place_file
+from claude_skills.manifest import _sha256_file_uncached, compute_file_manifest
+
+_DEFAULT_STORE = Path(__file__).resolve().parent.parent / "state" / "objects"
+_STORE_ENV = "CLAUDE_SKILLS_OBJECT_STORE"
+_UNIT_VERSION = 1
+
+
+def store_root() -> Path | None:
+    """Return the store directory, or None when the store is disabled."""
+    override = os.environ.get(_STORE_ENV)
+    if override:
+        if override.lower() in ("off", "0", "none"):
+            return None
+        return Path(override)
+    return _DEFAULT_STORE
+
+
+def _blob_path(root: Path, sha: str) -> Path:
+    return root / "blobs" / sha[:2] / sha
+
+
+def _unit_path(root: Path, manifest_hash: str) -> Path:
+    return root / "units" / manifest_hash[:2] / f"{manifest_hash}.json"
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _put_blob(root: Path, src: Path, sha: str) -> bool:
+    """Add ``src`` as blob ``sha``. Returns False if its bytes no longer match."""
+    dst = _blob_path(root, sha)
+    if dst.exists():
+        return True
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=str(dst.parent), prefix=".", suffix=".tmp")
+    os.close(fd)
+    try:
+        shutil.copyfile(src, tmp_path)
+        # The file may have changed since it was hashed; never store a
+        # blob under the wrong name.
+        if _sha256_file_uncached(Path(tmp_path)) != sha:
+            os.unlink(tmp_path)
+            return False
+        os.chmod(tmp_path, 0o444)
+        os.replace(tmp_path, dst)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return True
+
+
+def has_unit(manifest_hash: str) -> bool:
+    """Return True if the store holds a manifest for ``manifest_hash``."""
+    root = store_root()
+    return bool(root and manifest_hash and _unit_path(root, manifest_hash).is_file())
+
+
+def put_unit(
+    skill_path: Path, file_hashes: list[tuple[str, str]], manifest_hash: str
+) -> bool:
+    """Store a skill unit's blobs and manifest. Never raises on I/O errors.
+
+    ``file_hashes`` is the ``compute_file_manifest`` result for
+    ``skill_path``. Returns True if the unit is (now) in the store.
+    """
+    root = store_root()
+    if root is None:
+        return False
+    unit_path = _unit_path(root, manifest_hash)
+    if unit_path.is_file():
+        return True
+    parent = skill_path.parent
+    files: list[list] = []
+    try:
+        for rel, sha in file_hashes:
+            src = parent / rel
+            if not _put_blob(root, src, sha):
+                return False
+            files.append([rel, sha, os.access(src, os.X_OK)])
+        payload = {
+            "version": _UNIT_VERSION,
+            "manifest_hash": manifest_hash,
+            "anchor": skill_path.name,
+            "files": files,
+        }
+        _atomic_write_text(unit_path, json.dumps(payload, indent=1) + "\n")
+    except OSError:
+        return False
+    return True
+
+
+def load_unit(manifest_hash: str) -> dict | None:
+    """Return the stored unit manifest for ``manifest_hash``, or None."""
+    root = store_root()
+    if root is None or not manifest_hash:
+        return None
+    try:
+        with open(_unit_path(root, manifest_hash), encoding="utf-8") as f:
+            unit = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if unit.get("version") != _UNIT_VERSION:
+        return None
+    return unit
+
+
+def blob_path(sha: str) -> Path | None:
+    """Return the on-disk path of blob ``sha`` if present."""
+    root = store_root()
+    if root is None:
+        return None
+    path = _blob_path(root, sha)
+    return path if path.is_file() else None
+
+
+def materialize_unit(
+    manifest_hash: str,
+    dest_dir: Path,
+    strategy: str = DEFAULT_STRATEGY,
+    only: set[str] | None = None,
+) -> list[Path] | None:
+    """Write the stored unit ``manifest_hash`` into ``dest_dir``.
+
+    Returns the destination paths written, or None if the unit (or any
+    of its blobs) is not in the store — the caller falls back to copying
+    from the home repo. ``only`` restricts the write to those rel paths.
+    Never deletes anything.
+    """
+    unit = load_unit(manifest_hash)
+    if unit is None:
+        return None
+    root = store_root()
+    sources: list[tuple[Path, Path, bool]] = []
+    for rel, sha, executable in unit["files"]:
+        if only is not None and rel not in only:
+            continue
+        blob = _blob_path(root, sha)
+        if not blob.is_file():
+            return None
+        sources.append((blob, dest_dir / rel, bool(executable)))
+
+    written: list[Path] = []
+    for blob, dst, executable in sources:
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        used = place_file(blob, dst, strategy)
+        if used in ("copy", "reflink"):
+            # Independent inode: give it normal permissions rather than
+            # the blob's read-only mode.
+            os.chmod(dst, 0o755 if executable else 0o644)
+        written.append(dst)
+    return written
+
+
+def verify_unit(manifest_hash: str, dest_dir: Path) -> list[str] | None:
+    """Hash the deployed unit in ``dest_dir`` against its stored manifest.
+
+    Reads only the deployed bytes (never the source tree, never the hash
+    cache). Returns a list of problems (empty = verified), or None if the
+    manifest is not in the store.
+    """
+    unit = load_unit(manifest_hash)
+    if unit is None:
+        return None
+    problems: list[str] = []
+    for rel, sha, _executable in unit["files"]:
+        path = dest_dir / rel
+        if not path.is_file():
+            problems.append(f"missing {rel}")
+            continue
+        actual = _sha256_file_uncached(path)
+        if actual != sha:
+            problems.append(f"modified {rel} ({actual[:8]} != {sha[:8]})")
+    return problems
+
+
+def unit_files(manifest_hash: str) -> dict[str, str] | None:
+    """Return the stored per-file manifest ``{rel: sha256}``, or None."""
+    unit = load_unit(manifest_hash)
+    if unit is None:
+        return None
+    return {rel: sha for rel, sha, _executable in unit["files"]}
+
+
+def update_unit(
+    home_path: Path,
+    dest_dir: Path,
+    manifest_hash: str = "",
+    previous_hash: str = "",
+    strategy: str = DEFAULT_STRATEGY,
+) -> tuple[list[Path], list[Path]]:
+    """Bring an already-deployed unit in ``dest_dir`` up to date file by file.
+
+    The wanted per-file manifest is the stored unit for ``manifest_hash``
+    (the sidecar), falling back to hashing ``home_path``'s unit. It is
+    compared with the deployed files' hashes (both normally answered by
+    the hash cache), and only files that are missing or differ are
+    written: from the store when the unit is there, else placed from
+    the home repo.
+
+    A deployed file the new manifest lacks is unlinked only if the unit
+    we last deployed (``previous_hash``, per the registry) had it, so
+    files we have no record of deploying are left alone. Dirs emptied by
+    those unlinks (up to and including the sibling dir) are rmdir'd.
+    Returns ``(written, removed)`` paths.
+
+    Raises ``shutil.SameFileError`` if ``dest_dir`` is the unit's own
+    home dir: writing the registered bytes there would revert edits not
+    yet registered.
+    """
+    if is_same_entry(home_path, dest_dir / home_path.name):
+        raise shutil.SameFileError(f"{home_path} is the deploy target itself")
+    wanted = unit_files(manifest_hash) if manifest_hash else None
+    stored = wanted is not None
+    if wanted is None:
+        wanted = dict(compute_file_manifest(home_path))
+    have = dict(compute_file_manifest(dest_dir / home_path.name))
+    previous = (unit_files(previous_hash) if previous_hash else None) or {}
+
+    changed = sorted(rel for rel, sha in wanted.items() if have.get(rel) != sha)
+    stale = sorted(rel for rel in have if rel not in wanted and rel in previous)
+
+    written: list[Path] = []
+    if changed:
+        result = None
+        if stored:
+            result = materialize_unit(manifest_hash, dest_dir, strategy, only=set(changed))
+        if result is None:
+            result = []
+            for rel in changed:
+                dst = dest_dir / rel
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                place_file(home_path.parent / rel, dst, strategy)
+                result.append(dst)
+        written = result
+
+    removed: list[Path] = []
+    for rel in stale:
+        path = dest_dir / rel
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            continue
+        removed.append(path)
+    rmdir_emptied(removed, dest_dir / home_path.stem)
+    return written, removed
+
+
+def rmdir_emptied(removed: list[Path], sibling: Path) -> None:
+    """rmdir the dirs that held ``removed`` files, up to and including ``sibling``.
+
+    Only dirs a removed file lived in (and their parents below
+    ``sibling``) are tried, deepest first; rmdir fails on anything still
+    non-empty, which ends that chain. Other empty dirs are left alone.
+    """
+    parents: set[Path] = set()
+    for path in removed:
+        parent = path.parent
+        while parent != sibling and sibling in parent.parents:
+            parents.add(parent)
+            parent = parent.parent
+        if parent == sibling:
+            parents.add(sibling)
+    for directory in sorted(parents, key=lambda p: len(p.parts), reverse=True):
+        try:
+            directory.rmdir()
+        except OSError:
+            pass
+
+
+def store_stats() -> dict:
+    """Return ``{root, units, blobs, blob_bytes}`` for the store."""
+    root = store_root()
+    stats = {"root": str(root) if root else None, "units": 0, "blobs": 0, "blob_bytes": 0}
+    if root is None:
+        return stats
+    for path in (root / "units").glob("*/*.json"):
+        stats["units"] += 1
+    for path in (root / "blobs").glob("*/*"):
+        if path.name.startswith("."):
+            continue
+        stats["blobs"] += 1
+        stats["blob_bytes"] += path.stat().st_size
+    return stats
+
+
+def gc(referenced: set[str], apply: bool = False) -> dict:
+    """Drop units not in ``referenced`` and blobs no kept unit uses.
+
+    Returns ``{units: [hash], blobs: [sha], bytes: int}`` for what is (or,
+    without ``apply``, would be) removed. Per-file unlink only.
+    """
+    root = store_root()
+    out: dict = {"units": [], "blobs": [], "bytes": 0}
+    if root is None:
+        return out
+    live_blobs: set[str] = set()
+    for path in sorted((root / "units").glob("*/*.json")):
+        manifest_hash = path.stem
+        if manifest_hash in referenced:
+            unit = load_unit(manifest_hash)
+            for _rel, sha, _x in (unit or {}).get("files", []):
+                live_blobs.add(sha)
+            continue
+        out["units"].append(manifest_hash)
+        if apply:
+            path.unlink()
+    for path in sorted((root / "blobs").glob("*/*")):
+        if path.name.startswith(".") or path.name in live_blobs:
+            continue
+        out["blobs"].append(path.name)
+        out["bytes"] += path.stat().st_size
+        if apply:
+            path.unlink()
+    return out
@@ -0,0 +1,199 @@
+"""Cached view of AIAssistant's ``project_registry.yaml``.
+
+``inventory``, ``sync``, ``sync-repos``, ``migrate-domain-skills`` and
+``register`` all need the same things from the project registry: the raw
+project entries, each project's effective ``repo_path`` (inherited
+through ``parent`` when unset), and a repo-name -> root index. They used
+to parse the YAML and walk ``parent`` chains separately.
+
+``load_project_registry`` now parses the file once per process and
+rebuilds only when its mtime/size/inode changes. The returned
+``ProjectRegistry`` has everything precomputed, so lookups are dict
+reads.
+
+Inheritance is resolved once into a closure table (``_closure``) with
+parent cycles and dangling parents reported as ``diagnostics`` instead
+of silently stopping the walk; ``claude-skills projects resolve`` prints
+both.
+
+Path: ``~/Dropbox/Projects/AIAssistant/state/project_registry.yaml``, or
+``CLAUDE_SKILLS_PROJECT_REGISTRY_PATH`` (used by tests). A missing file
+is an empty registry. Parse errors propagate to the caller.
+
+Treat the returned object as read-only; the index methods return copies.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+from claude_skills import yaml_loader
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_AIASSISTANT_ROOT = Path.home() / "Dropbox" / "Projects" / "AIAssistant"
+_DEFAULT_PROJECT_REGISTRY = _AIASSISTANT_ROOT / "state" / "project_registry.yaml"
+_PROJECT_REGISTRY_ENV = "CLAUDE_SKILLS_PROJECT_REGISTRY_PATH"
+
+# Home repos that exist whether or not the registry lists them.
+_SPECIAL_HOMES = ("ClaudeCommands", "AIAssistant")
+
+
+def project_registry_path() -> Path:
+    """Resolve project_registry.yaml path, honoring the env override."""
+    override = os.environ.get(_PROJECT_REGISTRY_ENV)
+    if override:
+        return Path(override)
+    return _DEFAULT_PROJECT_REGISTRY
+
+
+def _closure(projects: dict) -> tuple[dict[str, tuple[str | None, str | None]], list[str]]:
+    """Resolve every project's effective ``repo_path`` in one pass.
+
+    Returns ``({project_id: (repo_path, source_project_id)}, diagnostics)``.
+    A project without ``repo_path`` inherits its nearest ancestor's;
+    ``source`` is the project that defines it. Each ``parent`` chain is
+    walked once: every project on a walk is memoized with the result,
+    so later walks stop at the first already-resolved ancestor (O(n)
+    overall instead of O(n * depth)).
+
+    A ``parent`` cycle without a ``repo_path`` on it, or a ``parent``
+    that is not a registered project, leaves the affected projects
+    unresolved ``(None, None)`` and is reported in ``diagnostics``.
+    """
+    resolved: dict[str, tuple[str | None, str | None]] = {}
+    diagnostics: list[str] = []
+    for start in projects:
+        if start in resolved:
+            continue
+        path: list[str] = []
+        on_path: dict[str, int] = {}
+        result: tuple[str | None, str | None] = (None, None)
+        pid = start
+        while True:
+            if pid in resolved:
+                result = resolved[pid]
+                break
+            if pid in on_path:
+                cycle = path[on_path[pid]:] + [pid]
+                diagnostics.append(f"parent cycle: {' -> '.join(cycle)}")
+                break
+            if pid not in projects:
+                diagnostics.append(
+                    f"{path[-1]}: parent {pid!r} is not a registered project"
+                )
+                break
+            on_path[pid] = len(path)
+            path.append(pid)
+            entry = projects[pid] or {}
+            if entry.get("repo_path"):
+                result = (entry["repo_path"], pid)
+                break
+            pid = entry.get("parent")
+            if not pid:
+                break
+        for p in path:
+            resolved[p] = result
+    return resolved, diagnostics
+
+
+class ProjectRegistry:
+    """Parsed project registry with precomputed lookups."""
+
+    def __init__(self, path: Path, projects: dict):
+        self.path = path
+        self.projects: dict = projects
+        # project_id -> (effective repo_path, project that defines it).
+        self.closure, self.diagnostics = _closure(projects)
+        self.repo_paths: dict[str, str] = {
+            pid: rp for pid, (rp, _src) in self.closure.items() if rp
+        }
+
+        # name (or project_id when unnamed) -> root; first project wins.
+        self._repo_index: dict[str, Path] = {}
+        for pid, info in projects.items():
+            rp = self.repo_paths.get(pid)
+            if rp:
+                name = (info or {}).get("name") or pid
+                self._repo_index.setdefault(name, Path(rp).expanduser())
+
+        # Non-empty name -> project_id; last project wins.
+        self.name_to_pid: dict[str, str] = {}
+        for pid, info in projects.items():
+            name = (info or {}).get("name", "")
+            if name:
+                self.name_to_pid[name] = pid
+
+        self._home_roots: dict[str, Path] | None = None
+
+    def repo_path(self, project_id: str) -> str | None:
+        """Effective ``repo_path`` of ``project_id`` (inherited), or None."""
+        return self.repo_paths.get(project_id)
+
+    def resolve(self, project_id: str) -> tuple[str | None, str | None]:
+        """``(repo_path, source_project_id)`` for ``project_id``; Nones if unresolved."""
+        return self.closure.get(project_id, (None, None))
+
+    def repo_index(self) -> dict[str, Path]:
+        """``{repo_name: root}`` for every project that resolves to a repo_path.
+
+        Keys are the human-readable ``name`` field (what skills put in
+        ``deploys_to_repos``), falling back to the project_id.
+        """
+        return dict(self._repo_index)
+
+    def home_roots(self) -> dict[str, Path]:
+        """``{repo_name: root}`` of home repos that exist on this machine.
+
+        ClaudeCommands (the repo this CLI lives in) and AIAssistant first,
+        then every registered project whose resolved root is a directory,
+        in registry order; the first project to claim a name wins.
+        """
+        if self._home_roots is None:
+            out: dict[str, Path] = {"ClaudeCommands": _REPO_ROOT}
+            if _AIASSISTANT_ROOT.is_dir():
+                out["AIAssistant"] = _AIASSISTANT_ROOT
+            for pid, info in self.projects.items():
+                name = (info or {}).get("name") or pid
+                if name in out or name in _SPECIAL_HOMES:
+                    continue
+                rp = self.repo_paths.get(pid)
+                if not rp:
+                    continue
+                root = Path(rp).expanduser()
+                if root.is_dir():
+                    out[name] = root
+            self._home_roots = out
+        return dict(self._home_roots)
+
+
+_cache: dict[Path, tuple[tuple | None, ProjectRegistry]] = {}
+_cache_lock = threading.Lock()
+
+
+def _fingerprint(path: Path) -> tuple | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def load_project_registry(path: Path | None = None) -> ProjectRegistry:
+    """Return the (cached) project registry; re-parsed only when the file changes."""
+    path = path or project_registry_path()
+    key = _fingerprint(path)
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+    projects: dict = {}
+    if key is not None and path.is_file():
+        with open(path) as f:
+            data = yaml_loader.safe_load(f) or {}
+        projects = data.get("projects", {}) or {}
+    registry = ProjectRegistry(path, projects)
+    with _cache_lock:
+        _cache[path] = (key, registry)
+    return registry
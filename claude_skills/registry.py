@@ -59,15 +59,32 @@ The three ``last_*`` maps stay separate by design:
   - ``sync-repos`` is a separate, opt-in command that writes into target
     repos' ``.claude/commands/`` and only produces commits when
     ``--commit`` is passed (claude-web snapshots, etc).
+
+Storage backends: the registry is a JSON document by default. A path
+ending in ``.db`` / ``.sqlite`` / ``.sqlite3`` (default path or
+``CLAUDE_SKILLS_REGISTRY_PATH``) selects the SQLite backend in
+``registry_sqlite``, which writes only the rows that changed. Both
+backends load and save the same dict.
+
+A JSON registry can additionally be journaled
+(``CLAUDE_SKILLS_REGISTRY_JOURNAL=1``, see ``registry_journal``): saves
+append small delta records and the full document is only rewritten at
+checkpoints.
 """
 
+import copy
 import json
 import os
 import tempfile
 from pathlib import Path
 
+from claude_skills import registry_journal
+
 _DEFAULT_REGISTRY_PATH = Path(__file__).resolve().parent.parent / "state" / "skill_registry.json"
 _REGISTRY_ENV = "CLAUDE_SKILLS_REGISTRY_PATH"
+# Path suffixes that select the SQLite backend. Checked here rather than
+# in registry_sqlite so JSON registries never import sqlite3.
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
 
 
 def _registry_path() -> Path:
@@ -78,23 +95,51 @@ def _registry_path() -> Path:
     return _DEFAULT_REGISTRY_PATH
 
 
+def _is_sqlite(path: Path) -> bool:
+    return path.suffix in SQLITE_SUFFIXES
+
+
+def _journal_fingerprint(path: Path) -> tuple:
+    """Cheap identity of (checkpoint, journal) on disk."""
+    out = []
+    for p in (path, registry_journal.journal_path(path)):
+        try:
+            st = p.stat()
+            out.append((st.st_size, st.st_mtime_ns, st.st_ino))
+        except FileNotFoundError:
+            out.append(None)
+    return tuple(out)
+
+
+# path -> (fingerprint, document) as of the last journaled load/save, so
+# a save can diff against it without re-reading the registry.
+_journal_base: dict[Path, tuple[tuple, dict]] = {}
+
+
+def _load_json(path: Path) -> dict:
+    if not path.exists():
+        data = {"version": 1, "skills": {}, "written_by_machine": None, "written_at": None}
+    else:
+        with open(path) as f:
+            data = json.load(f)
+    registry_journal.replay(data, path)
+    return data
+
+
 def load_registry(path: Path | None = None) -> dict:
     """Load the skill registry from disk."""
     path = path or _registry_path()
-    if not path.exists():
-        return {"version": 1, "skills": {}, "written_by_machine": None, "written_at": None}
-    with open(path) as f:
-        return json.load(f)
+    if _is_sqlite(path):
+        from claude_skills import registry_sqlite
 
+        return registry_sqlite.load(path)
+    data = _load_json(path)
+    if registry_journal.enabled():
+        _journal_base[path] = (_journal_fingerprint(path), copy.deepcopy(data))
+    return data
 
-def save_registry(data: dict, path: Path | None = None) -> None:
-    """Save the skill registry to disk atomically.
 
-    Writes to a sibling .tmp file, fsyncs, then os.replace's into the final
-    location. Prevents torn writes if the process crashes mid-write or two
-    writers race on the Dropbox-synced file.
-    """
-    path = path or _registry_path()
+def _write_json(data: dict, path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     fd, tmp_path = tempfile.mkstemp(
         dir=str(path.parent),
@@ -112,3 +157,53 @@ def save_registry(data: dict, path: Path | None = None) -> None:
         if os.path.exists(tmp_path):
             os.unlink(tmp_path)
         raise
+
+
+def save_registry(data: dict, path: Path | None = None) -> None:
+    """Save the skill registry to disk atomically.
+
+    Writes to a sibling .tmp file, fsyncs, then os.replace's into the final
+    location. Prevents torn writes if the process crashes mid-write or two
+    writers race on the Dropbox-synced file.
+
+    For a SQLite registry path, writes only the changed rows instead. With
+    registry journaling on, appends a delta record and only rewrites the
+    file once the journal is due for a checkpoint.
+    """
+    path = path or _registry_path()
+    if _is_sqlite(path):
+        from claude_skills import registry_sqlite
+
+        registry_sqlite.save(data, path)
+        return
+    if not registry_journal.enabled():
+        _write_json(data, path)
+        registry_journal.discard(path)
+        return
+
+    cached = _journal_base.get(path)
+    if cached is not None and cached[0] == _journal_fingerprint(path):
+        base = cached[1]
+    else:
+        base = _load_json(path)
+    ops = registry_journal.diff_ops(base, data)
+    if ops:
+        size = registry_journal.append(path, ops)
+        if size >= registry_journal.checkpoint_bytes():
+            _write_json(data, path)
+            registry_journal.discard(path)
+    _journal_base[path] = (_journal_fingerprint(path), copy.deepcopy(data))
+
+
+def checkpoint_registry(path: Path | None = None) -> int:
+    """Fold the journal into the JSON registry. Returns records folded."""
+    path = path or _registry_path()
+    if _is_sqlite(path):
+        return 0
+    data = _load_json(path)
+    folded = registry_journal.replay({}, path)
+    if folded:
+        _write_json(data, path)
+        registry_journal.discard(path)
+    _journal_base.pop(path, None)
+    return folded
@@ -0,0 +1,154 @@
+"""Write-ahead journal for the JSON skill registry.
+
+``save_registry`` normally re-serializes the whole document with
+``indent=2`` and fsyncs it, once per ``register`` / ``retire`` / ``sync``.
+With ``CLAUDE_SKILLS_REGISTRY_JOURNAL=1`` it instead appends one small
+delta record to a journal next to the registry and only rewrites the
+JSON (a *checkpoint*) once the journal passes
+``CLAUDE_SKILLS_REGISTRY_JOURNAL_BYTES`` (default 256 KiB), or on
+``claude-skills registry checkpoint``:
+
+    state/skill_registry.json           last checkpoint
+    state/skill_registry.json.journal   deltas since then, one per line
+
+    {"ts": "...", "ops": [["set", ["skills", "foo", "last_deploy", "m"], {...}],
+                          ["del", ["skills", "bar"]]]}
+
+Ops are absolute (set a value at a path / delete a path), so replaying a
+record twice is harmless: a crash between writing the checkpoint and
+removing the journal just replays deltas the JSON already has.
+
+``load_registry`` always replays an existing journal, whether or not the
+env var is set, so callers never see a stale registry; a ``save`` with
+journaling off checkpoints and removes it. A torn final line (crash
+mid-append) is ignored. Anything that reads ``skill_registry.json``
+directly (scripts, other machines via Dropbox, ``git diff``) sees the
+last checkpoint only — run ``registry checkpoint`` first.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+_JOURNAL_ENV = "CLAUDE_SKILLS_REGISTRY_JOURNAL"
+_JOURNAL_BYTES_ENV = "CLAUDE_SKILLS_REGISTRY_JOURNAL_BYTES"
+_DEFAULT_JOURNAL_BYTES = 256 * 1024
+
+
+def enabled() -> bool:
+    """Return True if delta journaling is switched on."""
+    return os.environ.get(_JOURNAL_ENV, "") not in ("", "0")
+
+
+def checkpoint_bytes() -> int:
+    """Journal size that triggers a checkpoint."""
+    try:
+        return int(os.environ.get(_JOURNAL_BYTES_ENV, "")) or _DEFAULT_JOURNAL_BYTES
+    except ValueError:
+        return _DEFAULT_JOURNAL_BYTES
+
+
+def journal_path(registry_path: Path) -> Path:
+    """Return the journal path for a JSON registry."""
+    return registry_path.with_name(registry_path.name + ".journal")
+
+
+def diff_ops(old, new, prefix: list | None = None) -> list[list]:
+    """Return the set/del ops that turn ``old`` into ``new``.
+
+    Recurses through dicts, so a ``last_deploy`` update for one machine
+    is one small op rather than the whole skill entry.
+    """
+    prefix = prefix or []
+    if not (isinstance(old, dict) and isinstance(new, dict)):
+        return [] if old == new else [["set", prefix, new]]
+    ops: list[list] = []
+    for key in old:
+        if key not in new:
+            ops.append(["del", prefix + [key]])
+    for key, value in new.items():
+        if key not in old:
+            ops.append(["set", prefix + [key], value])
+        else:
+            ops.extend(diff_ops(old[key], value, prefix + [key]))
+    return ops
+
+
+def _apply(data: dict, op: list) -> None:
+    kind, path = op[0], op[1]
+    if not path:
+        if kind == "set":
+            data.clear()
+            data.update(op[2])
+        return
+    node = data
+    for key in path[:-1]:
+        child = node.get(key)
+        if not isinstance(child, dict):
+            if kind == "del":
+                return
+            child = node[key] = {}
+        node = child
+    if kind == "set":
+        node[path[-1]] = op[2]
+    else:
+        node.pop(path[-1], None)
+
+
+def replay(data: dict, registry_path: Path) -> int:
+    """Apply the journal for ``registry_path`` to ``data`` in place.
+
+    Returns the number of records applied (0 if there is no journal).
+    """
+    jpath = journal_path(registry_path)
+    try:
+        with open(jpath, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return 0
+    applied = 0
+    for line in raw.split(b"\n"):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            # Torn write from a crash mid-append; skip it.
+            continue
+        for op in record.get("ops") or []:
+            _apply(data, op)
+        applied += 1
+    return applied
+
+
+def append(registry_path: Path, ops: list[list]) -> int:
+    """Append one delta record (fsynced). Returns the journal's new size."""
+    jpath = journal_path(registry_path)
+    jpath.parent.mkdir(parents=True, exist_ok=True)
+    record = {
+        "ts": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "ops": ops,
+    }
+    line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+    fd = os.open(jpath, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        size = os.fstat(fd).st_size
+        if size and os.pread(fd, 1, size - 1) != b"\n":
+            # Terminate a torn line so this record starts on its own.
+            line = b"\n" + line
+        os.write(fd, line)
+        os.fsync(fd)
+        return os.fstat(fd).st_size
+    finally:
+        os.close(fd)
+
+
+def discard(registry_path: Path) -> None:
+    """Remove the journal after a checkpoint."""
+    try:
+        journal_path(registry_path).unlink()
+    except FileNotFoundError:
+        pass
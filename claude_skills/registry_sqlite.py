@@ -0,0 +1,208 @@
+"""SQLite backend for the skill registry.
+
+Selected by ``registry.load_registry`` / ``save_registry`` when the
+registry path ends in ``.db``, ``.sqlite`` or ``.sqlite3`` (e.g.
+``CLAUDE_SKILLS_REGISTRY_PATH=~/.local/state/claude-skills/registry.db``).
+The in-memory shape is identical to the JSON registry, so no caller
+changes.
+
+Tables (WAL journal mode):
+
+    meta                 (key, value)           top-level registry fields
+    skills               (key, data)            one row per skill, minus
+                                                the three last_* maps
+    last_deploy          (skill, target, data)  one row per machine
+    last_repo_deploy     (skill, target, data)  one row per target repo
+    last_runtime_deploy  (skill, target, data)  one row per runtime repo
+    generation           (id, n)                bumped by every save
+
+Every ``data``/``value`` column is the compact JSON of that piece.
+``load`` remembers the rows it read (per path, with the generation);
+``save`` diffs the new document against that snapshot in memory and,
+inside one ``BEGIN IMMEDIATE`` transaction, writes only rows that
+changed, so a ``register`` / ``retire`` / single-skill ``sync`` touches
+a handful of rows instead of reading or rewriting the whole database.
+If another process saved in between (generation moved) or nothing was
+loaded from this path, ``save`` falls back to reading the stored rows
+to diff against. Row order (``rowid``) preserves dict insertion order
+on load.
+
+Loading a path that does not exist returns an empty registry without
+creating the database; the first ``save`` creates it.
+
+The database is machine-local. Use ``claude-skills registry export`` to
+write the human-readable JSON (e.g. the Dropbox-synced
+``state/skill_registry.json``) and ``registry import`` to load one.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+
+CHILD_TABLES = ("last_deploy", "last_repo_deploy", "last_runtime_deploy")
+_SCHEMA_VERSION = 2
+# Marks where "skills" sits among the top-level keys.
+_SKILLS_MARKER = "skills"
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(path), timeout=30, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    # WAL + NORMAL cannot corrupt the database; a power cut can at most
+    # drop the last committed transaction.
+    conn.execute("PRAGMA synchronous=NORMAL")
+    if conn.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION:
+        conn.executescript(
+            """
+            BEGIN;
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS skills (key TEXT PRIMARY KEY, data TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS generation (id INTEGER PRIMARY KEY CHECK (id = 0), n INTEGER);
+            INSERT OR IGNORE INTO generation (id, n) VALUES (0, 0);
+            """
+            + "".join(
+                f"CREATE TABLE IF NOT EXISTS {t} (skill TEXT NOT NULL, target TEXT NOT NULL,"
+                f" data TEXT NOT NULL, PRIMARY KEY (skill, target));"
+                for t in CHILD_TABLES
+            )
+            + f"PRAGMA user_version={_SCHEMA_VERSION}; COMMIT;"
+        )
+    return conn
+
+
+def _split(data: dict) -> tuple[list[tuple[str, str | None]], dict[str, str], dict[str, dict]]:
+    """Flatten a registry document into (meta, skill rows, child rows)."""
+    meta: list[tuple[str, str | None]] = []
+    for key, value in data.items():
+        meta.append((key, None if key == _SKILLS_MARKER else _dumps(value)))
+    skills: dict[str, str] = {}
+    children: dict[str, dict] = {t: {} for t in CHILD_TABLES}
+    for skill_key, entry in (data.get("skills") or {}).items():
+        row = dict(entry)
+        for table in CHILD_TABLES:
+            value = row.get(table)
+            if isinstance(value, dict):
+                # Keep the key's position in the entry; rows hold the values.
+                row[table] = {}
+                for target, info in value.items():
+                    children[table][(skill_key, target)] = _dumps(info)
+        skills[skill_key] = _dumps(row)
+    return meta, skills, children
+
+
+# path -> (generation, meta, skills, children) as of the last load/save
+# through this process, so a save can diff without reading every row.
+_base: dict[Path, tuple[int, list, dict[str, str], dict[str, dict]]] = {}
+
+
+def _empty() -> dict:
+    return {"version": 1, "skills": {}, "written_by_machine": None, "written_at": None}
+
+
+def _generation(conn: sqlite3.Connection) -> int:
+    return conn.execute("SELECT n FROM generation WHERE id = 0").fetchone()[0]
+
+
+def _read_rows(conn: sqlite3.Connection) -> tuple[list, dict[str, str], dict[str, dict]]:
+    """Stored (meta, skill rows, child rows), in ``_split``'s shape."""
+    meta = [tuple(r) for r in conn.execute("SELECT key, value FROM meta ORDER BY rowid")]
+    skills = dict(conn.execute("SELECT key, data FROM skills ORDER BY rowid"))
+    children: dict[str, dict] = {}
+    for table in CHILD_TABLES:
+        children[table] = {
+            (s, t): d
+            for s, t, d in conn.execute(
+                f"SELECT skill, target, data FROM {table} ORDER BY rowid"
+            )
+        }
+    return meta, skills, children
+
+
+def load(path: Path) -> dict:
+    """Load a registry document from the SQLite database at ``path``."""
+    if not path.exists():
+        _base.pop(path, None)
+        return _empty()
+    conn = _connect(path)
+    try:
+        conn.execute("BEGIN")
+        try:
+            generation = _generation(conn)
+            meta, skill_rows, children = _read_rows(conn)
+        finally:
+            conn.execute("COMMIT")
+    finally:
+        conn.close()
+    _base[path] = (generation, meta, skill_rows, children)
+
+    skills: dict[str, dict] = {key: json.loads(data) for key, data in skill_rows.items()}
+    for table in CHILD_TABLES:
+        for (skill_key, target), data in children[table].items():
+            entry = skills.get(skill_key)
+            if entry is not None:
+                entry.setdefault(table, {})[target] = json.loads(data)
+    if not meta:
+        out = _empty()
+        out["skills"] = skills
+        return out
+    out = {}
+    for key, value in meta:
+        out[key] = skills if key == _SKILLS_MARKER else json.loads(value)
+    out.setdefault("skills", skills)
+    return out
+
+
+def save(data: dict, path: Path) -> None:
+    """Write ``data`` to ``path``, touching only rows that changed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    meta, skills, children = _split(data)
+    conn = _connect(path)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            generation = _generation(conn)
+            cached = _base.get(path)
+            if cached is not None and cached[0] == generation:
+                _gen, old_meta, old_skills, old_children = cached
+            else:
+                old_meta, old_skills, old_children = _read_rows(conn)
+
+            if old_meta != meta:
+                conn.execute("DELETE FROM meta")
+                conn.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", meta)
+
+            gone = [(k,) for k in old_skills if k not in skills]
+            conn.executemany("DELETE FROM skills WHERE key = ?", gone)
+            conn.executemany(
+                "INSERT INTO skills (key, data) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET data = excluded.data",
+                [(k, v) for k, v in skills.items() if old_skills.get(k) != v],
+            )
+
+            for table in CHILD_TABLES:
+                old_rows = old_children[table]
+                new_rows = children[table]
+                conn.executemany(
+                    f"DELETE FROM {table} WHERE skill = ? AND target = ?",
+                    [k for k in old_rows if k not in new_rows],
+                )
+                conn.executemany(
+                    f"INSERT INTO {table} (skill, target, data) VALUES (?, ?, ?) "
+                    "ON CONFLICT(skill, target) DO UPDATE SET data = excluded.data",
+                    [(s, t, d) for (s, t), d in new_rows.items() if old_rows.get((s, t)) != d],
+                )
+            conn.execute("UPDATE generation SET n = n + 1 WHERE id = 0")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            _base.pop(path, None)
+            raise
+    finally:
+        conn.close()
+    _base[path] = (generation + 1, meta, skills, children)
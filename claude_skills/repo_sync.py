@@ -32,32 +32,24 @@ Hard rules (mirrored from ``sync.py``):
 
 from __future__ import annotations
 
-import os
 import shutil
 import subprocess
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
-import yaml
-
+from claude_skills import gitio
+from claude_skills.deploy import (
+    DEFAULT_STRATEGY,
+    is_same_entry,
+    place_file,
+    validate_strategy,
+)
 from claude_skills.manifest import compute_manifest_hash, list_skill_units
+from claude_skills.object_store import materialize_unit, update_unit
+from claude_skills.projects import load_project_registry
 from claude_skills.registry import load_registry, save_registry
-
-
-# Where to look for AIAssistant's project_registry.yaml. Same convention
-# as inventory.py. Tests can override via the env var below.
-_DEFAULT_PROJECT_REGISTRY = (
-    Path.home() / "Dropbox" / "Projects" / "AIAssistant" / "state" / "project_registry.yaml"
-)
-_PROJECT_REGISTRY_ENV = "CLAUDE_SKILLS_PROJECT_REGISTRY_PATH"
-
-
-def _project_registry_path() -> Path:
-    """Return the path to project_registry.yaml, honoring the env override."""
-    override = os.environ.get(_PROJECT_REGISTRY_ENV)
-    if override:
-        return Path(override)
-    return _DEFAULT_PROJECT_REGISTRY
+from claude_skills.workers import map_ordered
 
 
 def _now_iso() -> str:
@@ -65,50 +57,6 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
-def _load_projects() -> dict:
-    """Return projects dict from AIAssistant project_registry.yaml.
-
-    Each entry has at minimum ``name`` and (optionally) ``repo_path``.
-    """
-    path = _project_registry_path()
-    if not path.exists():
-        return {}
-    with open(path) as f:
-        data = yaml.safe_load(f) or {}
-    return data.get("projects", {}) or {}
-
-
-def _resolve_repo_path_with_ancestors(project_id: str, projects: dict) -> str | None:
-    """Walk parent chain to find inherited ``repo_path`` (mirrors AIAssistant)."""
-    visited: set[str] = set()
-    pid = project_id
-    while pid and pid not in visited:
-        visited.add(pid)
-        entry = projects.get(pid, {}) or {}
-        rp = entry.get("repo_path")
-        if rp:
-            return rp
-        pid = entry.get("parent")
-    return None
-
-
-def _build_repo_index(projects: dict) -> dict[str, Path]:
-    """Build {repo_name: Path} map for projects that resolve to a repo_path.
-
-    Keys are the human-readable ``name`` field (e.g. ``AgentForge``) since
-    that is what skills put in their frontmatter ``deploys_to_repos``.
-    Falls back to the project_id when ``name`` is missing.
-    """
-    index: dict[str, Path] = {}
-    for pid, info in (projects or {}).items():
-        rp = _resolve_repo_path_with_ancestors(pid, projects)
-        if not rp:
-            continue
-        repo_name = (info or {}).get("name") or pid
-        index.setdefault(repo_name, Path(rp).expanduser())
-    return index
-
-
 def _expand_targets(
     deploys_to_repos: list[str], repo_index: dict[str, Path]
 ) -> list[str]:
@@ -131,46 +79,70 @@ def _expand_targets(
     return out
 
 
-def _git_run(
-    repo_root: Path, args: list[str], *, check: bool = True
-) -> subprocess.CompletedProcess:
-    """Run ``git <args>`` inside ``repo_root``."""
-    return subprocess.run(
-        ["git", *args],
-        cwd=str(repo_root),
-        capture_output=True,
-        text=True,
-        check=check,
+_git_run = gitio.run
+
+
+# Fallback batch size for gits without --pathspec-from-file (< 2.26):
+# well under any platform's ARG_MAX for repo-relative paths.
+_GIT_ARGV_CHUNK = 256
+
+
+def _git_batch(
+    repo_root: Path, args: list[str], paths: list[Path], *, check: bool = True
+) -> None:
+    """Run ``git <args>`` over ``paths`` in one process (or a few, on old git).
+
+    Paths are fed NUL-separated on stdin via ``--pathspec-from-file`` and
+    ``--literal-pathspecs``, so names with spaces, newlines or glob
+    characters are taken verbatim.
+    """
+    if not paths:
+        return
+    rels = [str(p.relative_to(repo_root)) if p.is_absolute() else str(p) for p in paths]
+    ret = _git_run(
+        repo_root,
+        ["--literal-pathspecs", *args, "--pathspec-from-file=-", "--pathspec-file-nul"],
+        check=False,
+        input="\0".join(rels) + "\0",
     )
+    if ret.returncode == 0:
+        return
+    if "pathspec-from-file" not in (ret.stderr or ""):
+        if check:
+            raise subprocess.CalledProcessError(
+                ret.returncode, ret.args, ret.stdout, ret.stderr
+            )
+        return
+    for i in range(0, len(rels), _GIT_ARGV_CHUNK):
+        _git_run(
+            repo_root,
+            ["--literal-pathspecs", *args, "--", *rels[i : i + _GIT_ARGV_CHUNK]],
+            check=check,
+        )
 
 
 def _is_git_worktree(repo_root: Path) -> bool:
     """Return True if ``repo_root`` is the top of a git working tree."""
-    try:
-        ret = _git_run(repo_root, ["rev-parse", "--show-toplevel"], check=False)
-    except (OSError, FileNotFoundError):
-        return False
-    if ret.returncode != 0:
-        return False
-    return Path(ret.stdout.strip()).resolve() == repo_root.resolve()
+    return gitio.is_worktree(repo_root)
 
 
-def _has_uncommitted_outside(repo_root: Path, allowed_prefix: str) -> list[str]:
+def _has_uncommitted_outside(
+    repo_root: Path, allowed_prefix: str, *, untracked: bool = True
+) -> list[str]:
     """Return paths that are dirty in ``repo_root`` and live outside ``allowed_prefix``.
 
-    Uses ``git status --porcelain`` and filters out untracked-ignored
-    paths (lines starting with ``!!``). The ``allowed_prefix`` is
-    repo-relative (e.g. ``.claude/commands/``).
+    Uses ``git status --porcelain`` with ``allowed_prefix`` excluded by
+    pathspec, so git never walks it. The ``allowed_prefix`` is
+    repo-relative (e.g. ``.claude/commands/``). ``untracked=False``
+    ignores untracked files (``--untracked-files=no``).
     """
     if not _is_git_worktree(repo_root):
         return []
-    ret = _git_run(repo_root, ["status", "--porcelain"], check=False)
-    if ret.returncode != 0:
+    lines = gitio.repo(repo_root).status(exclude=allowed_prefix, untracked=untracked)
+    if lines is None:
         return []
     out: list[str] = []
-    for line in ret.stdout.splitlines():
-        if not line:
-            continue
+    for line in lines:
         # Format: "XY <path>" (XY is two status chars, then space).
         # Ignored entries start with "!!"; we never see them without -i.
         path = line[3:].strip()
@@ -194,17 +166,33 @@ def _build_target_manifest(commands_dir: Path) -> dict[str, str]:
     return {a.stem: compute_manifest_hash(a) for a in anchors}
 
 
-def _copy_skill_unit(home_path: Path, dest_dir: Path) -> list[Path]:
+def _copy_skill_unit(
+    home_path: Path,
+    dest_dir: Path,
+    strategy: str = DEFAULT_STRATEGY,
+    manifest_hash: str = "",
+) -> list[Path]:
     """Copy a skill unit (anchor + sibling dir) into ``dest_dir``.
 
-    Returns the list of destination file paths written/overwritten so the
-    caller can stage them in git.
+    Materialized from the object store when ``manifest_hash`` is stored
+    there, else placed from ``home_path`` with ``deploy.place_file`` (see
+    ``sync_repos`` ``strategy``). Returns the list of destination file
+    paths written/overwritten so the caller can stage them in git.
+    Raises ``shutil.SameFileError`` if ``dest_dir`` is the unit's own dir.
     """
+    dest_anchor = dest_dir / home_path.name
+    if is_same_entry(home_path, dest_anchor):
+        # Legacy-home unit mirrored into its own dir: materializing the
+        # registered bytes would revert unregistered edits to the source.
+        raise shutil.SameFileError(f"{home_path} is the deploy target itself")
     dest_dir.mkdir(parents=True, exist_ok=True)
+    if manifest_hash:
+        stored = materialize_unit(manifest_hash, dest_dir, strategy)
+        if stored is not None:
+            return stored
     written: list[Path] = []
     # Anchor.
-    dest_anchor = dest_dir / home_path.name
-    shutil.copy2(home_path, dest_anchor)
+    place_file(home_path, dest_anchor, strategy)
     written.append(dest_anchor)
     # Sibling dir if present.
     sibling = home_path.parent / home_path.stem
@@ -216,7 +204,7 @@ def _copy_skill_unit(home_path: Path, dest_dir: Path) -> list[Path]:
             rel = src_file.relative_to(sibling)
             dst_file = dest_sibling / rel
             dst_file.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src_file, dst_file)
+            place_file(src_file, dst_file, strategy)
             written.append(dst_file)
     return written
 
@@ -254,13 +242,7 @@ def _remove_skill_unit(commands_dir: Path, skill_key: str) -> list[Path]:
 
 def _short_sha(repo_root: Path) -> str:
     """Return short HEAD sha of ``repo_root`` or empty string on failure."""
-    try:
-        ret = _git_run(repo_root, ["rev-parse", "--short", "HEAD"], check=False)
-    except (OSError, FileNotFoundError):
-        return ""
-    if ret.returncode != 0:
-        return ""
-    return ret.stdout.strip()
+    return gitio.head_short(repo_root)
 
 
 def _source_repo_short_sha() -> str:
@@ -351,6 +333,225 @@ def _classify_repo(
     }
 
 
+def _process_repo(
+    repo_name: str,
+    skills_for_repo: dict[str, dict],
+    repo_path: Path | None,
+    registry_skills: dict,
+    *,
+    apply: bool,
+    commit: bool,
+    force: bool,
+    untracked: bool,
+    skill: str | None,
+    strategy: str,
+    source_sha: str,
+    now: str,
+) -> tuple[dict, list[tuple[str, dict | None]]]:
+    """Plan (and optionally apply) one target repo.
+
+    Safe to run concurrently for different repos: it only reads
+    ``registry_skills``. Returns ``(repo_plan, updates)`` where
+    ``updates`` lists ``(skill_key, last_repo_deploy record)`` to set,
+    or ``(skill_key, None)`` to drop, for the caller to apply.
+    """
+    repo_plan: dict = {
+        "repo_path": None,
+        "skipped": False,
+        "reason": None,
+        "add": [],
+        "update": [],
+        "unchanged": [],
+        "remove": [],
+        "errors": [],
+        "warnings": [],
+        "commit": None,
+        "guard": None,
+    }
+    if repo_path is None:
+        repo_plan["skipped"] = True
+        repo_plan["reason"] = (
+            f"no repo_path for {repo_name!r} in project_registry.yaml — "
+            "add a repo_path or update the skill's deploys_to_repos."
+        )
+        return repo_plan, []
+    repo_plan["repo_path"] = str(repo_path)
+
+    if not _is_git_worktree(repo_path):
+        repo_plan["skipped"] = True
+        repo_plan["reason"] = f"{repo_path} is not a git working tree."
+        return repo_plan, []
+
+    # Self-clobber guard: skill home_repo == this target.
+    skills_for_repo = dict(skills_for_repo)
+    for key in list(skills_for_repo.keys()):
+        entry = skills_for_repo[key]
+        if entry.get("home_repo") == repo_name:
+            repo_plan["errors"].append(
+                f"refused: skill {key!r} has home_repo={repo_name!r}; "
+                "would clobber its own source. Edit the skill's "
+                "frontmatter (drop this repo from deploys_to_repos) "
+                "and run `claude-skills register --update`."
+            )
+            # Remove from active deploy set; do NOT classify as remove
+            # either (we never had a clean deploy record for it).
+            del skills_for_repo[key]
+
+    # Dirty-tree guard. Only meaningful when --commit is requested,
+    # since otherwise we're not modifying git state. Without --commit
+    # we still skip if the repo is dirty — leaving extra unstaged
+    # files in someone's working tree without telling them is rude.
+    started = time.perf_counter()
+    dirty = _has_uncommitted_outside(
+        repo_path, ".claude/commands/", untracked=untracked
+    )
+    repo_plan["guard"] = {
+        "ms": round((time.perf_counter() - started) * 1000, 1),
+        "untracked": untracked,
+        **gitio.repo(repo_path).features(),
+    }
+    if dirty:
+        if force:
+            repo_plan["warnings"].append(
+                f"--force in effect; {len(dirty)} uncommitted path(s) "
+                f"outside .claude/commands/ ignored (first: {dirty[0]})."
+            )
+        else:
+            repo_plan["skipped"] = True
+            repo_plan["reason"] = (
+                f"{len(dirty)} uncommitted path(s) outside "
+                f".claude/commands/ in {repo_path} (first: {dirty[0]}). "
+                "Pass --force to override."
+            )
+            return repo_plan, []
+
+    # Classify.
+    commands_dir = repo_path / ".claude" / "commands"
+    target_manifest = _build_target_manifest(commands_dir)
+    cls = _classify_repo(
+        skills_for_repo,
+        target_manifest,
+        registry_skills,
+        repo_name,
+        skill_filter=skill,
+    )
+    repo_plan["add"] = cls["add"]
+    repo_plan["update"] = cls["update"]
+    repo_plan["unchanged"] = cls["unchanged"]
+    repo_plan["remove"] = cls["remove"]
+
+    if not apply:
+        return repo_plan, []
+
+    # ---- APPLY ----
+
+    # Track old hashes for the update entries so the commit message
+    # can show "old7 -> new7".
+    update_pairs: list[tuple[str, str, str]] = []
+    for key in cls["update"]:
+        old_hash = target_manifest.get(key, "")[:7]
+        new_hash = skills_for_repo[key].get("manifest_hash", "")[:7]
+        update_pairs.append((key, old_hash, new_hash))
+
+    # Pass 1: copy adds + updates.
+    all_written: list[Path] = []
+    all_removed: list[Path] = []
+    for key in cls["add"] + cls["update"]:
+        entry = skills_for_repo[key]
+        home_path = Path(entry["home_path"])
+        if not home_path.is_file():
+            repo_plan["errors"].append(
+                f"missing home_path for {key}: {home_path}"
+            )
+            continue
+        try:
+            if key in cls["update"]:
+                # Only changed files; stale sibling files of the unit we
+                # last deployed here are unlinked (and git rm'd below).
+                previous = (
+                    (registry_skills.get(key, {}).get("last_repo_deploy") or {})
+                    .get(repo_name) or {}
+                )
+                written, stale = update_unit(
+                    home_path,
+                    commands_dir,
+                    entry.get("manifest_hash", ""),
+                    previous.get("hash", ""),
+                    strategy,
+                )
+                all_removed.extend(stale)
+            else:
+                written = _copy_skill_unit(
+                    home_path, commands_dir, strategy, entry.get("manifest_hash", "")
+                )
+            all_written.extend(written)
+        except OSError as exc:
+            repo_plan["errors"].append(f"copy failed for {key}: {exc}")
+
+    # Pass 2: removals.
+    for key in cls["remove"]:
+        try:
+            removed = _remove_skill_unit(commands_dir, key)
+            all_removed.extend(removed)
+        except OSError as exc:
+            repo_plan["errors"].append(f"remove failed for {key}: {exc}")
+
+    # Pass 3: stage + commit only when --commit was requested.
+    diff_nonempty = bool(all_written or all_removed)
+    if commit and diff_nonempty:
+        try:
+            # One git process each for add and rm, however many files.
+            _git_batch(repo_path, ["add"], all_written)
+            # We rely on pass 2 having unlinked from disk.
+            _git_batch(
+                repo_path,
+                ["rm", "--cached", "--ignore-unmatch", "--quiet"],
+                all_removed,
+                check=False,
+            )
+
+            # Detect whether anything is actually staged.
+            ret_status = _git_run(
+                repo_path, ["diff", "--cached", "--name-only"], check=False
+            )
+            staged = [
+                ln
+                for ln in (ret_status.stdout or "").splitlines()
+                if ln.strip()
+            ]
+            if staged:
+                msg = _format_commit_message(
+                    cls["add"], update_pairs, cls["remove"], source_sha
+                )
+                _git_run(repo_path, ["commit", "-m", msg])
+                gitio.repo(repo_path).head_changed()
+                repo_plan["commit"] = _short_sha(repo_path)
+            # else: nothing staged (e.g. files identical / gitignored
+            # in the post-pivot world); skip commit silently.
+        except subprocess.CalledProcessError as exc:
+            repo_plan["errors"].append(
+                f"git stage/commit failed: {exc.stderr or exc.stdout or exc}"
+            )
+            return repo_plan, []
+
+    # Collect last_repo_deploy updates; the caller applies them.
+    commit_short = repo_plan["commit"] or ""
+    updates: list[tuple[str, dict | None]] = []
+    for key in cls["add"] + cls["update"]:
+        entry = registry_skills.get(key)
+        if entry is None:
+            continue
+        updates.append((key, {
+            "hash": entry.get("manifest_hash", ""),
+            "ts": now,
+            "action": "add" if key in cls["add"] else "update",
+            "commit": commit_short,
+        }))
+    for key in cls["remove"]:
+        updates.append((key, None))
+    return repo_plan, updates
+
+
 def sync_repos(
     *,
     apply: bool = False,
@@ -358,6 +559,9 @@ def sync_repos(
     skill: str | None = None,
     force: bool = False,
     commit: bool = False,
+    strategy: str = DEFAULT_STRATEGY,
+    jobs: int | None = 1,
+    untracked: bool = True,
 ) -> dict:
     """Plan (and optionally apply) a sync of skills into target repos.
 
@@ -367,6 +571,20 @@ def sync_repos(
     pivot: ``.claude/commands/`` is gitignored after Step 2 migration so
     the staged-and-commit path becomes a no-op anyway.
 
+    ``strategy`` selects how files are placed (see ``claude_skills.deploy``).
+    ``symlink`` is refused together with ``commit=True``: the commit would
+    record absolute links into the deploying machine's home repos.
+
+    ``untracked=False`` (CLI ``--ignore-untracked``) leaves untracked
+    files out of the dirty-tree guard. That is safe with or without
+    ``commit``: only the paths we wrote are ever staged, so an untracked
+    file can never end up in our commit; it only speeds up the guard on
+    trees full of untracked build output.
+
+    ``jobs`` bounds how many target repos are processed at once (see
+    ``workers.resolve_jobs``; 1 = serial). The plan and registry updates
+    are the same for any value.
+
     Returns a plan dict:
 
         {
@@ -380,16 +598,24 @@ def sync_repos(
                     "add": [...], "update": [...], "unchanged": [...], "remove": [...],
                     "errors": [...],
                     "commit": "<short-sha>" | None,
+                    "guard": {"ms", "untracked", "fsmonitor",
+                              "untracked_cache"} | None,
                 }
             },
             "errors": [...],          # global errors (e.g. unknown repo)
         }
     """
+    strategy = validate_strategy(strategy)
+    if commit and strategy == "symlink":
+        raise ValueError(
+            "deploy strategy 'symlink' cannot be combined with --commit "
+            "(the commit would contain machine-local absolute links)"
+        )
+
     registry = load_registry()
     registry_skills: dict = registry.get("skills", {}) or {}
 
-    projects = _load_projects()
-    repo_index = _build_repo_index(projects)
+    repo_index = load_project_registry().repo_index()
 
     plan: dict = {
         "mode": "apply" if apply else "dry-run",
@@ -438,185 +664,48 @@ def sync_repos(
             )
         return plan
 
-    # Process each repo independently.
+    # Process each repo independently. Repos share nothing on disk, so the
+    # per-repo plan/apply (dominated by git subprocesses) fans out over a
+    # bounded pool; registry updates are collected and applied below in
+    # sorted repo order so the result is identical for any ``jobs``.
     source_sha = _source_repo_short_sha()
     now = _now_iso()
 
-    for repo_name in sorted(by_repo.keys()):
-        repo_plan: dict = {
-            "repo_path": None,
-            "skipped": False,
-            "reason": None,
-            "add": [],
-            "update": [],
-            "unchanged": [],
-            "remove": [],
-            "errors": [],
-            "warnings": [],
-            "commit": None,
-        }
-        plan["repos"][repo_name] = repo_plan
-
-        repo_path = repo_index.get(repo_name)
-        if repo_path is None:
-            repo_plan["skipped"] = True
-            repo_plan["reason"] = (
-                f"no repo_path for {repo_name!r} in project_registry.yaml — "
-                "add a repo_path or update the skill's deploys_to_repos."
-            )
-            continue
-        repo_plan["repo_path"] = str(repo_path)
-
-        if not _is_git_worktree(repo_path):
-            repo_plan["skipped"] = True
-            repo_plan["reason"] = f"{repo_path} is not a git working tree."
-            continue
-
-        # Self-clobber guard: skill home_repo == this target.
-        skills_for_repo = dict(by_repo[repo_name])
-        for key in list(skills_for_repo.keys()):
-            entry = skills_for_repo[key]
-            if entry.get("home_repo") == repo_name:
-                repo_plan["errors"].append(
-                    f"refused: skill {key!r} has home_repo={repo_name!r}; "
-                    "would clobber its own source. Edit the skill's "
-                    "frontmatter (drop this repo from deploys_to_repos) "
-                    "and run `claude-skills register --update`."
-                )
-                # Remove from active deploy set; do NOT classify as remove
-                # either (we never had a clean deploy record for it).
-                del skills_for_repo[key]
-
-        # Dirty-tree guard. Only meaningful when --commit is requested,
-        # since otherwise we're not modifying git state. Without --commit
-        # we still skip if the repo is dirty — leaving extra unstaged
-        # files in someone's working tree without telling them is rude.
-        dirty = _has_uncommitted_outside(repo_path, ".claude/commands/")
-        if dirty:
-            if force:
-                repo_plan["warnings"].append(
-                    f"--force in effect; {len(dirty)} uncommitted path(s) "
-                    f"outside .claude/commands/ ignored (first: {dirty[0]})."
-                )
-            else:
-                repo_plan["skipped"] = True
-                repo_plan["reason"] = (
-                    f"{len(dirty)} uncommitted path(s) outside "
-                    f".claude/commands/ in {repo_path} (first: {dirty[0]}). "
-                    "Pass --force to override."
-                )
-                continue
-
-        # Classify.
-        commands_dir = repo_path / ".claude" / "commands"
-        target_manifest = _build_target_manifest(commands_dir)
-        cls = _classify_repo(
-            skills_for_repo,
-            target_manifest,
-            registry_skills,
+    def _run(repo_name: str) -> tuple[dict, list[tuple]]:
+        return _process_repo(
             repo_name,
-            skill_filter=skill,
+            by_repo[repo_name],
+            repo_index.get(repo_name),
+            registry_skills,
+            apply=apply,
+            commit=commit,
+            force=force,
+            untracked=untracked,
+            skill=skill,
+            strategy=strategy,
+            source_sha=source_sha,
+            now=now,
         )
-        repo_plan["add"] = cls["add"]
-        repo_plan["update"] = cls["update"]
-        repo_plan["unchanged"] = cls["unchanged"]
-        repo_plan["remove"] = cls["remove"]
-
-        if not apply:
-            continue
-
-        # ---- APPLY ----
-
-        # Track old hashes for the update entries so the commit message
-        # can show "old7 -> new7".
-        update_pairs: list[tuple[str, str, str]] = []
-        for key in cls["update"]:
-            old_hash = target_manifest.get(key, "")[:7]
-            new_hash = skills_for_repo[key].get("manifest_hash", "")[:7]
-            update_pairs.append((key, old_hash, new_hash))
-
-        # Pass 1: copy adds + updates.
-        all_written: list[Path] = []
-        for key in cls["add"] + cls["update"]:
-            entry = skills_for_repo[key]
-            home_path = Path(entry["home_path"])
-            if not home_path.is_file():
-                repo_plan["errors"].append(
-                    f"missing home_path for {key}: {home_path}"
-                )
-                continue
-            try:
-                written = _copy_skill_unit(home_path, commands_dir)
-                all_written.extend(written)
-            except OSError as exc:
-                repo_plan["errors"].append(f"copy failed for {key}: {exc}")
-
-        # Pass 2: removals.
-        all_removed: list[Path] = []
-        for key in cls["remove"]:
-            try:
-                removed = _remove_skill_unit(commands_dir, key)
-                all_removed.extend(removed)
-            except OSError as exc:
-                repo_plan["errors"].append(f"remove failed for {key}: {exc}")
-
-        # Pass 3: stage + commit only when --commit was requested.
-        diff_nonempty = bool(all_written or all_removed)
-        if commit and diff_nonempty:
-            try:
-                for p in all_written:
-                    _git_run(repo_path, ["add", "--", str(p)])
-                for p in all_removed:
-                    rel = p.relative_to(repo_path)
-                    ret = _git_run(
-                        repo_path,
-                        ["rm", "--cached", "--ignore-unmatch", "--", str(rel)],
-                        check=False,
-                    )
-                    _ = ret  # We rely on pass 2 having unlinked from disk.
-
-                # Detect whether anything is actually staged.
-                ret_status = _git_run(
-                    repo_path, ["diff", "--cached", "--name-only"], check=False
-                )
-                staged = [
-                    ln
-                    for ln in (ret_status.stdout or "").splitlines()
-                    if ln.strip()
-                ]
-                if staged:
-                    msg = _format_commit_message(
-                        cls["add"], update_pairs, cls["remove"], source_sha
-                    )
-                    _git_run(repo_path, ["commit", "-m", msg])
-                    repo_plan["commit"] = _short_sha(repo_path)
-                # else: nothing staged (e.g. files identical / gitignored
-                # in the post-pivot world); skip commit silently.
-            except subprocess.CalledProcessError as exc:
-                repo_plan["errors"].append(
-                    f"git stage/commit failed: {exc.stderr or exc.stdout or exc}"
-                )
-                continue
 
-        # Update last_repo_deploy entries on the registry copy.
-        commit_short = repo_plan["commit"] or ""
-        for key in cls["add"] + cls["update"]:
-            entry = registry_skills.get(key)
-            if entry is None:
-                continue
-            lrd = entry.setdefault("last_repo_deploy", {})
-            lrd[repo_name] = {
-                "hash": entry.get("manifest_hash", ""),
-                "ts": now,
-                "action": "add" if key in cls["add"] else "update",
-                "commit": commit_short,
-            }
-        for key in cls["remove"]:
+    repo_names = sorted(by_repo.keys())
+    paths = [repo_index.get(n) for n in repo_names if repo_index.get(n) is not None]
+    if len(set(paths)) != len(paths):
+        # Two project names share a checkout; never run git in one
+        # working tree from two threads.
+        jobs = 1
+    for repo_name, (repo_plan, updates) in zip(
+        repo_names, map_ordered(_run, repo_names, jobs)
+    ):
+        plan["repos"][repo_name] = repo_plan
+        for key, record in updates:
             entry = registry_skills.get(key)
             if entry is None:
                 continue
             lrd = entry.setdefault("last_repo_deploy", {})
-            lrd.pop(repo_name, None)
+            if record is None:
+                lrd.pop(repo_name, None)
+            else:
+                lrd[repo_name] = record
 
     # Persist registry once at the end if we applied anything.
     if apply and any(
@@ -651,6 +740,21 @@ def render_repo_plan(plan: dict) -> int:
         rp = repos[repo_name]
         print(f"  Repo: {repo_name}")
         print(f"    path: {rp.get('repo_path') or '(unresolved)'}")
+        guard = rp.get("guard")
+        if guard:
+            extras = [
+                name
+                for name, on in (
+                    ("fsmonitor", guard.get("fsmonitor")),
+                    ("untracked-cache", guard.get("untracked_cache")),
+                    ("untracked skipped", not guard.get("untracked", True)),
+                )
+                if on
+            ]
+            print(
+                f"    dirty guard: {guard['ms']:.1f}ms"
+                + (f" ({', '.join(extras)})" if extras else "")
+            )
         if rp.get("skipped"):
             print(f"    SKIPPED: {rp.get('reason')}")
             any_skipped = True
@@ -0,0 +1,329 @@
+"""``claude-skills rollback`` — restore a prior deployment from the log.
+
+Every ``sync --apply`` appends a line to ``state/deployment_log.jsonl``
+with the keys it added / updated / removed and the ``hash_at_deploy`` of
+each deployed unit. Replaying a system's log entries up to a chosen
+entry gives the exact ``{skill_key: manifest_hash}`` the system's
+``commands_target`` held right after that entry; the object store (see
+``object_store``) holds the bytes behind each of those hashes.
+
+Rollback diffs that state against what is on disk *per file*:
+
+  - a unit whose deployed files already match the target manifest is
+    left untouched;
+  - otherwise only the files whose sha256 differs (or that are missing)
+    are re-materialized from the store, and files the target unit did
+    not have are unlinked — but only those the currently deployed unit
+    (``last_deploy`` hash, looked up in the store) had. Files added by
+    hand are left alone; if the deployed manifest is not in the store,
+    nothing is unlinked and the extra files are reported as kept;
+  - units deployed after the chosen entry are removed.
+
+So the work is proportional to the files that changed, not to the size
+of the deployment, and no older git checkout is needed.
+
+Selecting the entry (``--to``):
+  - an integer indexes this system's log entries, Python-style
+    (``-2`` = the deployment before the latest);
+  - anything else is an ISO timestamp: the latest entry with
+    ``ts <= --to``.
+
+Hard rules (same as ``sync``):
+  - Dry run by default; ``--apply`` to write.
+  - Retired / conflict skills and keys no longer in the registry are
+    never restored (reported as skipped).
+  - Guest mode refuses a ``commands_target`` outside ``~/.claude/``.
+  - Per-file unlink + rmdir of the dirs those unlinks emptied. Never
+    rmtree, never delete a file the registry doesn't show us deploying.
+  - Only the user-global ``commands_target`` is rolled back; per-repo
+    runtime mirrors are rebuilt by the next ``sync``.
+
+An applied rollback updates ``last_deploy`` in the registry and appends
+its own ``action: "rollback"`` entry to the log, which later replays
+(and later rollbacks) treat like any other deployment.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from claude_skills import deploy_log
+from claude_skills.deploy import validate_strategy
+from claude_skills.manifest import compute_file_manifest
+from claude_skills.object_store import (
+    load_unit,
+    materialize_unit,
+    rmdir_emptied,
+    unit_files,
+)
+from claude_skills.registry import load_registry, save_registry
+from claude_skills.sync import (
+    _append_deployment_log,
+    _expand,
+    _is_under,
+    _now_iso,
+    _remove_skill_unit,
+)
+from claude_skills.systems import load_systems
+
+
+def _system_log_entries(system_name: str) -> list[dict]:
+    """Return this system's deployment log entries, oldest first."""
+    return deploy_log.query(system=system_name)
+
+
+def _select_entry(entries: list[dict], to: str) -> int:
+    """Resolve ``--to`` against ``entries``; return an index or raise ValueError."""
+    if not entries:
+        raise ValueError("no deployment log entries for this system")
+    try:
+        index = int(to)
+    except ValueError:
+        index = None
+    if index is not None:
+        if not -len(entries) <= index < len(entries):
+            raise ValueError(
+                f"--to {to}: out of range ({len(entries)} log entries for this system)"
+            )
+        return index % len(entries)
+    candidates = [i for i, e in enumerate(entries) if str(e.get("ts", "")) <= to]
+    if not candidates:
+        raise ValueError(f"--to {to}: no deployment at or before that time")
+    return candidates[-1]
+
+
+def _replay(entries: list[dict]) -> dict[str, str]:
+    """Fold log entries into ``{skill_key: manifest_hash}``."""
+    state: dict[str, str] = {}
+    for entry in entries:
+        hashes = entry.get("hash_at_deploy") or {}
+        for key in (entry.get("added") or []) + (entry.get("updated") or []):
+            if hashes.get(key):
+                state[key] = hashes[key]
+        for key in entry.get("removed") or []:
+            state.pop(key, None)
+    return state
+
+
+def _deployed_files(commands_target: Path, key: str) -> dict[str, str]:
+    anchor = commands_target / f"{key}.md"
+    if not anchor.is_file():
+        return {}
+    return dict(compute_file_manifest(anchor))
+
+
+def _unlink_stale(commands_target: Path, key: str, rels: list[str]) -> None:
+    """Unlink files a unit no longer has; rmdir the dirs that leaves empty."""
+    removed: list[Path] = []
+    for rel in rels:
+        path = commands_target / rel
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            continue
+        removed.append(path)
+    rmdir_emptied(removed, commands_target / key)
+
+
+def rollback(system_name: str, to: str, apply: bool = False) -> dict:
+    """Plan (and with ``apply``, perform) a rollback of ``system_name``.
+
+    Returns a plan dict::
+
+        {"system", "mode", "apply", "commands_target",
+         "target": {"index", "ts", "entries"},
+         "restore": [{"skill", "hash", "files": [rel], "stale": [rel], "new"}],
+         "remove": [skill], "unchanged": [skill], "kept": [[skill, rel]],
+         "skipped": [[skill, reason]], "errors": [str], "applied": bool}
+    """
+    systems = load_systems()
+    if system_name not in systems:
+        raise ValueError(f"unknown system: {system_name!r}")
+    sys_info = systems[system_name]
+    mode = sys_info.get("mode", "owned")
+    commands_target = _expand(sys_info.get("commands_target", "~/.claude/commands/"))
+    strategy = validate_strategy(sys_info.get("deploy_strategy"))
+
+    if mode == "guest":
+        home_claude = (Path.home() / ".claude").resolve()
+        if not _is_under(commands_target, home_claude):
+            raise PermissionError(
+                f"guest mode: commands_target={commands_target} resolves outside {home_claude}"
+            )
+
+    entries = _system_log_entries(system_name)
+    index = _select_entry(entries, to)
+    wanted = _replay(entries[: index + 1])
+    current = _replay(entries)
+
+    registry = load_registry()
+    registry_skills = registry.get("skills", {}) or {}
+
+    plan: dict = {
+        "system": system_name,
+        "mode": mode,
+        "apply": apply,
+        "commands_target": str(commands_target),
+        "target": {
+            "index": index,
+            "ts": entries[index].get("ts", ""),
+            "entries": len(entries),
+        },
+        "restore": [],
+        "remove": [],
+        "unchanged": [],
+        "kept": [],
+        "skipped": [],
+        "errors": [],
+        "applied": False,
+    }
+
+    for key in sorted(set(wanted) | set(current)):
+        want = wanted.get(key)
+        have = _deployed_files(commands_target, key)
+        if want is None:
+            if have:
+                plan["remove"].append(key)
+            continue
+        reg_entry = registry_skills.get(key)
+        if reg_entry is None:
+            plan["skipped"].append([key, "no longer in registry"])
+            continue
+        if reg_entry.get("retired") or reg_entry.get("conflict"):
+            plan["skipped"].append(
+                [key, "retired" if reg_entry.get("retired") else "conflict"]
+            )
+            continue
+        unit = load_unit(want)
+        if unit is None:
+            plan["errors"].append(f"{key}: manifest {want[:8]} not in object store")
+            continue
+        want_files = {rel: sha for rel, sha, _x in unit["files"]}
+        changed = sorted(rel for rel, sha in want_files.items() if have.get(rel) != sha)
+        extra = sorted(rel for rel in have if rel not in want_files)
+        # Only files the deployed unit had are ours to unlink; hand-added
+        # ones stay. Without its manifest we can't tell, so keep them all.
+        deployed_hash = (
+            (reg_entry.get("last_deploy") or {}).get(system_name) or {}
+        ).get("hash", "")
+        deployed = unit_files(deployed_hash) if deployed_hash else None
+        if deployed is None:
+            stale = []
+            plan["kept"].extend([key, rel] for rel in extra)
+        else:
+            stale = [rel for rel in extra if rel in deployed]
+        if not changed and not stale:
+            plan["unchanged"].append(key)
+            continue
+        plan["restore"].append({
+            "skill": key,
+            "hash": want,
+            "files": changed,
+            "stale": stale,
+            "new": not have,
+        })
+
+    if not apply:
+        return plan
+
+    # ---- APPLY ----
+    now = _now_iso()
+    restored: list[dict] = []
+    removed: list[str] = []
+    commands_target.mkdir(parents=True, exist_ok=True)
+    for item in plan["restore"]:
+        key = item["skill"]
+        try:
+            if item["files"]:
+                written = materialize_unit(
+                    item["hash"], commands_target, strategy, only=set(item["files"])
+                )
+                if written is None:
+                    plan["errors"].append(f"{key}: blobs missing from object store")
+                    continue
+            _unlink_stale(commands_target, key, item["stale"])
+        except OSError as exc:
+            plan["errors"].append(f"restore failed for {key}: {exc}")
+            continue
+        restored.append(item)
+    for key in plan["remove"]:
+        try:
+            _remove_skill_unit(commands_target, key)
+        except OSError as exc:
+            plan["errors"].append(f"remove failed for {key}: {exc}")
+            continue
+        removed.append(key)
+
+    for item in restored:
+        entry = registry_skills[item["skill"]]
+        entry.setdefault("last_deploy", {})[system_name] = {
+            "hash": item["hash"],
+            "ts": now,
+            "action": "rollback",
+        }
+        entry["deploys_to_machines"] = sorted(
+            set(entry.get("deploys_to_machines") or []) | {system_name}
+        )
+    for key in removed:
+        entry = registry_skills.get(key)
+        if entry is None:
+            continue
+        (entry.get("last_deploy") or {}).pop(system_name, None)
+        entry["deploys_to_machines"] = sorted(
+            set(entry.get("deploys_to_machines") or []) - {system_name}
+        )
+
+    _append_deployment_log({
+        "ts": now,
+        "system": system_name,
+        "action": "rollback",
+        "rolled_back_to": plan["target"]["ts"],
+        "added": [i["skill"] for i in restored if i["new"]],
+        "updated": [i["skill"] for i in restored if not i["new"]],
+        "removed": removed,
+        "hash_at_deploy": {i["skill"]: i["hash"] for i in restored},
+        "errors": plan["errors"],
+    })
+    save_registry(registry)
+    plan["applied"] = True
+    return plan
+
+
+def render_rollback_plan(plan: dict) -> int:
+    """Print a rollback plan to stdout. Returns exit code."""
+    target = plan["target"]
+    mode = "apply" if plan["apply"] else "dry-run"
+    print(f"=== rollback plan: {plan['system']} (mode={mode}) ===\n")
+    print(
+        f"  To: log entry {target['index']} of {target['entries']} "
+        f"(ts={target['ts']})"
+    )
+    print(f"  Target: {plan['commands_target']}\n")
+
+    files = sum(len(i["files"]) + len(i["stale"]) for i in plan["restore"])
+    print(
+        f"  restore={len(plan['restore'])} ({files} file(s))  "
+        f"remove={len(plan['remove'])}  unchanged={len(plan['unchanged'])}  "
+        f"skipped={len(plan['skipped'])}"
+    )
+    for item in plan["restore"]:
+        print(f"    ~ {item['skill']} -> {item['hash'][:8]}")
+        for rel in item["files"]:
+            print(f"        restore {rel}")
+        for rel in item["stale"]:
+            print(f"        unlink  {rel}")
+    for key in plan["remove"]:
+        print(f"    - {key}")
+    for key, reason in plan["skipped"]:
+        print(f"    ? {key}: skipped ({reason})")
+    for key, rel in plan["kept"]:
+        print(f"    = {key}: kept {rel} (deployed manifest not in object store)")
+
+    if plan["errors"]:
+        print("\n  Errors:")
+        for e in plan["errors"]:
+            print(f"    ! {e}")
+        return 1
+    if not plan["apply"]:
+        print("\n  (dry run — pass --apply to write)")
+    return 0
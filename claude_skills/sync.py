@@ -7,7 +7,9 @@ The three passes are:
      add / update / unchanged / remove. Render the would-be CLAUDE.md.
   2. Render: when --apply is not set, return the plan dict (and unified
      diffs for diff mode) without touching disk.
-  3. Apply: per-file copy of new/updated skills, per-file unlink of
+  3. Apply: per-file copy (or hardlink / reflink / symlink, per the
+     system's ``deploy_strategy``) of new skills and of the changed files
+     of updated ones (``object_store.update_unit``), per-file unlink of
      skills the registry says we previously deployed but are no longer
      subscribed; write CLAUDE.md via write_managed; update last_deploy
      and append to deployment_log.jsonl.
@@ -36,12 +38,11 @@ Hard rules (do not relax):
 from __future__ import annotations
 
 import difflib
-import json
-import os
 import shutil
 from datetime import datetime, timezone
 from pathlib import Path
 
+from claude_skills import deploy_log
 from claude_skills.claude_md import (
     get_tier1,
     get_tier2,
@@ -49,26 +50,28 @@ from claude_skills.claude_md import (
     render_managed,
     write_managed,
 )
+from claude_skills.deploy import (
+    DEFAULT_STRATEGY,
+    is_same_entry,
+    place_file,
+    validate_strategy,
+)
 from claude_skills.manifest import compute_manifest_hash, list_skill_units
+from claude_skills.object_store import materialize_unit, update_unit
 from claude_skills.registry import load_registry, save_registry
 from claude_skills.systems import load_systems
 
 
 _REPO_ROOT = Path(__file__).resolve().parent.parent
-_DEFAULT_DEPLOYMENT_LOG = _REPO_ROOT / "state" / "deployment_log.jsonl"
-_DEPLOYMENT_LOG_ENV = "CLAUDE_SKILLS_DEPLOYMENT_LOG_PATH"
 
 
 def _deployment_log_path() -> Path:
     """Resolve the deployment log path, honoring the env override (used by tests)."""
-    override = os.environ.get(_DEPLOYMENT_LOG_ENV)
-    if override:
-        return Path(override)
-    return _DEFAULT_DEPLOYMENT_LOG
+    return deploy_log.log_path()
 
 
 # Back-compat: keep the module-level name; tests can override via env var.
-_DEPLOYMENT_LOG = _DEFAULT_DEPLOYMENT_LOG
+_DEPLOYMENT_LOG = deploy_log._DEFAULT_DEPLOYMENT_LOG
 
 
 def _expand(path_str: str) -> Path:
@@ -131,18 +134,104 @@ def _filter_subscribed(skills: dict, sys_info: dict) -> dict:
     return out
 
 
-def _build_target_manifest(commands_target: Path) -> dict[str, str]:
+def _build_target_manifest(
+    commands_target: Path, only: frozenset[str] | None = None
+) -> dict[str, str]:
     """Walk commands_target and return {skill_key: manifest_hash}.
 
     Each anchor .md file is treated as a skill unit (the sibling dir is
-    handled inside compute_manifest_hash).
+    handled inside compute_manifest_hash). With ``only``, just those
+    keys' anchors are looked up; nothing else in the dir is listed or
+    hashed.
     """
     if not commands_target.is_dir():
         return {}
-    anchors = list_skill_units(commands_target)
+    if only is not None:
+        anchors = [commands_target / f"{key}.md" for key in sorted(only)]
+        anchors = [a for a in anchors if a.is_file()]
+    else:
+        anchors = list_skill_units(commands_target)
     return {a.stem: compute_manifest_hash(a) for a in anchors}
 
 
+class TargetSnapshot:
+    """Per-invocation view of target-dir state, walked at most once per dir.
+
+    Planning (``_classify_skills`` / ``_plan_runtime_targets``) and apply
+    (``_mirror_to_runtime_dirs``) used to walk and hash every
+    ``.claude/commands/`` dir separately, so ``sync --apply`` hashed each
+    runtime dir twice. A snapshot is created once per ``sync()`` call and
+    passed to every pass instead. Dirs are keyed by resolved path, so two
+    spellings of the same dir share one walk.
+
+    Apply paths call ``record_deployed`` / ``record_removed`` after they
+    write, keeping the snapshot truthful for any later pass in the same
+    invocation that targets the same dir.
+
+    ``only`` limits every manifest to those skill keys (single-skill
+    ``sync``), so a dir holding hundreds of units costs one lookup.
+    """
+
+    def __init__(self, only: frozenset[str] | None = None) -> None:
+        self._manifests: dict[Path, dict[str, str]] = {}
+        self.only = only
+        self.walks = 0
+
+    @staticmethod
+    def _key(commands_dir: Path) -> Path:
+        return commands_dir.expanduser().resolve()
+
+    def manifest(self, commands_dir: Path) -> dict[str, str]:
+        """Return ``{skill_key: manifest_hash}`` for ``commands_dir``."""
+        key = self._key(commands_dir)
+        cached = self._manifests.get(key)
+        if cached is None:
+            cached = _build_target_manifest(key, self.only)
+            self._manifests[key] = cached
+            self.walks += 1
+        return cached
+
+    def record_deployed(self, commands_dir: Path, skill_key: str, manifest_hash: str) -> None:
+        """Note that ``skill_key`` now sits in ``commands_dir`` at ``manifest_hash``."""
+        key = self._key(commands_dir)
+        if key in self._manifests:
+            self._manifests[key][skill_key] = manifest_hash
+
+    def record_removed(self, commands_dir: Path, skill_key: str) -> None:
+        """Note that ``skill_key`` was removed from ``commands_dir``."""
+        key = self._key(commands_dir)
+        if key in self._manifests:
+            self._manifests[key].pop(skill_key, None)
+
+
+class SyncContext:
+    """State shared by every ``sync`` call in one process.
+
+    ``sync --all`` (``sync_many``) plans and applies several systems in a
+    row. Rather than each call reloading ``systems.yaml``, the registry,
+    the project registry and tier1, and re-walking target dirs, they all
+    read from one context; the registry is saved once by the caller.
+    Target dirs that resolve to the same path share one snapshot entry.
+    """
+
+    def __init__(self) -> None:
+        self.systems = load_systems()
+        self.registry = load_registry()
+        self.snapshot = TargetSnapshot()
+        self._tier1: str | None = None
+        self._repo_index: dict[str, Path] | None = None
+
+    def tier1(self) -> str:
+        if self._tier1 is None:
+            self._tier1 = get_tier1()
+        return self._tier1
+
+    def repo_index(self) -> dict[str, Path]:
+        if self._repo_index is None:
+            self._repo_index = _build_repo_root_index()
+        return self._repo_index
+
+
 def _classify_skills(
     subscribed: dict, target_manifest: dict[str, str], registry_skills: dict, sys_name: str
 ) -> dict:
@@ -187,8 +276,14 @@ def _classify_skills(
     return {"add": add, "update": update, "unchanged": unchanged, "remove": remove}
 
 
-def _render_claude_md_plan(target_path: Path, tier1: str, tier2: str) -> dict:
-    """Compute the would-be ~/.claude/CLAUDE.md and the action it implies."""
+def _render_claude_md_plan(
+    target_path: Path, tier1: str, tier2: str, *, diff: bool = True
+) -> dict:
+    """Compute the would-be ~/.claude/CLAUDE.md and the action it implies.
+
+    ``diff=False`` skips building the unified diff text (``diff`` is "");
+    ``claude-skills diff`` streams it from ``rendered`` instead.
+    """
     state = parse_managed(target_path)
 
     # Render against the existing user_additions if managed; else empty.
@@ -216,14 +311,16 @@ def _render_claude_md_plan(target_path: Path, tier1: str, tier2: str) -> dict:
             action = "no-change"
         else:
             action = "update"
-        diff_text = "".join(
-            difflib.unified_diff(
-                existing_text.splitlines(keepends=True),
-                rendered.splitlines(keepends=True),
-                fromfile=str(target_path),
-                tofile=str(target_path) + " (new)",
+        diff_text = ""
+        if diff and action == "update":
+            diff_text = "".join(
+                difflib.unified_diff(
+                    existing_text.splitlines(keepends=True),
+                    rendered.splitlines(keepends=True),
+                    fromfile=str(target_path),
+                    tofile=str(target_path) + " (new)",
+                )
             )
-        )
         # Summarize per-tier change.
         t1_changed = (state["tier1_hash"] or "") != tier1_hash
         t2_changed = (state["tier2_hash"] or "") != tier2_hash
@@ -243,16 +340,33 @@ def _render_claude_md_plan(target_path: Path, tier1: str, tier2: str) -> dict:
     }
 
 
-def _copy_skill_unit(home_path: Path, dest_dir: Path) -> None:
+def _copy_skill_unit(
+    home_path: Path,
+    dest_dir: Path,
+    strategy: str = DEFAULT_STRATEGY,
+    manifest_hash: str = "",
+) -> None:
     """Copy a skill unit (anchor .md + sibling dir if any) into dest_dir.
 
-    Uses shutil.copy2 for files; for the sibling directory, copies the
-    tree recursively, overwriting existing files. Never deletes anything.
+    When ``manifest_hash`` is in the object store, the unit is
+    materialized from there, so the target gets exactly the registered
+    bytes. Otherwise each file is placed from ``home_path`` with
+    ``deploy.place_file`` using the system's ``deploy_strategy`` (copy /
+    hardlink / reflink / symlink, falling back to copy per file). For the
+    sibling directory, places the tree recursively, overwriting existing
+    files. Never deletes anything. Raises ``shutil.SameFileError`` if
+    ``dest_dir`` is the unit's own dir (a legacy-home runtime mirror).
     """
+    dest_anchor = dest_dir / home_path.name
+    if is_same_entry(home_path, dest_anchor):
+        # Legacy-home unit mirrored into its own dir: materializing the
+        # registered bytes would revert unregistered edits to the source.
+        raise shutil.SameFileError(f"{home_path} is the deploy target itself")
     dest_dir.mkdir(parents=True, exist_ok=True)
+    if manifest_hash and materialize_unit(manifest_hash, dest_dir, strategy) is not None:
+        return
     # Copy the anchor file.
-    dest_anchor = dest_dir / home_path.name
-    shutil.copy2(home_path, dest_anchor)
+    place_file(home_path, dest_anchor, strategy)
     # Copy the sibling dir if present.
     sibling = home_path.parent / home_path.stem
     if sibling.is_dir():
@@ -264,7 +378,7 @@ def _copy_skill_unit(home_path: Path, dest_dir: Path) -> None:
             rel = src_file.relative_to(sibling)
             dst_file = dest_sibling / rel
             dst_file.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src_file, dst_file)
+            place_file(src_file, dst_file, strategy)
 
 
 def _remove_skill_unit(commands_target: Path, skill_key: str) -> None:
@@ -298,13 +412,9 @@ def _append_deployment_log(entry: dict, log_path: Path | None = None) -> None:
 
     Honors the ``CLAUDE_SKILLS_DEPLOYMENT_LOG_PATH`` env var when ``log_path``
     is not given (used by tests so they don't pollute the real log).
+    Rotation and indexing are handled by ``deploy_log``.
     """
-    if log_path is None:
-        log_path = _deployment_log_path()
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    line = json.dumps(entry, sort_keys=True) + "\n"
-    with open(log_path, "a", encoding="utf-8") as f:
-        f.write(line)
+    deploy_log.append(entry, log_path)
 
 
 # ---- per-repo runtime mirroring helpers ----------------------------------
@@ -313,56 +423,19 @@ def _append_deployment_log(entry: dict, log_path: Path | None = None) -> None:
 def _build_repo_root_index() -> dict[str, Path]:
     """Return ``{repo_name: repo_root_path}`` for known home repos.
 
-    Mirrors the discovery in ``inventory.py``: ClaudeCommands (this repo)
-    and AIAssistant (special-cased) plus every project in
-    project_registry.yaml that resolves to a repo_path.
+    Same discovery as ``inventory.py`` (see ``projects.home_roots``):
+    ClaudeCommands (this repo), AIAssistant (special-cased) and every
+    project in project_registry.yaml that resolves to a repo_path. An
+    unreadable registry yields just the special-cased repos.
     """
-    import yaml
-
-    out: dict[str, Path] = {}
-    out["ClaudeCommands"] = _REPO_ROOT
-    aia_root = Path.home() / "Dropbox" / "Projects" / "AIAssistant"
-    if aia_root.is_dir():
-        out["AIAssistant"] = aia_root
-
-    proj_path_env = os.environ.get("CLAUDE_SKILLS_PROJECT_REGISTRY_PATH")
-    proj_path = (
-        Path(proj_path_env)
-        if proj_path_env
-        else aia_root / "state" / "project_registry.yaml"
-    )
-    if not proj_path.is_file():
-        return out
+    from claude_skills import yaml_loader
+    from claude_skills.projects import ProjectRegistry, load_project_registry
+
     try:
-        with open(proj_path) as f:
-            data = yaml.safe_load(f) or {}
-    except (OSError, yaml.YAMLError):
-        return out
-    projects = data.get("projects", {}) or {}
-
-    def _resolve(pid: str) -> str | None:
-        visited: set[str] = set()
-        cur = pid
-        while cur and cur not in visited:
-            visited.add(cur)
-            entry = projects.get(cur, {}) or {}
-            rp = entry.get("repo_path")
-            if rp:
-                return rp
-            cur = entry.get("parent")
-        return None
-
-    for pid, info in projects.items():
-        name = (info or {}).get("name") or pid
-        if name in out:
-            continue
-        rp = _resolve(pid)
-        if not rp:
-            continue
-        path = Path(rp).expanduser()
-        if path.is_dir():
-            out[name] = path
-    return out
+        registry = load_project_registry()
+    except (OSError, yaml_loader.YAMLError):
+        registry = ProjectRegistry(Path(), {})
+    return registry.home_roots()
 
 
 def _expand_deploys_targets(
@@ -408,11 +481,74 @@ def _runtime_targets_for_skill(
     return targets
 
 
+def _runtime_repo_sets(
+    subscribed: dict, registry_skills: dict, repo_index: dict[str, Path]
+) -> dict[str, dict[str, dict]]:
+    """Return ``{repo_name: {skill_key: entry}}`` for the runtime mirror.
+
+    Includes repos that only need REMOVALS (skill was previously deployed
+    via runtime mirror but is no longer subscribed/targeted) with an
+    empty skill map.
+    """
+    by_repo: dict[str, dict[str, dict]] = {}
+    for key, entry in subscribed.items():
+        for repo_name, _runtime_dir in _runtime_targets_for_skill(entry, repo_index):
+            by_repo.setdefault(repo_name, {})[key] = entry
+    for key, entry in registry_skills.items():
+        for repo_name in (entry.get("last_runtime_deploy") or {}).keys():
+            by_repo.setdefault(repo_name, {})
+    return by_repo
+
+
+def _classify_runtime_repo(
+    skills_for_repo: dict[str, dict],
+    target_manifest: dict[str, str],
+    registry_skills: dict,
+    repo_name: str,
+    repo_root: Path,
+) -> dict:
+    """Compute add / update / unchanged / remove for one runtime dir."""
+    add: list[str] = []
+    update: list[str] = []
+    unchanged: list[str] = []
+    remove: list[str] = []
+
+    for key in sorted(skills_for_repo.keys()):
+        new_hash = skills_for_repo[key].get("manifest_hash", "")
+        if key not in target_manifest:
+            add.append(key)
+        elif target_manifest[key] == new_hash:
+            unchanged.append(key)
+        else:
+            update.append(key)
+
+    # Removal: registry says we previously runtime-deployed it but
+    # this skill no longer targets this repo.
+    for key, entry in registry_skills.items():
+        last = (entry.get("last_runtime_deploy") or {}).get(repo_name)
+        if not last:
+            continue
+        if key in skills_for_repo:
+            continue
+        remove.append(key)
+
+    return {
+        "repo_path": str(repo_root),
+        "add": add,
+        "update": update,
+        "unchanged": unchanged,
+        "remove": sorted(set(remove)),
+        "errors": [],
+    }
+
+
 def _mirror_to_runtime_dirs(
     subscribed: dict,
     registry_skills: dict,
     repo_index: dict[str, Path],
     plan: dict,
+    snapshot: TargetSnapshot | None = None,
+    strategy: str = DEFAULT_STRATEGY,
 ) -> dict:
     """Per-repo runtime mirror pass. Returns a dict {repo_name: stats}.
 
@@ -421,20 +557,15 @@ def _mirror_to_runtime_dirs(
     contains an up-to-date copy. Also removes anchors the registry
     previously deployed to that repo if the skill is no longer subscribed
     or no longer targets that repo.
+
+    ``snapshot`` should be the one the plan was computed from, so each
+    runtime dir is walked and hashed once per invocation rather than once
+    for the plan and again here.
     """
+    if snapshot is None:
+        snapshot = TargetSnapshot()
     runtime_stats: dict[str, dict] = {}
-
-    # Build {repo_name: {skill_key: entry}} for currently-subscribed skills.
-    by_repo: dict[str, dict[str, dict]] = {}
-    for key, entry in subscribed.items():
-        for repo_name, _runtime_dir in _runtime_targets_for_skill(entry, repo_index):
-            by_repo.setdefault(repo_name, {})[key] = entry
-
-    # Also track repos that may need REMOVALS (skill was previously
-    # deployed via runtime mirror but no longer subscribed/targeted).
-    for key, entry in registry_skills.items():
-        for repo_name in (entry.get("last_runtime_deploy") or {}).keys():
-            by_repo.setdefault(repo_name, {})
+    by_repo = _runtime_repo_sets(subscribed, registry_skills, repo_index)
 
     for repo_name in sorted(by_repo.keys()):
         repo_root = repo_index.get(repo_name)
@@ -443,41 +574,16 @@ def _mirror_to_runtime_dirs(
         runtime_dir = repo_root / ".claude" / "commands"
         skills_for_repo = by_repo[repo_name]
 
-        # Walk current state of runtime dir.
-        target_manifest = _build_target_manifest(runtime_dir)
-
-        add: list[str] = []
-        update: list[str] = []
-        unchanged: list[str] = []
-        remove: list[str] = []
-
-        for key in sorted(skills_for_repo.keys()):
-            new_hash = skills_for_repo[key].get("manifest_hash", "")
-            if key not in target_manifest:
-                add.append(key)
-            elif target_manifest[key] == new_hash:
-                unchanged.append(key)
-            else:
-                update.append(key)
-
-        # Removal: registry says we previously runtime-deployed it but
-        # this skill no longer targets this repo.
-        for key, entry in registry_skills.items():
-            last = (entry.get("last_runtime_deploy") or {}).get(repo_name)
-            if not last:
-                continue
-            if key in skills_for_repo:
-                continue
-            remove.append(key)
-
-        runtime_stats[repo_name] = {
-            "repo_path": str(repo_root),
-            "add": add,
-            "update": update,
-            "unchanged": unchanged,
-            "remove": sorted(set(remove)),
-            "errors": [],
-        }
+        stats = _classify_runtime_repo(
+            skills_for_repo,
+            snapshot.manifest(runtime_dir),
+            registry_skills,
+            repo_name,
+            repo_root,
+        )
+        runtime_stats[repo_name] = stats
+        add = stats["add"]
+        update = stats["update"]
 
         # ---- APPLY ----
         runtime_dir.mkdir(parents=True, exist_ok=True)
@@ -485,24 +591,42 @@ def _mirror_to_runtime_dirs(
             entry = skills_for_repo[key]
             home_path = Path(entry["home_path"])
             if not home_path.is_file():
-                runtime_stats[repo_name]["errors"].append(
+                stats["errors"].append(
                     f"missing home_path for {key}: {home_path}"
                 )
                 continue
             try:
-                _copy_skill_unit(home_path, runtime_dir)
+                if key in update:
+                    previous = (
+                        (entry.get("last_runtime_deploy") or {}).get(repo_name) or {}
+                    )
+                    update_unit(
+                        home_path,
+                        runtime_dir,
+                        entry.get("manifest_hash", ""),
+                        previous.get("hash", ""),
+                        strategy,
+                    )
+                else:
+                    _copy_skill_unit(
+                        home_path, runtime_dir, strategy, entry.get("manifest_hash", "")
+                    )
             except Exception as exc:
-                runtime_stats[repo_name]["errors"].append(
+                stats["errors"].append(
                     f"copy failed for {key}: {exc}"
                 )
+                continue
+            snapshot.record_deployed(runtime_dir, key, entry.get("manifest_hash", ""))
 
-        for key in runtime_stats[repo_name]["remove"]:
+        for key in stats["remove"]:
             try:
                 _remove_skill_unit(runtime_dir, key)
             except Exception as exc:
-                runtime_stats[repo_name]["errors"].append(
+                stats["errors"].append(
                     f"remove failed for {key}: {exc}"
                 )
+                continue
+            snapshot.record_removed(runtime_dir, key)
 
         # Update last_runtime_deploy.
         now = _now_iso()
@@ -516,7 +640,7 @@ def _mirror_to_runtime_dirs(
                 "ts": now,
                 "action": "add" if key in add else "update",
             }
-        for key in runtime_stats[repo_name]["remove"]:
+        for key in stats["remove"]:
             entry = registry_skills.get(key)
             if entry is None:
                 continue
@@ -527,16 +651,15 @@ def _mirror_to_runtime_dirs(
 
 
 def _plan_runtime_targets(
-    subscribed: dict, registry_skills: dict, repo_index: dict[str, Path]
+    subscribed: dict,
+    registry_skills: dict,
+    repo_index: dict[str, Path],
+    snapshot: TargetSnapshot | None = None,
 ) -> dict:
     """Dry-run version of ``_mirror_to_runtime_dirs`` (no disk writes)."""
-    by_repo: dict[str, dict[str, dict]] = {}
-    for key, entry in subscribed.items():
-        for repo_name, _ in _runtime_targets_for_skill(entry, repo_index):
-            by_repo.setdefault(repo_name, {})[key] = entry
-    for key, entry in registry_skills.items():
-        for repo_name in (entry.get("last_runtime_deploy") or {}).keys():
-            by_repo.setdefault(repo_name, {})
+    if snapshot is None:
+        snapshot = TargetSnapshot()
+    by_repo = _runtime_repo_sets(subscribed, registry_skills, repo_index)
 
     out: dict[str, dict] = {}
     for repo_name, skills_for_repo in by_repo.items():
@@ -544,38 +667,13 @@ def _plan_runtime_targets(
         if repo_root is None:
             continue
         runtime_dir = repo_root / ".claude" / "commands"
-        target_manifest = _build_target_manifest(runtime_dir)
-
-        add: list[str] = []
-        update: list[str] = []
-        unchanged: list[str] = []
-        remove: list[str] = []
-
-        for key in sorted(skills_for_repo.keys()):
-            new_hash = skills_for_repo[key].get("manifest_hash", "")
-            if key not in target_manifest:
-                add.append(key)
-            elif target_manifest[key] == new_hash:
-                unchanged.append(key)
-            else:
-                update.append(key)
-
-        for key, entry in registry_skills.items():
-            last = (entry.get("last_runtime_deploy") or {}).get(repo_name)
-            if not last:
-                continue
-            if key in skills_for_repo:
-                continue
-            remove.append(key)
-
-        out[repo_name] = {
-            "repo_path": str(repo_root),
-            "add": add,
-            "update": update,
-            "unchanged": unchanged,
-            "remove": sorted(set(remove)),
-            "errors": [],
-        }
+        out[repo_name] = _classify_runtime_repo(
+            skills_for_repo,
+            snapshot.manifest(runtime_dir),
+            registry_skills,
+            repo_name,
+            repo_root,
+        )
     return out
 
 
@@ -583,13 +681,33 @@ def sync(
     system_name: str,
     apply: bool = False,
     init_claude_md: bool = False,
+    skill: str | None = None,
+    context: SyncContext | None = None,
+    runtime: bool = True,
+    diff: bool = True,
 ) -> dict:
     """Sync this system's subscribed skills + CLAUDE.md to its targets.
 
     Returns a plan dict (see module docstring / task spec for shape).
     Setting apply=False (the default) makes this a dry run.
+
+    ``skill`` restricts the whole run (add/update/remove, global target
+    and runtime mirrors) to a single registry key and leaves CLAUDE.md
+    alone. Used by ``claude-skills watch`` to push one edited unit
+    without a full pass.
+
+    ``context`` shares loaded state across calls (see ``sync_many``);
+    with a context the registry is *not* saved — the caller does that
+    once. ``runtime=False`` skips the per-repo runtime mirror pass.
+    ``diff=False`` leaves ``claude_md["diff"]`` empty; the plan still
+    carries ``claude_md["rendered"]``, ``targets``, ``sources`` (home
+    path of every add/update key) and ``hashes`` (its new and last
+    deployed manifest hash) for ``diffstream``.
     """
-    systems = load_systems()
+    own_context = context is None
+    if context is None:
+        context = SyncContext()
+    systems = context.systems
     if system_name not in systems:
         raise ValueError(f"unknown system: {system_name!r}")
 
@@ -599,6 +717,7 @@ def sync(
     claude_md_target = _expand(sys_info.get("claude_md_target", "~/.claude/CLAUDE.md"))
     commands_target = _expand(sys_info.get("commands_target", "~/.claude/commands/"))
     tier2_source = sys_info.get("tier2_source")
+    strategy = validate_strategy(sys_info.get("deploy_strategy"))
 
     # Guest-mode guard: refuse any target outside ~/.claude/.
     if mode == "guest":
@@ -612,43 +731,82 @@ def sync(
                     f"guest mode: {label}={target} resolves outside {home_claude}"
                 )
 
-    # Load registry once.
-    registry = load_registry()
+    registry = context.registry
     registry_skills = registry.get("skills", {}) or {}
+    if skill is not None:
+        if skill not in registry_skills:
+            raise ValueError(f"unknown skill: {skill!r}")
+        # Narrow every pass to one key. Entries are shared with the full
+        # registry, so deploy-state updates still land in ``registry``.
+        registry_skills = {skill: registry_skills[skill]}
 
     # Filter by subscription.
     subscribed = _filter_subscribed(registry_skills, sys_info)
 
-    # Walk target.
-    target_manifest = _build_target_manifest(commands_target)
+    # Walk target. The snapshot is shared with the runtime-mirror plan and
+    # apply passes so no dir is walked twice in one invocation. A
+    # single-skill run only looks at that key's unit in each dir; its
+    # partial manifests stay out of the shared context snapshot.
+    snapshot = context.snapshot if skill is None else TargetSnapshot(frozenset({skill}))
+    target_manifest = snapshot.manifest(commands_target)
 
     # Classify.
     classification = _classify_skills(subscribed, target_manifest, registry_skills, system_name)
 
-    # CLAUDE.md plan.
-    tier1 = get_tier1()
-    tier2 = get_tier2(system_name, tier2_source=tier2_source)
-    cmd_md = _render_claude_md_plan(claude_md_target, tier1, tier2)
+    # CLAUDE.md plan (not part of a single-skill run).
+    if skill is None:
+        tier1 = context.tier1()
+        tier2 = get_tier2(system_name, tier2_source=tier2_source)
+        cmd_md = _render_claude_md_plan(claude_md_target, tier1, tier2, diff=diff)
+    else:
+        cmd_md = {
+            "action": "skipped",
+            "tier1_hash": "",
+            "tier2_hash": "",
+            "diff_summary": f"skipped (single-skill sync of {skill!r})",
+            "diff": "",
+        }
 
     # Per-repo runtime mirror plan (always computed; only applied in
     # owned mode and when apply=True).
     repo_index: dict[str, Path] = {}
     runtime_plan: dict[str, dict] = {}
-    if mode != "guest":
-        repo_index = _build_repo_root_index()
-        runtime_plan = _plan_runtime_targets(subscribed, registry_skills, repo_index)
+    if mode != "guest" and runtime:
+        repo_index = context.repo_index()
+        runtime_plan = _plan_runtime_targets(
+            subscribed, registry_skills, repo_index, snapshot
+        )
 
     plan: dict = {
         "system": system_name,
         "mode": mode,
+        "deploy_strategy": strategy,
         "claude_md": {
             "action": cmd_md["action"],
             "tier1_hash": cmd_md["tier1_hash"],
             "tier2_hash": cmd_md["tier2_hash"],
             "diff_summary": cmd_md["diff_summary"],
             "diff": cmd_md["diff"],
+            "rendered": cmd_md.get("rendered"),
+        },
+        "targets": {
+            "claude_md": str(claude_md_target),
+            "commands": str(commands_target),
         },
         "skills": classification,
+        "sources": {
+            key: subscribed[key].get("home_path", "")
+            for key in classification["add"] + classification["update"]
+        },
+        "hashes": {
+            key: {
+                "new": subscribed[key].get("manifest_hash", ""),
+                "deployed": (
+                    (subscribed[key].get("last_deploy") or {}).get(system_name) or {}
+                ).get("hash", ""),
+            }
+            for key in classification["add"] + classification["update"]
+        },
         "runtime_repos": runtime_plan,
         "applied": False,
         "errors": [],
@@ -696,10 +854,23 @@ def sync(
             plan["errors"].append(f"missing home_path for {key}: {home_path}")
             continue
         try:
-            _copy_skill_unit(home_path, commands_target)
+            if key in classification["update"]:
+                previous = (entry.get("last_deploy") or {}).get(system_name) or {}
+                update_unit(
+                    home_path,
+                    commands_target,
+                    entry.get("manifest_hash", ""),
+                    previous.get("hash", ""),
+                    strategy,
+                )
+            else:
+                _copy_skill_unit(
+                    home_path, commands_target, strategy, entry.get("manifest_hash", "")
+                )
         except Exception as exc:
             plan["errors"].append(f"copy failed for {key}: {exc}")
             continue
+        snapshot.record_deployed(commands_target, key, entry.get("manifest_hash", ""))
         action = "add" if key in classification["add"] else "update"
         deployed_actions.append((action, key))
 
@@ -710,6 +881,7 @@ def sync(
         except Exception as exc:
             plan["errors"].append(f"remove failed for {key}: {exc}")
             continue
+        snapshot.record_removed(commands_target, key)
         deployed_actions.append(("remove", key))
 
     # Update last_deploy in registry for everything we touched.
@@ -741,9 +913,9 @@ def sync(
     # ``.claude/commands/`` dir (and into any ``deploys_to_repos``
     # targets). Skipped in guest mode by design.
     runtime_results: dict[str, dict] = {}
-    if mode != "guest":
+    if mode != "guest" and runtime:
         runtime_results = _mirror_to_runtime_dirs(
-            subscribed, registry_skills, repo_index, plan
+            subscribed, registry_skills, repo_index, plan, snapshot, strategy
         )
         plan["runtime_repos"] = {
             name: {k: v for k, v in stats.items() if k != "errors"} | {"errors": stats.get("errors", [])}
@@ -777,15 +949,118 @@ def sync(
         },
         "errors": plan["errors"],
     }
+    if skill is not None:
+        log_entry["skill"] = skill
     _append_deployment_log(log_entry)
 
-    # Save the registry (atomic).
-    save_registry(registry)
+    # Save the registry (atomic). A shared context's owner saves once.
+    if own_context:
+        save_registry(registry)
 
     plan["applied"] = True
     return plan
 
 
+def sync_many(
+    system_names: list[str],
+    apply: bool = False,
+    init_claude_md: bool = False,
+) -> dict:
+    """Sync several systems in one process with shared state.
+
+    Each system gets its own user-global deploy, CLAUDE.md and log entry
+    exactly as ``sync`` would produce. The per-repo runtime mirror, which
+    is per *machine* rather than per system, runs once over the union of
+    the owned systems' subscriptions — separate runs would otherwise
+    undo each other's mirrors whenever subscriptions differ. The registry
+    is saved once at the end.
+
+    Returns ``{"systems": {name: plan}, "runtime_repos", "errors",
+    "applied", "target_walks"}``. A system that fails (guest-mode guard,
+    bad ``deploy_strategy``, an I/O error) is reported in ``errors`` and
+    skipped; the rest still run. With ``apply`` the registry is saved
+    even if something later raises.
+    """
+    context = SyncContext()
+    unknown = [n for n in system_names if n not in context.systems]
+    if unknown:
+        raise ValueError(f"unknown system(s): {', '.join(map(repr, unknown))}")
+
+    plans: dict[str, dict] = {}
+    errors: list[str] = []
+    owned: list[str] = []
+    runtime_results: dict[str, dict] = {}
+    try:
+        for name in system_names:
+            try:
+                plans[name] = sync(
+                    name,
+                    apply=apply,
+                    init_claude_md=init_claude_md,
+                    context=context,
+                    runtime=False,
+                    diff=False,
+                )
+            except (PermissionError, ValueError, OSError) as exc:
+                errors.append(f"{name}: {exc}")
+                continue
+            if plans[name]["mode"] != "guest":
+                owned.append(name)
+
+        registry_skills = context.registry.get("skills", {}) or {}
+        subscribed: dict = {}
+        strategies: set[str] = set()
+        for name in owned:
+            sys_info = context.systems[name]
+            subscribed.update(_filter_subscribed(registry_skills, sys_info))
+            strategies.add(validate_strategy(sys_info.get("deploy_strategy")))
+        strategy = strategies.pop() if len(strategies) == 1 else DEFAULT_STRATEGY
+
+        if owned:
+            repo_index = context.repo_index()
+            if apply:
+                runtime_results = _mirror_to_runtime_dirs(
+                    subscribed, registry_skills, repo_index, {}, context.snapshot, strategy
+                )
+            else:
+                runtime_results = _plan_runtime_targets(
+                    subscribed, registry_skills, repo_index, context.snapshot
+                )
+            for repo_name, stats in runtime_results.items():
+                for err in stats.get("errors") or []:
+                    errors.append(f"runtime[{repo_name}]: {err}")
+
+        if apply and owned:
+            _append_deployment_log({
+                "ts": _now_iso(),
+                "system": None,
+                "systems": owned,
+                "action": "sync-runtime",
+                "runtime_repos": {
+                    name: {
+                        "add": stats.get("add") or [],
+                        "update": stats.get("update") or [],
+                        "remove": stats.get("remove") or [],
+                    }
+                    for name, stats in runtime_results.items()
+                },
+                "errors": errors,
+            })
+    finally:
+        # Systems already applied wrote files and log entries; their
+        # last_deploy state must reach disk even if a later step raised.
+        if apply:
+            save_registry(context.registry)
+
+    return {
+        "systems": plans,
+        "runtime_repos": runtime_results,
+        "errors": errors,
+        "applied": apply,
+        "target_walks": context.snapshot.walks,
+    }
+
+
 # Compatibility shim: cli.py originally referenced sync_system / diff_system.
 def sync_system(system_name: str, *, dry_run: bool = False, apply: bool = False) -> dict:
     """Back-compat entry point used by older callers."""
@@ -3,7 +3,7 @@
 import json
 from pathlib import Path
 
-import yaml
+from claude_skills import yaml_loader
 
 _STATE_DIR = Path(__file__).resolve().parent.parent / "state"
 _SYSTEMS_YAML = _STATE_DIR / "systems.yaml"
@@ -36,7 +36,7 @@ def load_systems() -> dict:
         return {}
 
     with open(_SYSTEMS_YAML) as f:
-        systems_data = yaml.safe_load(f) or {}
+        systems_data = yaml_loader.safe_load(f) or {}
 
     systems = systems_data.get("systems", {})
 
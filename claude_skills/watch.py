@@ -0,0 +1,421 @@
+"""``claude-skills watch`` — keep the registry and runtime dirs hot.
+
+Replaces the ``inventory --apply && sync <me> --apply`` loop people ran by
+hand or from cron. The daemon watches every skill source dir that
+``inventory`` would walk (``agent-io/skills/`` plus the legacy
+``.claude/commands/`` and ``commands/`` dirs of every home repo), and when
+a skill unit changes it:
+
+  1. waits for the burst of events to settle (``debounce`` seconds with
+     no new events — editors and ``git checkout`` write several files);
+  2. re-hashes only the affected unit(s) with ``compute_manifest_hash``;
+  3. if the hash moved, writes the new ``manifest_hash`` to the registry
+     and runs ``sync(<system>, apply=True, skill=<key>)``, which pushes
+     that one unit to the user-global target and every runtime mirror.
+
+Only ``manifest_hash`` is refreshed. Changes that affect registration
+itself (a new skill, a deleted anchor, a scope or ``deploys_to_repos``
+edit) are reported with a pointer to ``claude-skills inventory --apply``.
+
+Backends:
+  - ``inotify`` (Linux, via ctypes — no extra dependency). Watches are
+    added recursively and extended as sibling context dirs appear. If
+    the kernel queue overflows (``IN_Q_OVERFLOW``), events were lost:
+    the daemon re-adds every watch and re-checks every unit.
+  - ``poll`` (everywhere else, or ``--poll``): a stat-only snapshot of
+    every watched tree, diffed every ``poll_interval`` seconds.
+
+Every ``rescan_interval`` seconds (and after an overflow) the source
+dirs are re-discovered, so skill dirs and home repos created after
+start are watched too; their units are checked when they appear.
+
+Runtime mirrors can live in a legacy ``.claude/commands/`` dir that is
+also watched; events there are ignored unless the registry's
+``home_path`` points at that exact anchor, so the daemon never reacts to
+its own writes.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+from claude_skills.inventory import _candidate_skill_dirs, _get_home_repos
+from claude_skills.manifest import compute_manifest_hash, list_skill_units
+from claude_skills.registry import load_registry, save_registry
+
+# inotify(7) constants.
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+    | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class PollingWatcher:
+    """Stat-snapshot watcher. Portable fallback for the inotify backend."""
+
+    name = "poll"
+    # A stat snapshot never loses changes; kept for the watcher interface.
+    overflowed = False
+
+    def __init__(self, roots: list[Path], interval: float = 0.5):
+        self.roots = list(roots)
+        self.interval = interval
+        self._state = self._snapshot(self.roots)
+
+    def add_root(self, root: Path) -> None:
+        """Start watching ``root``; its current contents are the baseline."""
+        if root not in self.roots:
+            self.roots.append(root)
+            self._state.update(self._snapshot([root]))
+
+    @staticmethod
+    def _snapshot(roots: list[Path]) -> dict[str, tuple[int, int]]:
+        state: dict[str, tuple[int, int]] = {}
+        for root in roots:
+            for dirpath, dirnames, filenames in os.walk(root):
+                for name in dirnames + filenames:
+                    path = os.path.join(dirpath, name)
+                    try:
+                        st = os.stat(path, follow_symlinks=False)
+                    except OSError:
+                        continue
+                    state[path] = (st.st_size, st.st_mtime_ns)
+        return state
+
+    def wait(self, timeout: float | None) -> list[Path]:
+        """Block up to ``timeout`` seconds; return paths that changed."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            step = self.interval
+            if deadline is not None:
+                step = max(0.0, min(step, deadline - time.monotonic()))
+            time.sleep(step)
+            current = self._snapshot(self.roots)
+            changed = [
+                Path(p)
+                for p in set(current) | set(self._state)
+                if current.get(p) != self._state.get(p)
+            ]
+            self._state = current
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return sorted(changed)
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Recursive inotify watcher (Linux only).
+
+    ``overflowed`` is set when the kernel dropped events; the caller
+    rescans and resets it.
+    """
+
+    name = "inotify"
+
+    def __init__(self, roots: list[Path]):
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1 failed: {os.strerror(err)}")
+        self._wd_to_dir: dict[int, Path] = {}
+        self.overflowed = False
+        for root in roots:
+            self._add_tree(root)
+
+    def add_root(self, root: Path) -> None:
+        """Watch ``root`` recursively (re-adding an existing watch is a no-op)."""
+        self._add_tree(root)
+
+    def _add_watch(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(str(directory)), _WATCH_MASK
+        )
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_add_watch({directory}) failed: {os.strerror(err)}")
+        self._wd_to_dir[wd] = directory
+
+    def _add_tree(self, root: Path) -> None:
+        self._add_watch(root)
+        for dirpath, dirnames, _ in os.walk(root):
+            for name in dirnames:
+                try:
+                    self._add_watch(Path(dirpath) / name)
+                except OSError:
+                    continue
+
+    def wait(self, timeout: float | None) -> list[Path]:
+        """Block up to ``timeout`` seconds; return paths that changed."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            buf = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        changed: list[Path] = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buf):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+            offset += _EVENT_HEADER.size
+            raw_name = buf[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if mask & _IN_Q_OVERFLOW:
+                self.overflowed = True
+                continue
+            if mask & _IN_IGNORED:
+                # Watch removed (dir deleted or unmounted); a rescan re-adds it.
+                self._wd_to_dir.pop(wd, None)
+                continue
+            directory = self._wd_to_dir.get(wd)
+            if directory is None:
+                continue
+            path = directory / os.fsdecode(raw_name) if raw_name else directory
+            if mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO):
+                # New sibling context dir (or a dir moved in): watch it too.
+                try:
+                    self._add_tree(path)
+                except OSError:
+                    pass
+            changed.append(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def _watch_roots() -> list[tuple[Path, str]]:
+    """Return every (skills_dir, repo_name) that inventory would walk."""
+    roots: list[tuple[Path, str]] = []
+    for repo_name, repo_root, _scope in _get_home_repos():
+        for skills_dir, _kind in _candidate_skill_dirs(repo_root, repo_name):
+            roots.append((skills_dir, repo_name))
+    return roots
+
+
+def _unit_for_path(path: Path, roots: list[tuple[Path, str]]) -> Path | None:
+    """Map a changed path to the anchor .md of the skill unit it belongs to."""
+    for skills_dir, _repo_name in roots:
+        try:
+            rel = path.relative_to(skills_dir)
+        except ValueError:
+            continue
+        parts = rel.parts
+        if not parts:
+            return None
+        head = parts[0]
+        if head.startswith(".") or head.startswith("_") or head == "README.md":
+            return None
+        if any(p.startswith(".") or p == "__pycache__" for p in parts):
+            return None
+        if len(parts) == 1:
+            if not head.endswith(".md"):
+                return None
+            return skills_dir / head
+        # Anything under a sibling context dir belongs to <dir>.md.
+        return skills_dir / f"{head}.md"
+    return None
+
+
+def _collect(paths: list[Path], roots: list[tuple[Path, str]], pending: set[Path]) -> None:
+    for path in paths:
+        unit = _unit_for_path(path, roots)
+        if unit is not None:
+            pending.add(unit)
+
+
+def _rescan(
+    watcher, roots: list[tuple[Path, str]], pending: set[Path], *, full: bool
+) -> list[tuple[Path, str]]:
+    """Re-discover source dirs and queue units whose events may be missing.
+
+    Dirs that appeared since the last scan (a new ``agent-io/skills/``, a
+    new home repo) are watched and all their units queued. ``full``
+    (after the event queue overflowed) re-adds every watch and queues
+    every unit. Returns the new roots.
+    """
+    watcher.overflowed = False
+    known = {skills_dir for skills_dir, _ in roots}
+    out: list[tuple[Path, str]] = []
+    for skills_dir, repo_name in _watch_roots():
+        is_new = skills_dir not in known
+        if is_new or full:
+            try:
+                watcher.add_root(skills_dir)
+            except OSError:
+                if is_new:
+                    continue
+            if is_new:
+                print(f"  watch: now watching {repo_name}: {skills_dir}")
+            pending.update(list_skill_units(skills_dir))
+        out.append((skills_dir, repo_name))
+    return out
+
+
+def make_watcher(roots: list[Path], backend: str = "auto", poll_interval: float = 0.5):
+    """Return an inotify watcher when possible, else a polling watcher."""
+    if backend in ("auto", "inotify") and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(roots)
+        except (OSError, AttributeError) as exc:
+            if backend == "inotify":
+                raise
+            print(f"  watch: inotify unavailable ({exc}); polling instead.", file=sys.stderr)
+    elif backend == "inotify":
+        raise OSError("inotify backend is only available on Linux")
+    return PollingWatcher(roots, interval=poll_interval)
+
+
+def refresh_units(system_name: str, anchors: list[Path], *, apply: bool = True) -> list[str]:
+    """Re-hash the given units and push changed ones through ``sync``.
+
+    Returns human-readable report lines (one or more per anchor).
+    """
+    from claude_skills import sync as sync_mod
+
+    lines: list[str] = []
+    registry = load_registry()
+    skills = registry.get("skills", {}) or {}
+    to_push: list[str] = []
+    dirty = False
+
+    for anchor in anchors:
+        key = anchor.stem
+        entry = skills.get(key)
+        if entry is None:
+            if anchor.is_file():
+                lines.append(
+                    f"  ? {key}: new skill at {anchor} — run "
+                    "`claude-skills inventory --apply` to register it."
+                )
+            continue
+        if Path(entry.get("home_path") or "") != anchor:
+            # A runtime mirror or a shadowed legacy copy, not the source.
+            continue
+        if not anchor.is_file():
+            lines.append(
+                f"  ! {key}: source {anchor} disappeared — run "
+                "`claude-skills inventory --apply` (or `retire`)."
+            )
+            continue
+        new_hash = compute_manifest_hash(anchor, store=apply)
+        if new_hash == entry.get("manifest_hash"):
+            continue
+        lines.append(
+            f"  ~ {key}: {(entry.get('manifest_hash') or '')[:8]} -> {new_hash[:8]}"
+        )
+        entry["manifest_hash"] = new_hash
+        dirty = True
+        to_push.append(key)
+
+    if not apply:
+        return lines
+    if dirty:
+        save_registry(registry)
+    for key in to_push:
+        try:
+            plan = sync_mod.sync(system_name, apply=True, skill=key)
+        except (ValueError, PermissionError) as exc:
+            lines.append(f"    ! sync failed for {key}: {exc}")
+            continue
+        runtime = plan.get("runtime_repos") or {}
+        touched = [
+            name for name, stats in runtime.items()
+            if stats.get("add") or stats.get("update") or stats.get("remove")
+        ]
+        lines.append(
+            f"    synced {key} -> {system_name}"
+            + (f" + runtime[{', '.join(sorted(touched))}]" if touched else "")
+        )
+        for err in plan.get("errors") or []:
+            lines.append(f"    ! {err}")
+    return lines
+
+
+def watch(
+    system_name: str,
+    *,
+    backend: str = "auto",
+    debounce: float = 0.3,
+    poll_interval: float = 0.5,
+    apply: bool = True,
+    max_batches: int | None = None,
+    rescan_interval: float = 30.0,
+) -> int:
+    """Run the watch loop until interrupted. Returns an exit code.
+
+    ``max_batches`` stops after that many processed batches (used for
+    scripted checks); ``None`` runs forever. ``rescan_interval`` is how
+    often source dirs are re-discovered.
+    """
+    roots = _watch_roots()
+    if not roots:
+        print("  watch: no skill source dirs found.", file=sys.stderr)
+        return 1
+    watcher = make_watcher([r for r, _ in roots], backend, poll_interval)
+    print(
+        f"  watch: {len(roots)} dir(s) via {watcher.name}, system={system_name}, "
+        f"debounce={debounce}s{'' if apply else ' (dry run)'}"
+    )
+    for skills_dir, repo_name in roots:
+        print(f"    {repo_name}: {skills_dir}")
+    sys.stdout.flush()
+
+    batches = 0
+    next_rescan = time.monotonic() + rescan_interval
+    try:
+        while max_batches is None or batches < max_batches:
+            pending: set[Path] = set()
+            _collect(watcher.wait(max(0.0, next_rescan - time.monotonic())), roots, pending)
+            if watcher.overflowed or time.monotonic() >= next_rescan:
+                roots = _rescan(watcher, roots, pending, full=watcher.overflowed)
+                next_rescan = time.monotonic() + rescan_interval
+            if not pending:
+                continue
+            # Debounce: keep absorbing events until the burst goes quiet.
+            while True:
+                more = watcher.wait(debounce)
+                _collect(more, roots, pending)
+                if watcher.overflowed:
+                    roots = _rescan(watcher, roots, pending, full=True)
+                elif not more:
+                    break
+            started = time.monotonic()
+            lines = refresh_units(system_name, sorted(pending), apply=apply)
+            if lines:
+                stamp = time.strftime("%H:%M:%S")
+                print(f"[{stamp}] {len(pending)} unit(s) changed "
+                      f"({(time.monotonic() - started) * 1000:.0f} ms)")
+                for line in lines:
+                    print(line)
+                sys.stdout.flush()
+            batches += 1
+    except KeyboardInterrupt:
+        print("\n  watch: stopped.")
+    finally:
+        watcher.close()
+    return 0
@@ -0,0 +1,45 @@
+"""Bounded worker pool helpers shared by the discovery and deploy loops.
+
+Skill discovery and per-repo deploys are dominated by filesystem and
+subprocess latency (Dropbox-backed trees, cold caches, ``git`` forks), not
+CPU, so a small thread pool is enough to overlap the waits. Every helper
+here returns results in input order so callers stay deterministic and
+produce byte-identical output regardless of ``jobs``.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Upper bound for ``--jobs 0`` (auto). More threads than this only adds
+# contention on the same disk / Dropbox daemon.
+_AUTO_JOBS_CAP = 16
+
+
+def resolve_jobs(jobs: int | None) -> int:
+    """Normalize a ``--jobs`` value: None/1 -> serial, 0 -> auto, N -> N."""
+    if jobs is None:
+        return 1
+    if jobs <= 0:
+        return min(_AUTO_JOBS_CAP, (os.cpu_count() or 1) * 2)
+    return jobs
+
+
+def map_ordered(fn: Callable[[T], R], items: Iterable[T], jobs: int | None = 1) -> list[R]:
+    """Apply ``fn`` to every item, returning results in input order.
+
+    ``jobs <= 1`` (after ``resolve_jobs``) runs inline with no pool, which
+    keeps tracebacks simple and is the reference behavior the parallel
+    path must match. Exceptions from ``fn`` propagate to the caller.
+    """
+    items = list(items)
+    workers = min(resolve_jobs(jobs), len(items))
+    if workers <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="claude-skills") as pool:
+        return list(pool.map(fn, items))
@@ -0,0 +1,39 @@
+"""Shared YAML loading: the libyaml C loader when available.
+
+``yaml.safe_load`` always uses PyYAML's pure-Python ``SafeLoader``, even
+when PyYAML was built against libyaml. Every skill's frontmatter and the
+systems / project registries go through ``safe_load`` here instead,
+which uses ``yaml.CSafeLoader`` when the binding exists and falls back to
+``SafeLoader`` otherwise. Both construct the same safe types.
+
+``CLAUDE_SKILLS_YAML_LOADER=python`` forces the pure-Python loader
+(read per call, so benchmarks can compare both in one process).
+``loader_name()`` reports which one is in effect.
+"""
+
+from __future__ import annotations
+
+import os
+
+import yaml
+
+YAMLError = yaml.YAMLError
+
+_LOADER_ENV = "CLAUDE_SKILLS_YAML_LOADER"
+_C_LOADER = getattr(yaml, "CSafeLoader", None)
+
+
+def _loader() -> type:
+    if _C_LOADER is not None and os.environ.get(_LOADER_ENV, "") != "python":
+        return _C_LOADER
+    return yaml.SafeLoader
+
+
+def loader_name() -> str:
+    """Name of the loader ``safe_load`` uses (``CSafeLoader`` / ``SafeLoader``)."""
+    return _loader().__name__
+
+
+def safe_load(stream):
+    """Drop-in for ``yaml.safe_load`` using the fastest safe loader."""
+    return yaml.load(stream, Loader=_loader())
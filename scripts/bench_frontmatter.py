@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Benchmark frontmatter parsing over synthetic skill files.
+
+Writes N skill anchors (frontmatter with the usual keys plus a markdown
+body) into a temp dir and times ``frontmatter.parse_frontmatter`` over
+all of them with each YAML loader:
+
+  SafeLoader    PyYAML's pure-Python loader (``yaml.safe_load``)
+  CSafeLoader   the libyaml binding, used by ``yaml_loader`` when present
+
+Then writes a smaller set of large skills (``--large-kb`` of body each)
+and compares the two readers as inventory uses them (frontmatter plus
+the first heading):
+
+  parse_frontmatter   whole file read, split and re-joined into a body
+  read_frontmatter    header only; first heading read on demand
+
+Every pass must produce identical results; the script exits non-zero
+otherwise.
+
+Usage::
+
+    PYTHONPATH=. python scripts/bench_frontmatter.py
+    PYTHONPATH=. python scripts/bench_frontmatter.py --files 5000 --repeat 5
+    PYTHONPATH=. python scripts/bench_frontmatter.py --large-files 500 --large-kb 1024
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(_HERE.parent))
+
+from claude_skills import yaml_loader  # noqa: E402
+from claude_skills.frontmatter import (  # noqa: E402
+    extract_first_heading,
+    parse_frontmatter,
+    read_frontmatter,
+)
+
+_SKILL_TEMPLATE = """---
+name: bench-skill-{i:05d}
+description: Synthetic skill {i} used to benchmark frontmatter parsing.
+scope: {scope}
+domain: {domain}
+deploys_to_repos:
+  - RepoA
+  - RepoB
+tags: [bench, synthetic, "n{i}"]
+allowed-tools: Bash(git status:*), Read, Edit
+---
+
+# Bench skill {i}
+
+{body}
+"""
+
+
+def write_skills(root: Path, n: int, steps: int = 40) -> list[Path]:
+    paths = []
+    body = "\n".join(f"- step {k}: do the thing carefully." for k in range(steps))
+    for i in range(n):
+        p = root / f"bench-skill-{i:05d}.md"
+        p.write_text(
+            _SKILL_TEMPLATE.format(
+                i=i,
+                scope=("universal", "platform", "domain")[i % 3],
+                domain=f"project-{i % 17}",
+                body=body,
+            ),
+            encoding="utf-8",
+        )
+        paths.append(p)
+    return paths
+
+
+def run(paths: list[Path], loader: str, repeat: int) -> tuple[float, list]:
+    os.environ["CLAUDE_SKILLS_YAML_LOADER"] = loader
+    best = float("inf")
+    results: list = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [parse_frontmatter(p) for p in paths]
+        best = min(best, time.perf_counter() - start)
+    return best, results
+
+
+def _full_reader(path: Path) -> tuple[dict, str | None]:
+    fm, body = parse_frontmatter(path)
+    return fm, extract_first_heading(body)
+
+
+def _header_reader(path: Path) -> tuple[dict, str | None]:
+    header = read_frontmatter(path)
+    return header.fm, header.first_heading()
+
+
+def run_readers(paths: list[Path], repeat: int) -> dict[str, float]:
+    timings: dict[str, float] = {}
+    baseline = None
+    for label, reader in (
+        ("parse_frontmatter", _full_reader),
+        ("read_frontmatter", _header_reader),
+    ):
+        best = float("inf")
+        results: list = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            results = [reader(p) for p in paths]
+            best = min(best, time.perf_counter() - start)
+        if baseline is None:
+            baseline = results
+        elif results != baseline:
+            raise SystemExit(f"{label} results differ from parse_frontmatter")
+        timings[label] = best
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=3000, help="Synthetic skill files")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per loader (best is kept)")
+    parser.add_argument("--large-files", type=int, default=200, help="Large skill files")
+    parser.add_argument("--large-kb", type=int, default=512, help="Body size of each large file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench-frontmatter-") as tmp:
+        paths = write_skills(Path(tmp), args.files)
+        passes = [("python", "SafeLoader")]
+        if getattr(yaml_loader.yaml, "CSafeLoader", None) is not None:
+            passes.append(("", "CSafeLoader"))
+        else:
+            print("  (libyaml binding not available; CSafeLoader pass skipped)")
+
+        print(f"  {args.files} files, best of {args.repeat}\n")
+        print(f"  {'loader':<12} {'total':>9}  {'per file':>9}")
+        timings: dict[str, float] = {}
+        baseline = None
+        for env_value, label in passes:
+            seconds, results = run(paths, env_value, args.repeat)
+            if yaml_loader.loader_name() != label:
+                raise SystemExit(f"expected {label}, got {yaml_loader.loader_name()}")
+            if baseline is None:
+                baseline = results
+            elif results != baseline:
+                raise SystemExit(f"{label} results differ from SafeLoader")
+            timings[label] = seconds
+            print(
+                f"  {label:<12} {seconds * 1000:>7.1f}ms  "
+                f"{seconds / args.files * 1e6:>7.1f}us"
+            )
+        if len(timings) == 2:
+            print(f"\n  speedup: {timings['SafeLoader'] / timings['CSafeLoader']:.1f}x")
+
+    with tempfile.TemporaryDirectory(prefix="bench-frontmatter-large-") as tmp:
+        # Each step line is ~36 bytes.
+        steps = max(1, args.large_kb * 1024 // 36)
+        paths = write_skills(Path(tmp), args.large_files, steps=steps)
+        os.environ.pop("CLAUDE_SKILLS_YAML_LOADER", None)
+        print(
+            f"\n  {args.large_files} files with ~{args.large_kb} KiB bodies, "
+            f"best of {args.repeat}\n"
+        )
+        print(f"  {'reader':<18} {'total':>9}  {'per file':>9}")
+        timings = run_readers(paths, args.repeat)
+        for label, seconds in timings.items():
+            print(
+                f"  {label:<18} {seconds * 1000:>7.1f}ms  "
+                f"{seconds / args.large_files * 1e6:>7.1f}us"
+            )
+        print(
+            f"\n  speedup: "
+            f"{timings['parse_frontmatter'] / timings['read_frontmatter']:.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Benchmark ``sync-repos --commit`` staging: per-file git vs one batch.
+
+Builds a throwaway git repo with a skill unit of N files under
+``.claude/commands/`` and times staging them two ways:
+
+  per-file   ``git add -- <p>`` once per file (the old code path)
+  batched    ``repo_sync._git_batch`` — one ``git add`` fed NUL-separated
+             paths on stdin
+
+then the same for ``git rm --cached`` after unlinking the files. Each
+measurement starts from a fresh index so both sides do the same work.
+
+Usage::
+
+    PYTHONPATH=. python scripts/bench_git_staging.py
+    PYTHONPATH=. python scripts/bench_git_staging.py --files 50 200 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(_HERE.parent))
+
+from claude_skills.repo_sync import _git_batch, _git_run  # noqa: E402
+
+
+def make_repo(root: Path, n_files: int) -> list[Path]:
+    subprocess.run(["git", "init", "-q", str(root)], check=True)
+    _git_run(root, ["config", "user.email", "bench@example.invalid"])
+    _git_run(root, ["config", "user.name", "bench"])
+    (root / "README").write_text("bench\n")
+    _git_run(root, ["add", "README"])
+    _git_run(root, ["commit", "-q", "-m", "init"])
+    unit = root / ".claude" / "commands" / "big-skill"
+    paths = [root / ".claude" / "commands" / "big-skill.md"]
+    paths[0].parent.mkdir(parents=True)
+    paths[0].write_text("---\nname: big-skill\n---\n")
+    for i in range(n_files - 1):
+        p = unit / f"part{i // 50:02d}" / f"note {i:04d}.md"
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(f"context file {i}\n")
+        paths.append(p)
+    return paths
+
+
+def reset_index(root: Path) -> None:
+    _git_run(root, ["read-tree", "HEAD"])
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def bench(n_files: int) -> dict[str, float]:
+    with tempfile.TemporaryDirectory(prefix="bench-git-staging-") as tmp:
+        root = Path(tmp)
+        paths = make_repo(root, n_files)
+        results: dict[str, float] = {}
+
+        reset_index(root)
+        results["add per-file"] = timed(
+            lambda: [_git_run(root, ["add", "--", str(p)]) for p in paths]
+        )
+        reset_index(root)
+        results["add batched"] = timed(lambda: _git_batch(root, ["add"], paths))
+
+        _git_run(root, ["commit", "-q", "-m", "unit"])
+        for p in paths:
+            p.unlink()
+        rm_args = ["rm", "--cached", "--ignore-unmatch", "--quiet"]
+        results["rm per-file"] = timed(
+            lambda: [
+                _git_run(root, [*rm_args, "--", str(p.relative_to(root))], check=False)
+                for p in paths
+            ]
+        )
+        reset_index(root)
+        results["rm batched"] = timed(
+            lambda: _git_batch(root, rm_args, paths, check=False)
+        )
+        staged = _git_run(root, ["diff", "--cached", "--name-only"]).stdout.split("\n")
+        if len([s for s in staged if s]) != n_files:
+            raise SystemExit(f"batched rm staged {len(staged)} paths, expected {n_files}")
+        return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--files", type=int, nargs="+", default=[10, 100, 500],
+        help="Unit sizes (number of files) to benchmark.",
+    )
+    args = parser.parse_args()
+
+    print(f"{'files':>6}  {'op':<13} {'total':>9}  {'per file':>10}")
+    for n in args.files:
+        for op, seconds in bench(n).items():
+            print(f"{n:>6}  {op:<13} {seconds * 1000:>7.1f}ms  {seconds / n * 1e6:>8.0f}us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,20 @@
+"""Shared fixtures: point every state file at a per-test temp dir."""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture
+def state_dir(tmp_path, monkeypatch):
+    """Isolate the registry, deployment log, object store and caches."""
+    state = tmp_path / "state"
+    state.mkdir()
+    monkeypatch.setenv("CLAUDE_SKILLS_REGISTRY_PATH", str(state / "skill_registry.json"))
+    monkeypatch.setenv("CLAUDE_SKILLS_DEPLOYMENT_LOG_PATH", str(state / "deployment_log.jsonl"))
+    monkeypatch.setenv("CLAUDE_SKILLS_OBJECT_STORE", str(state / "objects"))
+    monkeypatch.setenv("CLAUDE_SKILLS_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("CLAUDE_SKILLS_REGISTRY_JOURNAL", raising=False)
+    monkeypatch.delenv("CLAUDE_SKILLS_REGISTRY_JOURNAL_BYTES", raising=False)
+    monkeypatch.delenv("CLAUDE_SKILLS_LOG_SEGMENT_BYTES", raising=False)
+    return state
@@ -0,0 +1,88 @@
+"""Segmented deployment log: rotation, index catch-up, compaction."""
+
+from __future__ import annotations
+
+import pytest
+
+from claude_skills import deploy_log
+
+
+@pytest.fixture
+def log(state_dir, monkeypatch):
+    # Small segments so a handful of records rotate several times.
+    monkeypatch.setenv("CLAUDE_SKILLS_LOG_SEGMENT_BYTES", "400")
+    return state_dir / "deployment_log.jsonl"
+
+
+def _entry(i: int, system: str = "m1", skill: str | None = None) -> dict:
+    return {
+        "ts": f"2026-01-{i + 1:02d}T00:00:00Z",
+        "system": system,
+        "action": "sync",
+        "added": [skill or f"skill{i}"],
+        "updated": [],
+        "removed": [],
+        "hash_at_deploy": {skill or f"skill{i}": f"{i:064x}"},
+    }
+
+
+def _fill(n: int) -> list[dict]:
+    entries = [_entry(i, system="m1" if i % 2 else "m2") for i in range(n)]
+    for entry in entries:
+        deploy_log.append(entry)
+    return entries
+
+
+def test_append_rotates_and_query_returns_everything(log):
+    entries = _fill(12)
+    assert len(deploy_log.segments(log)) > 2
+    assert deploy_log.query() == entries
+
+
+def test_query_filters_by_system_skill_and_since(log):
+    entries = _fill(12)
+    assert deploy_log.query(system="m1") == [e for e in entries if e["system"] == "m1"]
+    assert deploy_log.query(skill="skill3") == [entries[3]]
+    since = entries[9]["ts"]
+    assert deploy_log.query(since=since) == entries[9:]
+
+
+def test_index_catches_up_after_later_appends(log):
+    entries = _fill(5)
+    assert deploy_log.query() == entries
+    more = [_entry(i) for i in range(5, 9)]
+    for entry in more:
+        deploy_log.append(entry)
+    assert deploy_log.query() == entries + more
+
+
+def test_index_lookups_after_compaction(log):
+    entries = _fill(16)
+    deploy_log.query()  # build the index before compacting
+    result = deploy_log.compact(keep=1, apply=True)
+    assert result["segments"]
+    names = [p.name for p in deploy_log.segments(log)]
+    assert sum(n.endswith(".gz") for n in names) == len(result["segments"])
+
+    assert deploy_log.query() == entries
+    assert deploy_log.query(skill="skill2") == [entries[2]]
+    assert deploy_log.query(system="m2", since=entries[4]["ts"]) == [
+        e for e in entries[4:] if e["system"] == "m2"
+    ]
+
+
+def test_deleted_or_stale_index_is_rebuilt(log):
+    entries = _fill(8)
+    deploy_log.query()
+    deploy_log._index_path(log).write_text("not json")
+    assert deploy_log.query() == entries
+    deploy_log._index_path(log).unlink()
+    assert deploy_log.query(skill="skill7") == [entries[7]]
+
+
+def test_compact_dry_run_changes_nothing(log):
+    _fill(16)
+    before = [p.name for p in deploy_log.segments(log)]
+    result = deploy_log.compact(keep=1, apply=False)
+    assert result["segments"]
+    assert [p.name for p in deploy_log.segments(log)] == before
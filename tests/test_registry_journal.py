@@ -0,0 +1,105 @@
+"""Registry write-ahead journal: replay after crashes, checkpointing."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from claude_skills import registry, registry_journal
+from claude_skills.registry import checkpoint_registry, load_registry, save_registry
+
+
+@pytest.fixture
+def journaled(state_dir, monkeypatch):
+    monkeypatch.setenv("CLAUDE_SKILLS_REGISTRY_JOURNAL", "1")
+    registry._journal_base.clear()
+    yield state_dir / "skill_registry.json"
+    registry._journal_base.clear()
+
+
+def _restart() -> None:
+    """Forget in-process state, as a fresh process would."""
+    registry._journal_base.clear()
+
+
+def test_save_appends_delta_without_rewriting_checkpoint(journaled):
+    doc = load_registry()
+    doc["skills"]["foo"] = {"home_path": "/src/foo.md", "manifest_hash": "aaa"}
+    save_registry(doc)
+    assert not journaled.exists()
+
+    doc["skills"]["foo"]["last_deploy"] = {"m1": {"hash": "aaa"}}
+    save_registry(doc)
+    lines = registry_journal.journal_path(journaled).read_text().splitlines()
+    assert len(lines) == 2
+    # The second record is just the new last_deploy, not the whole entry.
+    assert json.loads(lines[1])["ops"] == [
+        ["set", ["skills", "foo", "last_deploy"], {"m1": {"hash": "aaa"}}]
+    ]
+
+
+def test_crash_between_append_and_checkpoint_replays(journaled):
+    doc = load_registry()
+    doc["skills"]["foo"] = {"home_path": "/src/foo.md", "manifest_hash": "aaa"}
+    save_registry(doc)
+    save_registry(doc | {"written_at": "t1"})
+    _restart()
+
+    loaded = load_registry()
+    assert loaded["skills"]["foo"]["manifest_hash"] == "aaa"
+    assert loaded["written_at"] == "t1"
+
+
+def test_crash_between_checkpoint_and_discard_is_harmless(journaled):
+    doc = load_registry()
+    doc["skills"]["foo"] = {"home_path": "/src/foo.md", "manifest_hash": "aaa"}
+    save_registry(doc)
+    del doc["skills"]["foo"]
+    doc["skills"]["bar"] = {"home_path": "/src/bar.md"}
+    save_registry(doc)
+    # The checkpoint landed but the journal was never removed.
+    journaled.write_text(json.dumps(doc))
+    _restart()
+
+    assert load_registry() == doc
+
+
+def test_torn_final_line_is_ignored_and_next_append_starts_fresh(journaled):
+    doc = load_registry()
+    doc["skills"]["foo"] = {"home_path": "/src/foo.md"}
+    save_registry(doc)
+    jpath = registry_journal.journal_path(journaled)
+    with open(jpath, "a") as f:
+        f.write('{"ts": "x", "ops": [["set", ["skills", "ghost"')
+    _restart()
+
+    loaded = load_registry()
+    assert list(loaded["skills"]) == ["foo"]
+    loaded["skills"]["bar"] = {"home_path": "/src/bar.md"}
+    save_registry(loaded)
+    _restart()
+    assert list(load_registry()["skills"]) == ["foo", "bar"]
+
+
+def test_checkpoint_folds_journal_into_json(journaled):
+    doc = load_registry()
+    doc["skills"]["foo"] = {"home_path": "/src/foo.md"}
+    save_registry(doc)
+    save_registry(doc | {"written_at": "t1"})
+
+    assert checkpoint_registry() == 2
+    assert not registry_journal.journal_path(journaled).exists()
+    with open(journaled) as f:
+        assert json.load(f) == doc | {"written_at": "t1"}
+
+
+def test_save_with_journaling_off_checkpoints(journaled, monkeypatch):
+    doc = load_registry()
+    doc["skills"]["foo"] = {"home_path": "/src/foo.md"}
+    save_registry(doc)
+    monkeypatch.delenv("CLAUDE_SKILLS_REGISTRY_JOURNAL")
+    save_registry(doc)
+    assert not registry_journal.journal_path(journaled).exists()
+    with open(journaled) as f:
+        assert json.load(f) == doc
@@ -0,0 +1,106 @@
+"""SQLite registry backend: round trip, delta saves, lazy creation."""
+
+from __future__ import annotations
+
+import sqlite3
+
+from claude_skills import registry_sqlite
+from claude_skills.registry import load_registry, save_registry
+
+
+def _doc() -> dict:
+    return {
+        "version": 1,
+        "skills": {
+            "foo": {
+                "home_path": "/src/foo.md",
+                "manifest_hash": "aaa",
+                "last_deploy": {"m1": {"hash": "aaa", "ts": "t1"}},
+                "last_runtime_deploy": {"RepoA": {"hash": "aaa", "ts": "t1"}},
+            },
+            "bar": {"home_path": "/src/bar.md", "manifest_hash": "bbb"},
+        },
+        "written_by_machine": "m1",
+        "written_at": "t1",
+    }
+
+
+def _trace(monkeypatch) -> list[str]:
+    """Record every SQL statement run on connections opened from now on."""
+    statements: list[str] = []
+    real_connect = registry_sqlite._connect
+
+    def connect(path):
+        conn = real_connect(path)
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    monkeypatch.setattr(registry_sqlite, "_connect", connect)
+    return statements
+
+
+def test_load_missing_path_does_not_create_db(tmp_path):
+    path = tmp_path / "registry.db"
+    doc = load_registry(path)
+    assert doc["skills"] == {}
+    assert not path.exists()
+
+
+def test_round_trip_preserves_document_and_order(tmp_path):
+    path = tmp_path / "registry.db"
+    doc = _doc()
+    save_registry(doc, path)
+    loaded = load_registry(path)
+    assert loaded == doc
+    assert list(loaded) == list(doc)
+    assert list(loaded["skills"]) == ["foo", "bar"]
+    assert list(loaded["skills"]["foo"]) == list(doc["skills"]["foo"])
+
+
+def test_save_writes_only_changed_rows(tmp_path, monkeypatch):
+    path = tmp_path / "registry.db"
+    save_registry(_doc(), path)
+    doc = load_registry(path)
+    doc["skills"]["foo"]["last_deploy"]["m1"]["hash"] = "ccc"
+
+    statements = _trace(monkeypatch)
+    save_registry(doc, path)
+    writes = [s for s in statements if s.startswith(("INSERT", "DELETE", "UPDATE"))]
+    assert not any(s.startswith("SELECT key, data FROM skills") for s in statements)
+    assert [s.split()[2] for s in writes if s.startswith("INSERT")] == ["last_deploy"]
+    assert load_registry(path)["skills"]["foo"]["last_deploy"]["m1"]["hash"] == "ccc"
+
+
+def test_save_deletes_removed_skill_and_its_children(tmp_path):
+    path = tmp_path / "registry.db"
+    save_registry(_doc(), path)
+    doc = load_registry(path)
+    del doc["skills"]["foo"]
+    save_registry(doc, path)
+
+    assert list(load_registry(path)["skills"]) == ["bar"]
+    conn = sqlite3.connect(path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM last_deploy").fetchone()[0] == 0
+        assert conn.execute("SELECT COUNT(*) FROM last_runtime_deploy").fetchone()[0] == 0
+    finally:
+        conn.close()
+
+
+def test_save_after_another_writer_diffs_against_disk(tmp_path):
+    path = tmp_path / "registry.db"
+    save_registry(_doc(), path)
+    ours = load_registry(path)
+
+    # Another process adds a skill; our snapshot is now stale.
+    theirs = load_registry(path)
+    theirs["skills"]["baz"] = {"home_path": "/src/baz.md"}
+    save_registry(theirs, path)
+    registry_sqlite._base[path] = (0,) + registry_sqlite._base[path][1:]
+
+    ours["skills"]["bar"]["manifest_hash"] = "bbb2"
+    save_registry(ours, path)
+    loaded = load_registry(path)
+    assert loaded["skills"]["bar"]["manifest_hash"] == "bbb2"
+    # Our document is authoritative: the stale diff must not keep "baz".
+    assert "baz" not in loaded["skills"]
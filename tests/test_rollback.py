@@ -0,0 +1,124 @@
+"""Rollback plans restore from the store and never touch unregistered files."""
+
+from __future__ import annotations
+
+import shutil
+
+import pytest
+
+from claude_skills import deploy_log, rollback as rollback_mod
+from claude_skills.manifest import compute_manifest_hash
+from claude_skills.object_store import materialize_unit, update_unit
+from claude_skills.registry import load_registry, save_registry
+
+
+def _write(path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def _deploy(home, target, manifest_hash: str, previous: str, action: str) -> None:
+    """Deploy the stored unit the way ``sync --apply`` does, and log it."""
+    if previous:
+        update_unit(home, target, manifest_hash, previous)
+    else:
+        materialize_unit(manifest_hash, target)
+    registry = load_registry()
+    entry = registry["skills"].setdefault("foo", {"home_path": str(home)})
+    entry["manifest_hash"] = manifest_hash
+    entry.setdefault("last_deploy", {})["m1"] = {"hash": manifest_hash, "action": action}
+    save_registry(registry)
+    deploy_log.append({
+        "ts": f"2026-01-0{len(deploy_log.query()) + 1}T00:00:00Z",
+        "system": "m1",
+        "action": "sync",
+        "added": ["foo"] if action == "add" else [],
+        "updated": ["foo"] if action == "update" else [],
+        "removed": [],
+        "hash_at_deploy": {"foo": manifest_hash},
+    })
+
+
+@pytest.fixture
+def deployed(state_dir, tmp_path, monkeypatch):
+    """``foo`` deployed at v1, then updated to v2 (which renames a file)."""
+    home = tmp_path / "home" / "foo.md"
+    target = tmp_path / "target"
+    monkeypatch.setattr(
+        rollback_mod, "load_systems", lambda: {"m1": {"commands_target": str(target)}}
+    )
+
+    _write(home, "v1\n")
+    _write(home.parent / "foo" / "old" / "ref.md", "old ref\n")
+    v1 = compute_manifest_hash(home, store=True)
+    _deploy(home, target, v1, "", "add")
+
+    _write(home, "v2\n")
+    shutil.rmtree(home.parent / "foo" / "old")
+    _write(home.parent / "foo" / "new" / "ref.md", "new ref\n")
+    v2 = compute_manifest_hash(home, store=True)
+    _deploy(home, target, v2, v1, "update")
+    return target, v1, v2
+
+
+def test_rollback_restores_changed_files_and_unlinks_deployed_ones(deployed):
+    target, v1, _v2 = deployed
+    plan = rollback_mod.rollback("m1", "0", apply=True)
+
+    assert plan["errors"] == []
+    [item] = plan["restore"]
+    assert item["hash"] == v1
+    assert item["files"] == ["foo.md", "foo/old/ref.md"]
+    assert item["stale"] == ["foo/new/ref.md"]
+    assert (target / "foo.md").read_text() == "v1\n"
+    assert (target / "foo" / "old" / "ref.md").read_text() == "old ref\n"
+    # The dir its unlink emptied is gone.
+    assert not (target / "foo" / "new").exists()
+    assert load_registry()["skills"]["foo"]["last_deploy"]["m1"]["hash"] == v1
+
+
+def test_rollback_leaves_hand_added_files_and_dirs_alone(deployed):
+    target, _v1, _v2 = deployed
+    _write(target / "foo" / "notes.md", "mine\n")
+    _write(target / "foo" / "new" / "scratch.md", "mine too\n")
+    (target / "foo" / "empty").mkdir()
+
+    plan = rollback_mod.rollback("m1", "0", apply=True)
+
+    [item] = plan["restore"]
+    assert item["stale"] == ["foo/new/ref.md"]
+    assert (target / "foo" / "notes.md").read_text() == "mine\n"
+    assert (target / "foo" / "new" / "scratch.md").read_text() == "mine too\n"
+    assert (target / "foo" / "empty").is_dir()
+    assert not (target / "foo" / "new" / "ref.md").exists()
+
+
+def test_rollback_without_deployed_manifest_unlinks_nothing(deployed):
+    target, _v1, _v2 = deployed
+    registry = load_registry()
+    registry["skills"]["foo"]["last_deploy"]["m1"]["hash"] = "f" * 64
+    save_registry(registry)
+
+    plan = rollback_mod.rollback("m1", "0", apply=True)
+
+    [item] = plan["restore"]
+    assert item["stale"] == []
+    assert plan["kept"] == [["foo", "foo/new/ref.md"]]
+    assert (target / "foo" / "new" / "ref.md").read_text() == "new ref\n"
+    assert (target / "foo.md").read_text() == "v1\n"
+
+
+def test_dry_run_writes_nothing(deployed):
+    target, _v1, v2 = deployed
+    plan = rollback_mod.rollback("m1", "-2", apply=False)
+
+    assert plan["applied"] is False
+    assert [i["skill"] for i in plan["restore"]] == ["foo"]
+    assert (target / "foo.md").read_text() == "v2\n"
+    assert load_registry()["skills"]["foo"]["last_deploy"]["m1"]["hash"] == v2
+
+
+def test_rollback_to_latest_is_a_no_op(deployed):
+    plan = rollback_mod.rollback("m1", "-1", apply=False)
+    assert plan["restore"] == []
+    assert plan["unchanged"] == ["foo"]